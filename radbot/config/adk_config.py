@@ -6,7 +6,8 @@ This module provides functions to create a properly configured GenAI client.
 
 import logging
 import os
-from typing import Optional
+import threading
+from typing import Optional, Tuple
 
 # ADK and GenAI imports
 from google.genai.client import Client
@@ -134,6 +135,38 @@ def create_client_with_config_settings() -> Client:
             raise
 
 
+_shared_client: Optional[Client] = None
+_shared_client_key: Optional[Tuple] = None
+_shared_client_lock = threading.Lock()
+
+
+def _client_settings_key() -> Tuple:
+    """The settings a client is built from, used to detect config changes."""
+    if config.is_using_vertex_ai():
+        return (True, config.get_vertex_project(), config.get_vertex_location())
+    return (False, get_google_api_key())
+
+
+def get_shared_client() -> Client:
+    """
+    Return a process-wide genai Client, rebuilt only when its settings change.
+
+    Each ``Client`` owns its own HTTP connection pool, so building one per
+    call pays a fresh TCP/TLS handshake every time. Hot tool paths should use
+    this instead of ``create_client_with_config_settings()``.
+
+    Returns:
+        Configured genai Client
+    """
+    global _shared_client, _shared_client_key
+    key = _client_settings_key()
+    with _shared_client_lock:
+        if _shared_client is None or _shared_client_key != key:
+            _shared_client = create_client_with_config_settings()
+            _shared_client_key = key
+        return _shared_client
+
+
 def setup_vertex_environment():
     """
     Set up environment variables for Vertex AI or API key authentication.
@@ -346,22 +346,16 @@ class ConfigLoader:
             # Otherwise merge individual sections
             import json as _json
 
-            entries = store.list()
-            config_entries = [
-                e["name"] for e in entries if e["name"].startswith("config:")
-            ]
+            entries = store.get_many("config:")
+            config_entries = list(entries)
             logger.info(
                 f"load_db_config: found {len(config_entries)} config entries: {config_entries}"
             )
 
-            for entry in entries:
-                name = entry["name"]
-                if not name.startswith("config:"):
-                    continue
+            for name, raw in entries.items():
                 section = name[len("config:") :]
                 if section == "database":
                     continue  # never override DB bootstrap from the store
-                raw = store.get(name)
                 if raw:
                     try:
                         section_data = _json.loads(raw)
@@ -8,12 +8,16 @@ Usage::
     store.set("gmail_token_default", token_json, credential_type="oauth_token")
     token_json = store.get("gmail_token_default")
     store.delete("gmail_token_default")
+    with store.batch() as batch:  # several writes, one transaction
+        batch.set("gmail_token_work", token_json, credential_type="oauth_token")
+        batch.delete("_oauth_state_gmail")
     store.list()  # [{name, credential_type, description, updated_at}, ...]
 """
 
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import psycopg2
 import psycopg2.extras
@@ -28,6 +32,20 @@ _ENV_KEY = "RADBOT_CREDENTIAL_KEY"
 # Singleton instance
 _instance: Optional["CredentialStore"] = None
 
+_UPSERT_SQL = """
+    INSERT INTO radbot_credentials
+        (name, encrypted_value, salt, credential_type, description, updated_at)
+    VALUES (%s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
+    ON CONFLICT (name) DO UPDATE SET
+        encrypted_value = EXCLUDED.encrypted_value,
+        salt            = EXCLUDED.salt,
+        credential_type = EXCLUDED.credential_type,
+        description     = COALESCE(EXCLUDED.description, radbot_credentials.description),
+        updated_at      = CURRENT_TIMESTAMP;
+"""
+
+_DELETE_SQL = "DELETE FROM radbot_credentials WHERE name = %s RETURNING name;"
+
 
 class CredentialStore:
     """Encrypted credential CRUD against the ``radbot_credentials`` table."""
@@ -48,12 +66,22 @@ class CredentialStore:
             logger.warning(
                 "RADBOT_CREDENTIAL_KEY not set — credential store will be unavailable"
             )
+        self._version = 0
 
     @property
     def available(self) -> bool:
         """True when the master key is configured."""
         return bool(self._master_key)
 
+    @property
+    def version(self) -> int:
+        """Counter bumped on every write through this instance.
+
+        Lets callers cache derived views and drop them as soon as this
+        process changes a credential.
+        """
+        return self._version
+
     # ------------------------------------------------------------------
     # Schema initialisation
     # ------------------------------------------------------------------
@@ -105,32 +133,44 @@ class CredentialStore:
                 "Credential store unavailable — RADBOT_CREDENTIAL_KEY not set"
             )
 
+        params = self._upsert_params(name, value, credential_type, description)
+        with get_db_connection() as conn:
+            with get_db_cursor(conn, commit=True) as cur:
+                cur.execute(_UPSERT_SQL, params)
+        self._version += 1
+        logger.info(f"Stored credential '{name}' (type={credential_type})")
+
+    def _upsert_params(
+        self,
+        name: str,
+        value: str,
+        credential_type: str,
+        description: Optional[str],
+    ) -> Tuple[Any, ...]:
         ciphertext, salt = encrypt(value, self._master_key)
+        return (name, ciphertext.decode("utf-8"), salt, credential_type, description)
 
-        sql = """
-            INSERT INTO radbot_credentials
-                (name, encrypted_value, salt, credential_type, description, updated_at)
-            VALUES (%s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
-            ON CONFLICT (name) DO UPDATE SET
-                encrypted_value = EXCLUDED.encrypted_value,
-                salt            = EXCLUDED.salt,
-                credential_type = EXCLUDED.credential_type,
-                description     = COALESCE(EXCLUDED.description, radbot_credentials.description),
-                updated_at      = CURRENT_TIMESTAMP;
+    @contextmanager
+    def batch(self) -> Iterator["CredentialBatch"]:
+        """Collect ``set``/``delete`` calls and apply them in one transaction.
+
+        The writes run when the ``with`` block exits normally; if it raises,
+        nothing is written.
         """
+        if not self.available:
+            raise RuntimeError(
+                "Credential store unavailable — RADBOT_CREDENTIAL_KEY not set"
+            )
+        batch = CredentialBatch(self)
+        yield batch
+        if not batch.ops:
+            return
         with get_db_connection() as conn:
             with get_db_cursor(conn, commit=True) as cur:
-                cur.execute(
-                    sql,
-                    (
-                        name,
-                        ciphertext.decode("utf-8"),
-                        salt,
-                        credential_type,
-                        description,
-                    ),
-                )
-        logger.info(f"Stored credential '{name}' (type={credential_type})")
+                for sql, params in batch.ops:
+                    cur.execute(sql, params)
+        self._version += 1
+        logger.info(f"Applied {len(batch.ops)} credential write(s) in one batch")
 
     def get(self, name: str) -> Optional[str]:
         """Retrieve and decrypt a credential.  Returns ``None`` if not found."""
@@ -163,14 +203,56 @@ class CredentialStore:
                 logger.error(f"Error retrieving credential '{name}': {e}")
             return None
 
+    def get_many(self, prefix: str) -> Dict[str, str]:
+        """Retrieve and decrypt every credential whose name starts with *prefix*.
+
+        One query instead of ``list()`` plus a ``get()`` per entry. Returns
+        ``{name: value}``; entries that fail to decrypt are logged and left out.
+        """
+        if not self.available:
+            return {}
+
+        pattern = (
+            prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        )
+        sql = """
+            SELECT name, encrypted_value, salt FROM radbot_credentials
+            WHERE name LIKE %s ORDER BY name;
+        """
+        try:
+            with get_db_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(sql, (pattern,))
+                    rows = cur.fetchall()
+        except Exception as e:
+            logger.error(f"Error retrieving credentials with prefix '{prefix}': {e}")
+            return {}
+
+        from cryptography.fernet import InvalidToken
+
+        values: Dict[str, str] = {}
+        for name, ciphertext_str, salt_memview in rows:
+            try:
+                values[name] = decrypt(
+                    ciphertext_str.encode("utf-8"),
+                    bytes(salt_memview),
+                    self._master_key,
+                )
+            except InvalidToken:
+                logger.error(
+                    f"Failed to decrypt credential '{name}' — "
+                    "master key may have changed"
+                )
+        return values
+
     def delete(self, name: str) -> bool:
         """Delete a credential.  Returns ``True`` if a row was deleted."""
-        sql = "DELETE FROM radbot_credentials WHERE name = %s RETURNING name;"
         with get_db_connection() as conn:
             with get_db_cursor(conn, commit=True) as cur:
-                cur.execute(sql, (name,))
+                cur.execute(_DELETE_SQL, (name,))
                 deleted = cur.rowcount > 0
         if deleted:
+            self._version += 1
             logger.info(f"Deleted credential '{name}'")
         return deleted
 
@@ -187,6 +269,29 @@ class CredentialStore:
                 return [dict(row) for row in cur.fetchall()]
 
 
+class CredentialBatch:
+    """Writes queued by :meth:`CredentialStore.batch`."""
+
+    def __init__(self, store: CredentialStore):
+        self._store = store
+        self.ops: List[Tuple[str, Tuple[Any, ...]]] = []
+
+    def set(
+        self,
+        name: str,
+        value: str,
+        credential_type: str = "api_key",
+        description: Optional[str] = None,
+    ) -> None:
+        """Queue storing (or updating) a credential."""
+        params = self._store._upsert_params(name, value, credential_type, description)
+        self.ops.append((_UPSERT_SQL, params))
+
+    def delete(self, name: str) -> None:
+        """Queue deleting a credential (a missing name is not an error)."""
+        self.ops.append((_DELETE_SQL, (name,)))
+
+
 def get_credential_store() -> CredentialStore:
     """Return the singleton ``CredentialStore`` instance."""
     global _instance
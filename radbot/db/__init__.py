@@ -6,6 +6,11 @@ was the first module to need persistent storage. The pool is system-wide
 so it now lives here and the todo module has been retired.
 """
 
-from radbot.db.connection import get_db_connection, get_db_cursor, get_db_pool
+from radbot.db.connection import (
+    execute_prepared,
+    get_db_connection,
+    get_db_cursor,
+    get_db_pool,
+)
 
-__all__ = ["get_db_connection", "get_db_cursor", "get_db_pool"]
+__all__ = ["execute_prepared", "get_db_connection", "get_db_cursor", "get_db_pool"]
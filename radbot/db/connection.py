@@ -11,10 +11,12 @@ import logging
 import os
 import threading
 import uuid
+import weakref
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, Generator, Sequence
 
 import psycopg2
+import psycopg2.errors
 import psycopg2.extras
 import psycopg2.pool
 
@@ -29,6 +31,13 @@ psycopg2.extensions.register_adapter(
 _pool: psycopg2.pool.ThreadedConnectionPool | None = None
 _pool_lock = threading.Lock()
 
+# Server-side prepared statement names already PREPAREd on each connection.
+# Weak keys so connections the pool closes or replaces drop out on their own.
+_prepared: "weakref.WeakKeyDictionary[psycopg2.extensions.connection, set[str]]" = (
+    weakref.WeakKeyDictionary()
+)
+_prepared_lock = threading.Lock()
+
 MIN_CONN = int(os.environ.get("RADBOT_DB_POOL_MIN", "1"))
 MAX_CONN = int(os.environ.get("RADBOT_DB_POOL_MAX", "10"))
 
@@ -128,3 +137,76 @@ def get_db_cursor(
             )
             conn.rollback()
             raise
+
+
+# Raised by EXECUTE when a prepared statement went stale: the server no
+# longer has it, or the table behind it changed shape ("cached plan must
+# not change result type").
+_STALE_PREPARED_ERRORS = (
+    psycopg2.errors.InvalidSqlStatementName,
+    psycopg2.errors.FeatureNotSupported,
+)
+
+
+def _execute_named(
+    cursor: psycopg2.extensions.cursor, name: str, params: Sequence[Any]
+) -> None:
+    if params:
+        placeholders = ", ".join(["%s"] * len(params))
+        cursor.execute(f"EXECUTE {name} ({placeholders})", tuple(params))
+    else:
+        cursor.execute(f"EXECUTE {name}")
+
+
+def execute_prepared(
+    cursor: psycopg2.extensions.cursor,
+    name: str,
+    sql: str,
+    params: Sequence[Any] = (),
+) -> None:
+    """Run *sql* as the named server-side prepared statement *name*.
+
+    *sql* uses PostgreSQL's ``$1, $2, ...`` placeholders. The statement is
+    PREPAREd the first time *name* is used on a given connection; later
+    calls on that connection only send ``EXECUTE``, so Postgres skips the
+    parse/plan step. Prepared statements live for the session (they are
+    not rolled back with the transaction), which is why tracking per
+    connection object is enough.
+
+    If an ``EXECUTE`` of an already-prepared statement fails because the
+    statement went stale (dropped server-side, or the table changed shape
+    under it), the transaction is rolled back and the statement is
+    re-PREPAREd and run once more. That only happens when the call started
+    a fresh transaction, so no earlier work on the connection is lost;
+    otherwise the error propagates. Statements should still name their
+    columns rather than use ``*`` so an added column doesn't trip this.
+    """
+    conn = cursor.connection
+    fresh_txn = (
+        conn.get_transaction_status() == psycopg2.extensions.TRANSACTION_STATUS_IDLE
+    )
+    with _prepared_lock:
+        names = _prepared.setdefault(conn, set())
+        needs_prepare = name not in names
+    if needs_prepare:
+        cursor.execute(f"PREPARE {name} AS {sql}")
+        with _prepared_lock:
+            names.add(name)
+        _execute_named(cursor, name, params)
+        return
+
+    try:
+        _execute_named(cursor, name, params)
+    except _STALE_PREPARED_ERRORS as e:
+        if not fresh_txn:
+            raise
+        logger.warning("Prepared statement %s is stale, re-preparing: %s", name, e)
+        conn.rollback()
+        with _prepared_lock:
+            names.discard(name)
+        if isinstance(e, psycopg2.errors.FeatureNotSupported):
+            cursor.execute(f"DEALLOCATE {name}")
+        cursor.execute(f"PREPARE {name} AS {sql}")
+        with _prepared_lock:
+            names.add(name)
+        _execute_named(cursor, name, params)
@@ -15,6 +15,7 @@ import psycopg2
 import psycopg2.extras
 
 from radbot.db.connection import get_db_connection
+from radbot.tools.shared.serialization import serialize_rows
 
 logger = logging.getLogger(__name__)
 
@@ -226,9 +227,9 @@ def list_alerts(
 
             cur.execute(
                 f"""
-                SELECT alert_id, fingerprint, alertname, status, severity,
-                       instance, summary, remediation_action, remediation_result,
-                       created_at, resolved_at, updated_at
+                SELECT alert_id::text AS alert_id, fingerprint, alertname, status,
+                       severity, instance, summary, remediation_action,
+                       remediation_result, created_at, resolved_at, updated_at
                 FROM alert_events
                 {where_clause}
                 ORDER BY created_at DESC
@@ -236,15 +237,7 @@ def list_alerts(
                 """,
                 params,
             )
-            results = []
-            for row in cur.fetchall():
-                r = dict(row)
-                r["alert_id"] = str(r["alert_id"])
-                for ts_field in ("created_at", "resolved_at", "updated_at"):
-                    if r.get(ts_field):
-                        r[ts_field] = r[ts_field].isoformat()
-                results.append(r)
-            return results
+            return serialize_rows(cur.fetchall())
 
 
 def count_alerts(
@@ -347,18 +340,13 @@ def list_policies() -> List[Dict[str, Any]]:
     with get_db_connection() as conn:
         with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
             cur.execute("""
-                SELECT policy_id, alertname_pattern, severity, action,
+                SELECT policy_id::text AS policy_id, alertname_pattern, severity, action,
                        max_auto_remediations, window_minutes,
                        timeout_seconds, max_llm_calls, enabled, metadata
                 FROM alert_remediation_policies
                 ORDER BY created_at
                 """)
-            results = []
-            for row in cur.fetchall():
-                r = dict(row)
-                r["policy_id"] = str(r["policy_id"])
-                results.append(r)
-            return results
+            return [dict(row) for row in cur.fetchall()]
 
 
 def update_policy(policy_id: str, **fields) -> bool:
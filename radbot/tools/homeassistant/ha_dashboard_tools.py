@@ -7,11 +7,12 @@ All tools are async and return ``{"status": "success", ...}`` or
 
 import json
 import logging
-import traceback
 from typing import Any, Dict, Optional
 
 from google.adk.tools import FunctionTool
 
+from radbot.tools.shared.errors import exception_text, truncate_error
+
 from .ha_ws_singleton import get_ha_ws_client
 
 logger = logging.getLogger(__name__)
@@ -51,10 +52,10 @@ async def list_ha_dashboards() -> Dict[str, Any]:
         dashboards = await client.list_dashboards()
         return {"status": "success", "dashboards": dashboards}
     except Exception as e:
-        msg = f"Failed to list dashboards: {e}"
+        msg = f"Failed to list dashboards: {exception_text(e)}"
         logger.error(msg)
-        logger.debug(traceback.format_exc())
-        return {"status": "error", "message": msg[:300]}
+        logger.debug("Traceback:", exc_info=True)
+        return {"status": "error", "message": truncate_error(msg, 300)}
 
 
 async def get_ha_dashboard_config(url_path: str = "") -> Dict[str, Any]:
@@ -79,10 +80,10 @@ async def get_ha_dashboard_config(url_path: str = "") -> Dict[str, Any]:
             "config": config,
         }
     except Exception as e:
-        msg = f"Failed to get dashboard config for '{url_path or 'default'}': {e}"
+        msg = f"Failed to get dashboard config for '{url_path or 'default'}': {exception_text(e)}"
         logger.error(msg)
-        logger.debug(traceback.format_exc())
-        return {"status": "error", "message": msg[:300]}
+        logger.debug("Traceback:", exc_info=True)
+        return {"status": "error", "message": truncate_error(msg, 300)}
 
 
 async def create_ha_dashboard(
@@ -120,10 +121,10 @@ async def create_ha_dashboard(
         logger.info(f"Created HA dashboard: {title} ({url_path})")
         return {"status": "success", "dashboard": result}
     except Exception as e:
-        msg = f"Failed to create dashboard '{url_path}': {e}"
+        msg = f"Failed to create dashboard '{url_path}': {exception_text(e)}"
         logger.error(msg)
-        logger.debug(traceback.format_exc())
-        return {"status": "error", "message": msg[:300]}
+        logger.debug("Traceback:", exc_info=True)
+        return {"status": "error", "message": truncate_error(msg, 300)}
 
 
 async def update_ha_dashboard(
@@ -168,10 +169,10 @@ async def update_ha_dashboard(
         logger.info(f"Updated HA dashboard id={dashboard_id}")
         return {"status": "success", "dashboard": result}
     except Exception as e:
-        msg = f"Failed to update dashboard id={dashboard_id}: {e}"
+        msg = f"Failed to update dashboard id={dashboard_id}: {exception_text(e)}"
         logger.error(msg)
-        logger.debug(traceback.format_exc())
-        return {"status": "error", "message": msg[:300]}
+        logger.debug("Traceback:", exc_info=True)
+        return {"status": "error", "message": truncate_error(msg, 300)}
 
 
 async def delete_ha_dashboard(dashboard_id: int) -> Dict[str, Any]:
@@ -192,10 +193,10 @@ async def delete_ha_dashboard(dashboard_id: int) -> Dict[str, Any]:
         logger.info(f"Deleted HA dashboard id={dashboard_id}")
         return {"status": "success", "deleted_id": dashboard_id}
     except Exception as e:
-        msg = f"Failed to delete dashboard id={dashboard_id}: {e}"
+        msg = f"Failed to delete dashboard id={dashboard_id}: {exception_text(e)}"
         logger.error(msg)
-        logger.debug(traceback.format_exc())
-        return {"status": "error", "message": msg[:300]}
+        logger.debug("Traceback:", exc_info=True)
+        return {"status": "error", "message": truncate_error(msg, 300)}
 
 
 async def save_ha_dashboard_config(
@@ -231,10 +232,10 @@ async def save_ha_dashboard_config(
         logger.info(f"Saved dashboard config for '{url_path or 'default'}'")
         return {"status": "success", "url_path": url_path or "(default)"}
     except Exception as e:
-        msg = f"Failed to save dashboard config for '{url_path or 'default'}': {e}"
+        msg = f"Failed to save dashboard config for '{url_path or 'default'}': {exception_text(e)}"
         logger.error(msg)
-        logger.debug(traceback.format_exc())
-        return {"status": "error", "message": msg[:300]}
+        logger.debug("Traceback:", exc_info=True)
+        return {"status": "error", "message": truncate_error(msg, 300)}
 
 
 # ---------------------------------------------------------------------------
@@ -13,6 +13,7 @@ from typing import Any, Dict, List, Optional
 from google.adk.tools import FunctionTool
 
 from radbot.tools.shared.client_utils import client_or_error
+from radbot.tools.shared.errors import exception_text, truncate_error
 from radbot.tools.shared.tool_decorator import tool_error_handler
 
 from .picnic_client import get_picnic_client
@@ -382,9 +383,9 @@ def submit_shopping_list_to_picnic(
                 "message": f"No backlog tasks under project '{project_name}'.",
             }
     except Exception as e:
-        msg = f"Failed to read shopping list from Telos: {e}"
+        msg = f"Failed to read shopping list from Telos: {exception_text(e)}"
         logger.error(msg)
-        return {"status": "error", "message": msg[:300]}
+        return {"status": "error", "message": truncate_error(msg, 300)}
 
     matched: List[Dict[str, Any]] = []
     unmatched: List[str] = []
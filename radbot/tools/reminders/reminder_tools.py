@@ -6,13 +6,12 @@ reminders that fire at a specific datetime.
 """
 
 import logging
-import traceback
 from datetime import datetime, timezone
 from typing import Any, Dict
 
 from google.adk.tools import FunctionTool
 
-from radbot.tools.shared.errors import truncate_error
+from radbot.tools.shared.errors import exception_text, truncate_error
 from radbot.tools.shared.serialization import serialize_rows
 from radbot.tools.shared.validation import validate_uuid
 
@@ -132,9 +131,9 @@ def create_reminder(
             "remind_at": dt.isoformat(),
         }
     except Exception as e:
-        error_message = f"Failed to create reminder: {str(e)}"
+        error_message = f"Failed to create reminder: {exception_text(e)}"
         logger.error(f"Error in create_reminder: {error_message}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
         return {"status": "error", "message": truncate_error(error_message)}
 
 
@@ -156,9 +155,9 @@ def list_reminders(status: str = "pending") -> Dict[str, Any]:
         )
         return {"status": "success", "reminders": serialize_rows(reminders)}
     except Exception as e:
-        error_message = f"Failed to list reminders: {str(e)}"
+        error_message = f"Failed to list reminders: {exception_text(e)}"
         logger.error(f"Error in list_reminders: {error_message}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
         return {"status": "error", "message": truncate_error(error_message)}
 
 
@@ -197,9 +196,9 @@ def delete_reminder(reminder_id: str) -> Dict[str, Any]:
                 "message": f"Reminder {reminder_id} not found.",
             }
     except Exception as e:
-        error_message = f"Failed to delete reminder: {str(e)}"
+        error_message = f"Failed to delete reminder: {exception_text(e)}"
         logger.error(f"Error in delete_reminder: {error_message}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
         return {"status": "error", "message": truncate_error(error_message)}
 
 
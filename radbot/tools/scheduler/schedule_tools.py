@@ -6,12 +6,11 @@ recurring scheduled tasks.
 """
 
 import logging
-import traceback
 from typing import Any, Dict, Optional
 
 from google.adk.tools import FunctionTool
 
-from radbot.tools.shared.errors import truncate_error
+from radbot.tools.shared.errors import exception_text, truncate_error
 from radbot.tools.shared.serialization import serialize_rows
 from radbot.tools.shared.validation import validate_uuid
 
@@ -93,9 +92,9 @@ def create_scheduled_task(
             "agent_name": agent_name,
         }
     except Exception as e:
-        error_message = f"Failed to create scheduled task: {str(e)}"
+        error_message = f"Failed to create scheduled task: {exception_text(e)}"
         logger.error(f"Error in create_scheduled_task: {error_message}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
         return {"status": "error", "message": truncate_error(error_message)}
 
 
@@ -124,9 +123,9 @@ def list_scheduled_tasks() -> Dict[str, Any]:
 
         return {"status": "success", "tasks": serialize_rows(tasks)}
     except Exception as e:
-        error_message = f"Failed to list scheduled tasks: {str(e)}"
+        error_message = f"Failed to list scheduled tasks: {exception_text(e)}"
         logger.error(f"Error in list_scheduled_tasks: {error_message}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
         return {"status": "error", "message": truncate_error(error_message)}
 
 
@@ -165,9 +164,9 @@ def delete_scheduled_task(task_id: str) -> Dict[str, Any]:
                 "message": f"Scheduled task {task_id} not found.",
             }
     except Exception as e:
-        error_message = f"Failed to delete scheduled task: {str(e)}"
+        error_message = f"Failed to delete scheduled task: {exception_text(e)}"
         logger.error(f"Error in delete_scheduled_task: {error_message}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
         return {"status": "error", "message": truncate_error(error_message)}
 
 
@@ -3,43 +3,49 @@
 import logging
 from typing import List
 
+from psycopg2 import sql
+
 from radbot.db.connection import get_db_connection, get_db_cursor
 
 logger = logging.getLogger(__name__)
 
 
+def _statement(ddl: str) -> str:
+    """Normalise a DDL snippet to exactly one trailing semicolon."""
+    return ddl.strip().rstrip(";") + ";"
+
+
 def init_table_schema(
     table_name: str,
     create_table_sql: str,
     create_index_sqls: List[str] | None = None,
+    migration_sqls: List[str] | None = None,
 ) -> None:
     """Check-and-create a table plus optional indexes.
 
+    The existence check, table/index DDL and any ``migration_sqls`` are sent
+    as one script in a single round-trip: the create runs inside a ``DO``
+    block guarded by ``to_regclass``, and migrations follow it. Migrations
+    run on every call, so they must themselves be idempotent (``IF NOT
+    EXISTS`` / ``IF EXISTS``).
+
     This is idempotent — safe to call on every startup.
     """
     create_index_sqls = create_index_sqls or []
+    body = "\n".join(_statement(s) for s in [create_table_sql, *create_index_sqls])
+    script = sql.SQL(
+        "DO $radbot_init$ BEGIN IF to_regclass({name}) IS NULL THEN\n"
+        "{body}\nEND IF; END $radbot_init$;\n{migrations}"
+    ).format(
+        name=sql.Literal(table_name),
+        body=sql.SQL(body),
+        migrations=sql.SQL("\n".join(_statement(s) for s in migration_sqls or [])),
+    )
     try:
         with get_db_connection() as conn:
             with get_db_cursor(conn, commit=True) as cursor:
-                cursor.execute(
-                    """
-                    SELECT EXISTS (
-                        SELECT 1 FROM information_schema.tables
-                        WHERE table_name = %s
-                    );
-                    """,
-                    (table_name,),
-                )
-                table_exists = cursor.fetchone()[0]
-
-                if not table_exists:
-                    logger.info("Creating %s table", table_name)
-                    cursor.execute(create_table_sql)
-                    for idx_sql in create_index_sqls:
-                        cursor.execute(idx_sql)
-                    logger.info("%s table created successfully", table_name)
-                else:
-                    logger.info("%s table already exists", table_name)
+                cursor.execute(script)
+                logger.info("%s schema ensured", table_name)
     except Exception as e:
         logger.error("Error creating %s schema: %s", table_name, e)
         raise
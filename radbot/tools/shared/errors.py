@@ -1,8 +1,22 @@
 """Shared error-handling helpers for agent tools."""
 
+# Exception text beyond this is clipped before it is formatted into tool
+# error messages and log lines (psycopg errors can carry the full query).
+MAX_EXCEPTION_TEXT = 4096
+
 
 def truncate_error(message: str, max_length: int = 200) -> str:
     """Truncate an error message if it exceeds *max_length*."""
     if len(message) <= max_length:
         return message
     return message[: max_length - 3] + "..."
+
+
+def exception_text(exc: BaseException, max_length: int = MAX_EXCEPTION_TEXT) -> str:
+    """``str(exc)``, clipped to *max_length* and tagged with the exception
+    type when clipped, so a multi-KB message isn't copied into every
+    f-string and log record on the error path."""
+    text = str(exc)
+    if len(text) <= max_length:
+        return text
+    return f"{type(exc).__name__}: {truncate_error(text, max_length)}"
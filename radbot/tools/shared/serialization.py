@@ -3,6 +3,18 @@
 import uuid
 from typing import Any, Dict, List, Optional
 
+# Value types that are already JSON-ready; skipped without any isinstance /
+# hasattr probing, which dominated the per-field cost on wide result sets.
+_PASSTHROUGH = frozenset({str, int, float, bool, type(None), dict, list})
+
+
+def _coerce(v: Any) -> Any:
+    if isinstance(v, uuid.UUID):
+        return str(v)
+    if hasattr(v, "isoformat"):
+        return v.isoformat()
+    return v
+
 
 def serialize_row(
     row: Dict[str, Any],
@@ -19,17 +31,11 @@ def serialize_row(
     Returns:
         A new dict safe for JSON serialization.
     """
-    mask_fields = mask_fields or {}
-    item: Dict[str, Any] = {}
-    for k, v in row.items():
-        if k in mask_fields:
-            item[k] = mask_fields[k] if v else None
-        elif isinstance(v, uuid.UUID):
-            item[k] = str(v)
-        elif hasattr(v, "isoformat"):
-            item[k] = v.isoformat()
-        else:
-            item[k] = v
+    item = {k: v if type(v) in _PASSTHROUGH else _coerce(v) for k, v in row.items()}
+    if mask_fields:
+        for k, replacement in mask_fields.items():
+            if k in item:
+                item[k] = replacement if item[k] else None
     return item
 
 
@@ -2,9 +2,10 @@
 
 import functools
 import logging
-import traceback
 from typing import Any, Callable, Dict
 
+from radbot.tools.shared.errors import exception_text, truncate_error
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,10 +33,10 @@ def tool_error_handler(operation_name: str) -> Callable:
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                msg = f"Failed to {operation_name}: {e}"
+                msg = f"Failed to {operation_name}: {exception_text(e)}"
                 logger.error(msg)
-                logger.debug(traceback.format_exc())
-                return {"status": "error", "message": msg[:300]}
+                logger.debug("Traceback:", exc_info=True)
+                return {"status": "error", "message": truncate_error(msg, 300)}
 
         return wrapper
 
@@ -1,8 +1,17 @@
 """Shared validation helpers for agent tool inputs."""
 
+import re
 import uuid
 from typing import Any, Dict, Optional, Tuple
 
+# The spellings agents actually send: canonical or bare 32-hex, optionally
+# braced or urn-prefixed. Matching first keeps malformed input (names,
+# ref_codes) off uuid.UUID's exception path.
+_UUID_RE = re.compile(
+    r"\A(?:urn:uuid:)?\{?[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}"
+    r"-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}\}?\Z"
+)
+
 
 def validate_uuid(
     value: str, field_name: str = "ID"
@@ -17,12 +26,9 @@ def validate_uuid(
         if err:
             return err
     """
-    try:
+    if isinstance(value, str) and _UUID_RE.match(value):
         return uuid.UUID(value), None
-    except (ValueError, AttributeError):
-        return None, {
-            "status": "error",
-            "message": (
-                f"Invalid {field_name} format: {value}. " "Must be a valid UUID."
-            ),
-        }
+    return None, {
+        "status": "error",
+        "message": (f"Invalid {field_name} format: {value}. " "Must be a valid UUID."),
+    }
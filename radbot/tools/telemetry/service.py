@@ -63,28 +63,50 @@ def _db_dsn_kwargs() -> Dict[str, Any]:
         host=cfg.get("host") or os.getenv("POSTGRES_HOST", "localhost"),
         port=cfg.get("port") or os.getenv("POSTGRES_PORT", "5432"),
         connect_timeout=DB_CONNECT_TIMEOUT_S,
+        options=f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}",
     )
 
 
+# The worker's own connection, reused across batches. Deliberately not the
+# shared pool: telemetry keeps its strict timeouts and can never starve
+# request handlers of pooled connections.
+_writer_conn: Optional[psycopg2.extensions.connection] = None
+_writer_conn_lock = threading.Lock()
+
+
+def _close_writer_conn() -> None:
+    global _writer_conn
+    with _writer_conn_lock:
+        conn, _writer_conn = _writer_conn, None
+    if conn is not None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
 def _default_db_writer(batch: List[Tuple[str, Dict[str, Any]]]) -> None:
-    """Open a short-lived connection with strict timeouts and insert ``batch``.
+    """Insert ``batch`` over the worker's long-lived connection.
 
-    Raises on any DB error; the caller is responsible for fail-open semantics.
+    The connection (strict connect + statement timeouts) is opened on first
+    use and reused; any error drops it so the next batch reconnects. Raises
+    on any DB error; the caller is responsible for fail-open semantics.
     """
-    conn = psycopg2.connect(**_db_dsn_kwargs())
+    global _writer_conn
+    with _writer_conn_lock:
+        if _writer_conn is None or _writer_conn.closed:
+            _writer_conn = psycopg2.connect(**_db_dsn_kwargs())
+        conn = _writer_conn
     try:
         with conn:
             with conn.cursor() as cur:
-                cur.execute(f"SET statement_timeout = {DB_STATEMENT_TIMEOUT_MS}")
                 cur.executemany(
                     "INSERT INTO telemetry_events (event_type, payload) VALUES (%s, %s)",
                     [(et, json.dumps(p)) for et, p in batch],
                 )
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
+    except Exception:
+        _close_writer_conn()
+        raise
 
 
 class TelemetryService:
@@ -247,3 +269,4 @@ def _atexit_flush() -> None:
         svc.flush()
     except Exception:
         pass
+    _close_writer_conn()
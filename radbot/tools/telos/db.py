@@ -7,19 +7,98 @@ live in JSONB `metadata`. Reuses the shared PostgreSQL pool from
 
 from __future__ import annotations
 
+import csv
+import io
 import json
 import logging
+import operator
+import threading
+import time
+from datetime import datetime, timezone
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import psycopg2
 import psycopg2.extras
 
-from radbot.db.connection import get_db_connection, get_db_cursor
+from radbot.db.connection import execute_prepared, get_db_connection, get_db_cursor
 
 from .models import REF_PREFIX, STATUS_VALUES, Entry, Section
 
 logger = logging.getLogger(__name__)
 
+# (section, ref_code) -> (entry_id, cached_at) for parent lookups (projects,
+# milestones). Rows are only ever hard-deleted by reset_all(), which clears
+# this; the TTL bounds staleness from a reset run in another process (CLI).
+# Misses are not cached — the parent may be created a moment later.
+_ENTRY_ID_CACHE_MAX = 1024
+_ENTRY_ID_TTL_SECONDS = 300.0
+_entry_ids: Dict[Tuple[Section, str], Tuple[str, float]] = {}
+_entry_ids_lock = threading.Lock()
+
+# Active project list, read on every project picker / tool call but only
+# changed by writes to the projects section. Those writes clear it; the TTL
+# bounds staleness from other processes writing the same table.
+_PROJECTS_TTL_SECONDS = 30.0
+_projects_cache: Optional[Tuple[float, List[Entry]]] = None
+_projects_cache_gen = 0
+_projects_cache_lock = threading.Lock()
+
+# Columns an Entry is built from (see _row_to_entry / _fetch_entries).
+_ENTRY_COLUMNS = (
+    "entry_id",
+    "section",
+    "ref_code",
+    "content",
+    "metadata",
+    "status",
+    "sort_order",
+    "created_at",
+    "updated_at",
+)
+
+# Prepared statements name their columns: a ``*`` result shape is frozen
+# at PREPARE time and breaks if a migration later adds a column.
+_ENTRY_SELECT = ", ".join(_ENTRY_COLUMNS)
+
+# Hot single-row statements, run as server-side prepared statements so
+# Postgres parses/plans them once per pooled connection.
+_GET_ENTRY_SQL = (
+    f"SELECT {_ENTRY_SELECT} FROM telos_entries WHERE section = $1 AND ref_code = $2"
+)
+_ADD_ENTRY_SQL = f"""
+    INSERT INTO telos_entries (section, ref_code, content, metadata, status, sort_order)
+    VALUES ($1, $2, $3, $4::jsonb, $5, $6)
+    RETURNING {_ENTRY_SELECT}
+"""
+
+# Rows per multi-row INSERT statement in bulk_upsert().
+_BULK_PAGE_SIZE = 500
+
+# Loads larger than one execute_values page go through COPY instead.
+_COPY_MIN_ROWS = _BULK_PAGE_SIZE
+
+_UPSERT_CONFLICT_SQL = """
+    ON CONFLICT (section, ref_code) DO UPDATE SET
+        content = EXCLUDED.content,
+        metadata = EXCLUDED.metadata,
+        status = EXCLUDED.status,
+        sort_order = EXCLUDED.sort_order,
+        updated_at = CURRENT_TIMESTAMP
+    RETURNING *;
+"""
+
+
+class _Jsonb(psycopg2.extras.Json):
+    """Explicit JSONB parameter adapter with compact encoding.
+
+    Metadata dicts are bound through this rather than pre-serialised with a
+    bare ``json.dumps`` at each call site; dropping the default separator
+    whitespace trims every stored/transmitted metadata blob.
+    """
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
 
 def init_telos_schema() -> None:
     """Create the telos_entries table (idempotent)."""
@@ -42,10 +121,19 @@ def init_telos_schema() -> None:
             );
         """,
         create_index_sqls=[
-            "CREATE INDEX idx_telos_section_status ON telos_entries (section, status);",
+            "CREATE INDEX idx_telos_section_status_order ON telos_entries (section, status, sort_order, created_at);",  # noqa: E501
             "CREATE INDEX idx_telos_active ON telos_entries (section) WHERE status = 'active';",
             "CREATE INDEX idx_telos_journal_recent ON telos_entries (created_at DESC) WHERE section = 'journal';",
         ],
+        # list_section() filters on (section, status) and orders by
+        # (sort_order, created_at). The wider index serves both without a
+        # sort step and makes the old (section, status) index redundant.
+        migration_sqls=[
+            "CREATE INDEX IF NOT EXISTS idx_telos_section_status_order ON telos_entries (section, status, sort_order, created_at);",  # noqa: E501
+            "DROP INDEX IF EXISTS idx_telos_section_status;",
+            # Project child lookups (list_project_tasks/list_project_children).
+            "CREATE INDEX IF NOT EXISTS idx_telos_parent_project ON telos_entries (section, (metadata->>'parent_project'));",  # noqa: E501
+        ],
     )
 
 
@@ -63,6 +151,36 @@ def _row_to_entry(row: Dict[str, Any]) -> Entry:
     )
 
 
+def _fetch_entries(cursor) -> List[Entry]:
+    """Build Entries straight from a plain (tuple) cursor's result set.
+
+    Column positions are resolved once from ``cursor.description`` so the
+    list paths skip the per-row ``RealDictRow`` that ``_row_to_entry``
+    needs.
+    """
+    positions = {col.name: i for i, col in enumerate(cursor.description)}
+    pick = operator.itemgetter(*(positions[c] for c in _ENTRY_COLUMNS))
+    out: List[Entry] = []
+    for row in cursor.fetchall():
+        entry_id, section, ref_code, content, metadata, status, sort_order, ca, ua = (
+            pick(row)
+        )
+        out.append(
+            Entry(
+                entry_id=str(entry_id),
+                section=Section(section),
+                ref_code=ref_code,
+                content=content,
+                metadata=metadata or {},
+                status=status,
+                sort_order=sort_order,
+                created_at=ca,
+                updated_at=ua,
+            )
+        )
+    return out
+
+
 def next_ref_code(section: Section) -> Optional[str]:
     """Compute the next auto-assigned ref_code for a section, or None if the
     section does not use ref_codes."""
@@ -103,28 +221,70 @@ def add_entry(
     if ref_code is None and section in REF_PREFIX:
         ref_code = next_ref_code(section)
 
-    sql = """
-        INSERT INTO telos_entries (section, ref_code, content, metadata, status, sort_order)
-        VALUES (%s, %s, %s, %s::jsonb, %s, %s)
-        RETURNING *;
-    """
     params = (
         section.value,
         ref_code,
         content,
-        json.dumps(metadata or {}),
+        _Jsonb(metadata or {}),
         status,
         sort_order,
     )
     try:
         with get_db_connection() as conn:
             with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
-                cursor.execute(sql, params)
+                execute_prepared(cursor, "telos_add_entry", _ADD_ENTRY_SQL, params)
                 conn.commit()
-                return _row_to_entry(cursor.fetchone())
+                entry = _row_to_entry(cursor.fetchone())
     except psycopg2.Error as e:
         logger.error("Database error adding telos entry: %s", e)
         raise
+    _invalidate_projects(section)
+    return entry
+
+
+def _update_sets(
+    params: List[Any],
+    *,
+    content: Optional[str] = None,
+    metadata_merge: Optional[Dict[str, Any]] = None,
+    metadata_replace: Optional[Dict[str, Any]] = None,
+    status: Optional[str] = None,
+    sort_order: Optional[int] = None,
+) -> Tuple[str, List[Any], str]:
+    """Build the SET clause shared by update_entry() / update_many().
+
+    Values are appended to *params* (which already holds the WHERE
+    arguments) as ``$n`` placeholders. Returns ``(sets, params, shape)``;
+    *sets* is "" when nothing is being changed. *shape* names which columns
+    are set, so each distinct statement gets its own prepared-statement
+    name — a handful per connection at most.
+    """
+    sets: List[str] = []
+    shape: List[str] = []
+
+    def _bind(value: Any) -> str:
+        params.append(value)
+        return f"${len(params)}"
+
+    if content is not None:
+        sets.append(f"content = {_bind(content)}")
+        shape.append("c")
+    if metadata_replace is not None:
+        sets.append(f"metadata = {_bind(_Jsonb(metadata_replace))}::jsonb")
+        shape.append("mr")
+    elif metadata_merge:
+        sets.append(f"metadata = metadata || {_bind(_Jsonb(metadata_merge))}::jsonb")
+        shape.append("mm")
+    if status is not None:
+        sets.append(f"status = {_bind(status)}")
+        shape.append("s")
+    if sort_order is not None:
+        sets.append(f"sort_order = {_bind(sort_order)}")
+        shape.append("o")
+    if not sets:
+        return "", params, ""
+    sets.append("updated_at = CURRENT_TIMESTAMP")
+    return ", ".join(sets), params, "_".join(shape)
 
 
 def update_entry(
@@ -146,44 +306,93 @@ def update_entry(
     if status is not None and status not in STATUS_VALUES:
         raise ValueError(f"invalid status {status!r}")
 
-    sets: List[str] = []
-    params: List[Any] = []
-    if content is not None:
-        sets.append("content = %s")
-        params.append(content)
-    if metadata_replace is not None:
-        sets.append("metadata = %s::jsonb")
-        params.append(json.dumps(metadata_replace))
-    elif metadata_merge:
-        sets.append("metadata = metadata || %s::jsonb")
-        params.append(json.dumps(metadata_merge))
-    if status is not None:
-        sets.append("status = %s")
-        params.append(status)
-    if sort_order is not None:
-        sets.append("sort_order = %s")
-        params.append(sort_order)
-
+    sets, params, shape = _update_sets(
+        [section.value, ref_code],
+        content=content,
+        metadata_merge=metadata_merge,
+        metadata_replace=metadata_replace,
+        status=status,
+        sort_order=sort_order,
+    )
     if not sets:
         return get_entry(section, ref_code)
 
-    sets.append("updated_at = CURRENT_TIMESTAMP")
     sql = f"""
-        UPDATE telos_entries SET {", ".join(sets)}
-        WHERE section = %s AND ref_code = %s
-        RETURNING *;
+        UPDATE telos_entries SET {sets}
+        WHERE section = $1 AND ref_code = $2
+        RETURNING {_ENTRY_SELECT}
     """
-    params.extend([section.value, ref_code])
     try:
         with get_db_connection() as conn:
             with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
-                cursor.execute(sql, tuple(params))
+                execute_prepared(cursor, f"telos_update_{shape}", sql, params)
                 conn.commit()
                 row = cursor.fetchone()
-                return _row_to_entry(row) if row else None
     except psycopg2.Error as e:
         logger.error("Database error updating telos entry: %s", e)
         raise
+    if row is None:
+        return None
+    _invalidate_projects(section)
+    return _row_to_entry(row)
+
+
+def resolve_entry_id(section: Section, ref_code: str) -> Optional[str]:
+    """Return the entry_id for *ref_code* in *section*, or None if it doesn't
+    exist. Hits are memoized in-process so repeated task/milestone adds
+    under the same parent skip the DB round-trip."""
+    key = (section, ref_code)
+    hit = _entry_ids.get(key)
+    if hit is not None and time.monotonic() - hit[1] < _ENTRY_ID_TTL_SECONDS:
+        return hit[0]
+    entry = get_entry(section, ref_code)
+    if entry is None or entry.entry_id is None:
+        return None
+    with _entry_ids_lock:
+        if len(_entry_ids) >= _ENTRY_ID_CACHE_MAX:
+            _entry_ids.clear()
+        _entry_ids[key] = (entry.entry_id, time.monotonic())
+    return entry.entry_id
+
+
+def resolve_project_id(ref_code: str) -> Optional[str]:
+    """resolve_entry_id() for the projects section."""
+    return resolve_entry_id(Section.PROJECTS, ref_code)
+
+
+def clear_project_id_cache() -> None:
+    """Drop all memoized entry ids (called whenever rows are deleted)."""
+    with _entry_ids_lock:
+        _entry_ids.clear()
+
+
+def list_active_projects() -> List[Entry]:
+    """Active projects in sort order, cached for ``_PROJECTS_TTL_SECONDS``.
+
+    Writes through this module that touch the projects section clear the
+    cache immediately. Returns a fresh list; treat the entries as read-only.
+    """
+    global _projects_cache
+    cached = _projects_cache
+    if cached is not None and time.monotonic() - cached[0] < _PROJECTS_TTL_SECONDS:
+        return list(cached[1])
+    gen = _projects_cache_gen
+    projects = list_section(Section.PROJECTS, status="active")
+    with _projects_cache_lock:
+        # Don't store a result that a concurrent write already invalidated.
+        if gen == _projects_cache_gen:
+            _projects_cache = (time.monotonic(), projects)
+    return list(projects)
+
+
+def _invalidate_projects(*sections: Optional[Section]) -> None:
+    """Drop the cached project list if any of *sections* is projects (None
+    means "all sections", as in reset_all)."""
+    global _projects_cache, _projects_cache_gen
+    if any(s is None or s is Section.PROJECTS for s in sections):
+        with _projects_cache_lock:
+            _projects_cache = None
+            _projects_cache_gen += 1
 
 
 def upsert_singleton(
@@ -192,26 +401,40 @@ def upsert_singleton(
     content: str,
     metadata: Optional[Dict[str, Any]] = None,
 ) -> Entry:
-    """Upsert a single entry by (section, ref_code). Used for Identity."""
-    existing = get_entry(section, ref_code)
-    if existing:
-        updated = update_entry(
-            section,
-            ref_code,
-            content=content,
-            metadata_replace=metadata or {},
-        )
-        assert updated is not None
-        return updated
-    return add_entry(section, content, ref_code=ref_code, metadata=metadata)
+    """Upsert a single entry by (section, ref_code). Used for Identity.
+
+    One `INSERT ... ON CONFLICT ... RETURNING` round-trip handles both the
+    create and the replace case (no SELECT-then-write race)."""
+    sql = """
+        INSERT INTO telos_entries (section, ref_code, content, metadata)
+        VALUES (%s, %s, %s, %s::jsonb)
+        ON CONFLICT (section, ref_code) DO UPDATE SET
+            content = EXCLUDED.content,
+            metadata = EXCLUDED.metadata,
+            updated_at = CURRENT_TIMESTAMP
+        RETURNING *;
+    """
+    params = (section.value, ref_code, content, _Jsonb(metadata or {}))
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+                cursor.execute(sql, params)
+                conn.commit()
+                entry = _row_to_entry(cursor.fetchone())
+    except psycopg2.Error as e:
+        logger.error("Database error upserting telos entry: %s", e)
+        raise
+    _invalidate_projects(section)
+    return entry
 
 
 def get_entry(section: Section, ref_code: str) -> Optional[Entry]:
-    sql = "SELECT * FROM telos_entries WHERE section = %s AND ref_code = %s;"
     try:
         with get_db_connection() as conn:
             with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
-                cursor.execute(sql, (section.value, ref_code))
+                execute_prepared(
+                    cursor, "telos_get_entry", _GET_ENTRY_SQL, (section.value, ref_code)
+                )
                 row = cursor.fetchone()
                 return _row_to_entry(row) if row else None
     except psycopg2.Error as e:
@@ -219,6 +442,24 @@ def get_entry(section: Section, ref_code: str) -> Optional[Entry]:
         raise
 
 
+_LIST_ORDER_CLAUSES = {
+    "sort_order_asc": "sort_order ASC, created_at ASC",
+    "created_at_desc": "created_at DESC",
+    "created_at_asc": "created_at ASC",
+}
+
+# list_section() statement per (filters on status?, order_by), built once.
+_LIST_SECTION_SQL: Dict[Tuple[bool, str], str] = {
+    (by_status, order_by): (
+        "SELECT * FROM telos_entries WHERE section = %s"
+        + (" AND status = %s" if by_status else "")
+        + f" ORDER BY {clause} LIMIT %s;"
+    )
+    for by_status in (True, False)
+    for order_by, clause in _LIST_ORDER_CLAUSES.items()
+}
+
+
 def list_section(
     section: Section,
     *,
@@ -232,43 +473,216 @@ def list_section(
     `order_by` options: sort_order_asc (default), created_at_desc,
     created_at_asc.
     """
-    where = ["section = %s"]
-    params: List[Any] = [section.value]
+    if order_by not in _LIST_ORDER_CLAUSES:
+        order_by = "sort_order_asc"
+    sql = _LIST_SECTION_SQL[(status is not None, order_by)]
+    params: Tuple[Any, ...] = (section.value,)
+    if status is not None:
+        params += (status,)
+    # LIMIT NULL is "no limit", so one statement text covers both cases.
+    params += (int(limit) if limit is not None else None,)
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(sql, params)
+                return _fetch_entries(cursor)
+    except psycopg2.Error as e:
+        logger.error("Database error listing telos section: %s", e)
+        raise
+
+
+def list_project_tasks(
+    parent_projects: Optional[Iterable[str]] = None,
+    *,
+    status: Optional[str] = "active",
+    parent_milestone: Optional[str] = None,
+    task_status: Optional[str] = None,
+) -> List[Tuple[Entry, Optional[str]]]:
+    """List project tasks paired with their parent project's name.
+
+    The parent project is joined in the same query (name = first content
+    line), so callers rendering project names don't go back to the DB once
+    per task. `parent_projects` restricts to those project ref_codes;
+    `parent_milestone` / `task_status` match the metadata keys of the same
+    name; `status=None` returns all statuses.
+    """
+    where = ["t.section = %s"]
+    params: List[Any] = [Section.PROJECT_TASKS.value]
     if status is not None:
-        where.append("status = %s")
+        where.append("t.status = %s")
         params.append(status)
-    order_clause = {
-        "sort_order_asc": "sort_order ASC, created_at ASC",
-        "created_at_desc": "created_at DESC",
-        "created_at_asc": "created_at ASC",
-    }.get(order_by, "sort_order ASC, created_at ASC")
-
-    sql = f"SELECT * FROM telos_entries WHERE {' AND '.join(where)} ORDER BY {order_clause}"
-    if limit is not None:
-        sql += f" LIMIT {int(limit)}"
-    sql += ";"
+    if parent_projects is not None:
+        where.append("t.metadata->>'parent_project' = ANY(%s)")
+        params.append(list(parent_projects))
+    if parent_milestone is not None:
+        where.append("t.metadata->>'parent_milestone' = %s")
+        params.append(parent_milestone)
+    if task_status is not None:
+        where.append("t.metadata->>'task_status' = %s")
+        params.append(task_status)
+
+    sql = f"""
+        SELECT t.*, split_part(p.content, E'\\n', 1) AS project_name
+        FROM telos_entries t
+        LEFT JOIN telos_entries p
+          ON p.section = %s AND p.ref_code = t.metadata->>'parent_project'
+        WHERE {' AND '.join(where)}
+        ORDER BY t.sort_order ASC, t.created_at ASC;
+    """
     try:
         with get_db_connection() as conn:
             with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
-                cursor.execute(sql, tuple(params))
-                return [_row_to_entry(r) for r in cursor.fetchall()]
+                cursor.execute(sql, (Section.PROJECTS.value, *params))
+                return [
+                    (
+                        _row_to_entry(r),
+                        r["project_name"].strip() if r["project_name"] else None,
+                    )
+                    for r in cursor.fetchall()
+                ]
     except psycopg2.Error as e:
-        logger.error("Database error listing telos section: %s", e)
+        logger.error("Database error listing telos project tasks: %s", e)
+        raise
+
+
+def list_project_children(
+    ref_code: str, sections: Iterable[Section]
+) -> Dict[Section, List[Entry]]:
+    """Active entries in *sections* whose metadata.parent_project is
+    *ref_code*, grouped by section. One query for the whole project view
+    instead of a full list_section() scan per child section."""
+    sections = list(sections)
+    sql = """
+        SELECT * FROM telos_entries
+        WHERE section = ANY(%s) AND status = 'active'
+          AND metadata->>'parent_project' = %s
+        ORDER BY sort_order ASC, created_at ASC;
+    """
+    out: Dict[Section, List[Entry]] = {s: [] for s in sections}
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(sql, ([s.value for s in sections], ref_code))
+                for e in _fetch_entries(cursor):
+                    out[e.section].append(e)
+    except psycopg2.Error as e:
+        logger.error("Database error listing telos project children: %s", e)
+        raise
+    return out
+
+
+_PROJECT_COUNT_KEYS = ("milestone_count", "active_task_count", "done_task_count")
+
+
+def project_summaries() -> List[Tuple[Entry, Dict[str, int]]]:
+    """All projects (any status) paired with counts of their active
+    milestones and active/done tasks.
+
+    The counts are aggregated server-side in the same query, so rendering a
+    project list with counts doesn't pull every milestone and task row.
+    """
+    sql = """
+        WITH counts AS (
+            SELECT metadata->>'parent_project' AS parent_project,
+                   COUNT(*) FILTER (WHERE section = %s) AS milestone_count,
+                   COUNT(*) FILTER (
+                       WHERE section = %s
+                         AND metadata->>'task_status' IS DISTINCT FROM 'done'
+                   ) AS active_task_count,
+                   COUNT(*) FILTER (
+                       WHERE section = %s AND metadata->>'task_status' = 'done'
+                   ) AS done_task_count
+            FROM telos_entries
+            WHERE section IN (%s, %s) AND status = 'active'
+            GROUP BY 1
+        )
+        SELECT p.*,
+               COALESCE(c.milestone_count, 0) AS milestone_count,
+               COALESCE(c.active_task_count, 0) AS active_task_count,
+               COALESCE(c.done_task_count, 0) AS done_task_count
+        FROM telos_entries p
+        LEFT JOIN counts c ON c.parent_project = p.ref_code
+        WHERE p.section = %s
+        ORDER BY p.sort_order ASC, p.created_at ASC;
+    """
+    ms, pt = Section.MILESTONES.value, Section.PROJECT_TASKS.value
+    params = (ms, pt, pt, ms, pt, Section.PROJECTS.value)
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+                cursor.execute(sql, params)
+                return [
+                    (_row_to_entry(r), {k: r[k] for k in _PROJECT_COUNT_KEYS})
+                    for r in cursor.fetchall()
+                ]
+    except psycopg2.Error as e:
+        logger.error("Database error summarizing telos projects: %s", e)
         raise
 
 
 def archive_entry(
     section: Section, ref_code: str, reason: Optional[str] = None
 ) -> bool:
-    """Set status='archived' and stash the reason in metadata.archived_reason."""
-    meta = {"archived_reason": reason} if reason else {}
-    row = update_entry(
-        section,
-        ref_code,
-        status="archived",
-        metadata_merge=meta if meta else None,
+    """Set status='archived' and stash the reason in metadata.archived_reason.
+
+    Returns False when no row matched (not an error); raises only on DB
+    failure. Goes through update_many() so only the rowcount comes back —
+    no RETURNING row to fetch and decode into an Entry nobody reads."""
+    return archive_entries(section, [ref_code], reason=reason) > 0
+
+
+def update_many(
+    section: Section,
+    ref_codes: Iterable[str],
+    *,
+    metadata_merge: Optional[Dict[str, Any]] = None,
+    status: Optional[str] = None,
+) -> int:
+    """Apply the same shallow metadata merge and/or status change to every
+    (section, ref_code) in *ref_codes* with one `= ANY(array)` UPDATE.
+    Returns the number of rows touched."""
+    if status is not None and status not in STATUS_VALUES:
+        raise ValueError(f"invalid status {status!r}")
+    codes = list(ref_codes)
+    if not codes or (not metadata_merge and status is None):
+        return 0
+
+    sets, params, shape = _update_sets(
+        [section.value, codes], metadata_merge=metadata_merge, status=status
+    )
+    sql = f"""
+        UPDATE telos_entries SET {sets}
+        WHERE section = $1 AND ref_code = ANY($2)
+    """
+    try:
+        with get_db_connection() as conn:
+            with get_db_cursor(conn, commit=True) as cursor:
+                execute_prepared(cursor, f"telos_update_many_{shape}", sql, params)
+                updated = cursor.rowcount
+    except psycopg2.Error as e:
+        logger.error("Database error bulk-updating telos entries: %s", e)
+        raise
+    _invalidate_projects(section)
+    return updated
+
+
+def archive_entries(
+    section: Section, ref_codes: Iterable[str], reason: Optional[str] = None
+) -> int:
+    """Bulk variant of archive_entry(). Returns the number archived."""
+    meta = {"archived_reason": reason} if reason else None
+    return update_many(section, ref_codes, metadata_merge=meta, status="archived")
+
+
+def complete_tasks(ref_codes: Iterable[str]) -> int:
+    """Mark many project tasks done in one statement, stamping
+    ``completed_at`` with the current UTC time. Returns the number updated."""
+    completed_at = datetime.now(timezone.utc).isoformat()
+    return update_many(
+        Section.PROJECT_TASKS,
+        ref_codes,
+        metadata_merge={"task_status": "done", "completed_at": completed_at},
     )
-    return row is not None
 
 
 def search_journal(query: str, limit: int = 20) -> List[Entry]:
@@ -282,9 +696,9 @@ def search_journal(query: str, limit: int = 20) -> List[Entry]:
     """
     try:
         with get_db_connection() as conn:
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+            with conn.cursor() as cursor:
                 cursor.execute(sql, (like, int(limit)))
-                return [_row_to_entry(r) for r in cursor.fetchall()]
+                return _fetch_entries(cursor)
     except psycopg2.Error as e:
         logger.error("Database error searching telos journal: %s", e)
         raise
@@ -319,60 +733,134 @@ def count_active(section: Section) -> int:
 def bulk_upsert(entries: Iterable[Entry]) -> List[Entry]:
     """Atomic multi-entry insert/update. Used by the onboarding wizard and
     markdown import. Each Entry: if (section, ref_code) exists, update
-    content/metadata/status/sort_order; otherwise insert."""
-    out: List[Entry] = []
+    content/metadata/status/sort_order; otherwise insert.
+
+    Rows are sent as two multi-row statements (ref-coded upserts, then
+    ref-less inserts) via ``execute_values`` rather than one round-trip per
+    entry; loads above ``_COPY_MIN_ROWS`` are streamed with COPY instead
+    (see ``_copy_upsert``). Returns one Entry per input, in input order."""
+    entries = list(entries)
+    # ON CONFLICT can't touch the same row twice in one statement, so keep
+    # only the last occurrence of each (section, ref_code) — the same end
+    # state the old row-at-a-time loop produced.
+    keyed: Dict[Tuple[str, str], Tuple[Any, ...]] = {}
+    plain: List[Tuple[Any, ...]] = []
+    for e in entries:
+        values = (
+            e.section.value,
+            e.content,
+            _Jsonb(e.metadata or {}),
+            e.status,
+            e.sort_order,
+        )
+        if e.ref_code:
+            keyed[(e.section.value, e.ref_code)] = (e.ref_code,) + values
+        else:
+            plain.append(values)
+
+    upsert_sql = """
+        INSERT INTO telos_entries
+            (ref_code, section, content, metadata, status, sort_order)
+        VALUES %s
+        """ + _UPSERT_CONFLICT_SQL
+    # No ref_code: always insert as new (journal-style).
+    insert_sql = """
+        INSERT INTO telos_entries (section, content, metadata, status, sort_order)
+        VALUES %s
+        RETURNING *;
+    """
     try:
         with get_db_connection() as conn:
             with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
-                for e in entries:
-                    if e.ref_code:
-                        sql = """
-                            INSERT INTO telos_entries
-                                (section, ref_code, content, metadata, status, sort_order)
-                            VALUES (%s, %s, %s, %s::jsonb, %s, %s)
-                            ON CONFLICT (section, ref_code) DO UPDATE SET
-                                content = EXCLUDED.content,
-                                metadata = EXCLUDED.metadata,
-                                status = EXCLUDED.status,
-                                sort_order = EXCLUDED.sort_order,
-                                updated_at = CURRENT_TIMESTAMP
-                            RETURNING *;
-                        """
-                        cursor.execute(
-                            sql,
-                            (
-                                e.section.value,
-                                e.ref_code,
-                                e.content,
-                                json.dumps(e.metadata or {}),
-                                e.status,
-                                e.sort_order,
-                            ),
+                upserted: List[Dict[str, Any]] = []
+                inserted: List[Dict[str, Any]] = []
+                if len(keyed) + len(plain) > _COPY_MIN_ROWS:
+                    upserted, inserted = _copy_upsert(
+                        cursor, list(keyed.values()), plain
+                    )
+                else:
+                    if keyed:
+                        upserted = psycopg2.extras.execute_values(
+                            cursor,
+                            upsert_sql,
+                            list(keyed.values()),
+                            template="(%s, %s, %s, %s::jsonb, %s, %s)",
+                            page_size=_BULK_PAGE_SIZE,
+                            fetch=True,
                         )
-                    else:
-                        # No ref_code: always insert as new (journal-style).
-                        sql = """
-                            INSERT INTO telos_entries
-                                (section, content, metadata, status, sort_order)
-                            VALUES (%s, %s, %s::jsonb, %s, %s)
-                            RETURNING *;
-                        """
-                        cursor.execute(
-                            sql,
-                            (
-                                e.section.value,
-                                e.content,
-                                json.dumps(e.metadata or {}),
-                                e.status,
-                                e.sort_order,
-                            ),
+                    if plain:
+                        inserted = psycopg2.extras.execute_values(
+                            cursor,
+                            insert_sql,
+                            plain,
+                            template="(%s, %s, %s::jsonb, %s, %s)",
+                            page_size=_BULK_PAGE_SIZE,
+                            fetch=True,
                         )
-                    out.append(_row_to_entry(cursor.fetchone()))
                 conn.commit()
     except psycopg2.Error:
         logger.exception("Database error in telos bulk_upsert")
         raise
-    return out
+    _invalidate_projects(*(e.section for e in entries))
+
+    by_key = {(r["section"], r["ref_code"]): _row_to_entry(r) for r in upserted}
+    fresh = iter(_row_to_entry(r) for r in inserted)
+    return [
+        by_key[(e.section.value, e.ref_code)] if e.ref_code else next(fresh)
+        for e in entries
+    ]
+
+
+def _copy_upsert(
+    cursor, keyed: List[Tuple[Any, ...]], plain: List[Tuple[Any, ...]]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """COPY-based path for large bulk_upsert() loads.
+
+    COPY can't upsert or return rows, so everything is streamed into a
+    transaction-scoped temp table first, then moved across with two
+    INSERT ... SELECT statements ordered by input position.
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for ord_, row in enumerate([*keyed, *((None,) + v for v in plain)]):
+        ref_code, section, content, metadata, status, sort_order = row
+        writer.writerow(
+            (
+                ord_,
+                ref_code,
+                section,
+                content,
+                metadata.dumps(metadata.adapted),
+                status,
+                sort_order,
+            )
+        )
+    buf.seek(0)
+
+    cursor.execute("""
+        CREATE TEMP TABLE telos_import (
+            ord INTEGER, ref_code TEXT, section TEXT, content TEXT,
+            metadata JSONB, status TEXT, sort_order INTEGER
+        ) ON COMMIT DROP;
+        """)
+    # FORCE_NOT_NULL keeps empty strings from being read back as NULL.
+    cursor.copy_expert(
+        "COPY telos_import FROM STDIN "
+        "WITH (FORMAT csv, FORCE_NOT_NULL (section, content, status))",
+        buf,
+    )
+    columns = "ref_code, section, content, metadata, status, sort_order"
+    cursor.execute(
+        f"INSERT INTO telos_entries ({columns}) SELECT {columns} FROM telos_import "
+        "WHERE ref_code IS NOT NULL ORDER BY ord" + _UPSERT_CONFLICT_SQL
+    )
+    upserted = cursor.fetchall()
+    cursor.execute(f"""
+        INSERT INTO telos_entries ({columns}) SELECT {columns} FROM telos_import
+        WHERE ref_code IS NULL ORDER BY ord
+        RETURNING *;
+        """)
+    return upserted, cursor.fetchall()
 
 
 def reset_all(section: Optional[Section] = None) -> int:
@@ -388,10 +876,13 @@ def reset_all(section: Optional[Section] = None) -> int:
         with get_db_connection() as conn:
             with get_db_cursor(conn, commit=True) as cursor:
                 cursor.execute(sql, params)
-                return cursor.rowcount
+                deleted = cursor.rowcount
     except psycopg2.Error as e:
         logger.error("Database error resetting telos entries: %s", e)
         raise
+    clear_project_id_cache()
+    _invalidate_projects(section)
+    return deleted
 
 
 def list_all_active() -> Dict[Section, List[Entry]]:
@@ -404,10 +895,9 @@ def list_all_active() -> Dict[Section, List[Entry]]:
     out: Dict[Section, List[Entry]] = {s: [] for s in Section}
     try:
         with get_db_connection() as conn:
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+            with conn.cursor() as cursor:
                 cursor.execute(sql)
-                for row in cursor.fetchall():
-                    e = _row_to_entry(row)
+                for e in _fetch_entries(cursor):
                     out[e.section].append(e)
     except psycopg2.Error as e:
         logger.error("Database error listing all telos entries: %s", e)
@@ -423,9 +913,9 @@ def list_all() -> List[Entry]:
     """
     try:
         with get_db_connection() as conn:
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+            with conn.cursor() as cursor:
                 cursor.execute(sql)
-                return [_row_to_entry(r) for r in cursor.fetchall()]
+                return _fetch_entries(cursor)
     except psycopg2.Error as e:
         logger.error("Database error listing all telos entries: %s", e)
         raise
@@ -119,13 +119,16 @@ NEVER_ALWAYS_LOADED: set[Section] = {
 }
 
 # Valid status values.
-STATUS_VALUES: set[str] = {"active", "completed", "archived", "superseded"}
+STATUS_VALUES: frozenset[str] = frozenset(
+    {"active", "completed", "archived", "superseded"}
+)
 
 # Single identity ref_code (there's only one user).
 IDENTITY_REF = "ME"
 
 
-@dataclass
+# slots: list/import paths hold thousands of these; no per-instance __dict__.
+@dataclass(slots=True)
 class Entry:
     entry_id: Optional[str] = None  # UUID string, None until DB-assigned
     section: Section = Section.JOURNAL
@@ -137,6 +140,20 @@ class Entry:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready dict form, shared by the agent tools and the REST API."""
+        return {
+            "entry_id": self.entry_id,
+            "section": self.section.value,
+            "ref_code": self.ref_code,
+            "content": self.content,
+            "metadata": self.metadata,
+            "status": self.status,
+            "sort_order": self.sort_order,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
     def to_markdown_bullet(self) -> str:
         """Render one entry as a markdown bullet line."""
         prefix = f"- {self.ref_code}: " if self.ref_code else "- "
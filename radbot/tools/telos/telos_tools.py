@@ -11,16 +11,14 @@ they're asked.
 from __future__ import annotations
 
 import logging
-import traceback
 from typing import Any, Dict, List, Optional
 
-from google.adk.tools import FunctionTool
-
-from radbot.tools.shared.errors import truncate_error
+from radbot.tools.shared.errors import exception_text, truncate_error
+from radbot.tools.shared.function_tool import CachedFunctionTool
 
 from . import db as telos_db
 from .markdown_io import parse_telos_markdown, render_telos_markdown
-from .models import IDENTITY_REF, STATUS_VALUES, Entry, Section
+from .models import IDENTITY_REF, STATUS_VALUES, Section
 
 logger = logging.getLogger(__name__)
 
@@ -41,27 +39,13 @@ def _section_or_error(section: str):
         }
 
 
-def _serialize_entry(entry: Entry) -> Dict[str, Any]:
-    return {
-        "entry_id": entry.entry_id,
-        "section": entry.section.value,
-        "ref_code": entry.ref_code,
-        "content": entry.content,
-        "metadata": entry.metadata,
-        "status": entry.status,
-        "sort_order": entry.sort_order,
-        "created_at": entry.created_at.isoformat() if entry.created_at else None,
-        "updated_at": entry.updated_at.isoformat() if entry.updated_at else None,
-    }
-
-
 def _wrap(label: str, fn, *args, **kwargs) -> Dict[str, Any]:
     try:
         return fn(*args, **kwargs)
     except Exception as e:
-        msg = f"Failed to {label}: {e}"
+        msg = f"Failed to {label}: {exception_text(e)}"
         logger.error(msg)
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
         return {"status": "error", "message": truncate_error(msg)}
 
 
@@ -98,7 +82,7 @@ def telos_get_section(section: str, include_inactive: bool = False) -> Dict[str,
         return {
             "status": "success",
             "section": sec.value,
-            "entries": [_serialize_entry(e) for e in entries],
+            "entries": [e.to_dict() for e in entries],
         }
 
     return _wrap(f"list section {section}", _do)
@@ -121,7 +105,7 @@ def telos_get_entry(section: str, ref_code: str) -> Dict[str, Any]:
                 "status": "error",
                 "message": f"No entry {ref_code} in {sec.value}.",
             }
-        return {"status": "success", "entry": _serialize_entry(entry)}
+        return {"status": "success", "entry": entry.to_dict()}
 
     return _wrap(f"get entry {section}:{ref_code}", _do)
 
@@ -154,7 +138,7 @@ def telos_search_journal(query: str, limit: int = 20) -> Dict[str, Any]:
         rows = telos_db.search_journal(query, limit=limit)
         return {
             "status": "success",
-            "entries": [_serialize_entry(e) for e in rows],
+            "entries": [e.to_dict() for e in rows],
         }
 
     return _wrap("search journal", _do)
@@ -189,7 +173,7 @@ def telos_add_journal(
         if related_refs:
             metadata["related_refs"] = list(related_refs)
         row = telos_db.add_entry(Section.JOURNAL, entry, metadata=metadata)
-        return {"status": "success", "entry": _serialize_entry(row)}
+        return {"status": "success", "entry": row.to_dict()}
 
     return _wrap("add journal", _do)
 
@@ -221,7 +205,7 @@ def telos_add_prediction(
         if deadline:
             metadata["deadline"] = deadline
         row = telos_db.add_entry(Section.PREDICTIONS, claim, metadata=metadata)
-        return {"status": "success", "entry": _serialize_entry(row)}
+        return {"status": "success", "entry": row.to_dict()}
 
     return _wrap("add prediction", _do)
 
@@ -279,7 +263,7 @@ def telos_resolve_prediction(
 
         return {
             "status": "success",
-            "entry": _serialize_entry(updated) if updated else None,
+            "entry": updated.to_dict() if updated else None,
             "miscalibrated": miscalibrated,
         }
 
@@ -300,7 +284,7 @@ def telos_note_wrong(thing: str, why: str = "") -> Dict[str, Any]:
     def _do():
         content = thing if not why else f"{thing} — {why}"
         row = telos_db.add_entry(Section.WRONG_ABOUT, content)
-        return {"status": "success", "entry": _serialize_entry(row)}
+        return {"status": "success", "entry": row.to_dict()}
 
     return _wrap("note wrong", _do)
 
@@ -333,7 +317,7 @@ def telos_note_taste(
             "music": Section.BEST_MUSIC,
         }.get(category, Section.TASTE)
         row = telos_db.add_entry(target_section, item, metadata=metadata)
-        return {"status": "success", "entry": _serialize_entry(row)}
+        return {"status": "success", "entry": row.to_dict()}
 
     return _wrap("note taste", _do)
 
@@ -352,7 +336,7 @@ def telos_add_wisdom(principle: str, origin: str = "") -> Dict[str, Any]:
     def _do():
         metadata = {"origin": origin} if origin else {}
         row = telos_db.add_entry(Section.WISDOM, principle, metadata=metadata)
-        return {"status": "success", "entry": _serialize_entry(row)}
+        return {"status": "success", "entry": row.to_dict()}
 
     return _wrap("add wisdom", _do)
 
@@ -365,7 +349,7 @@ def telos_add_idea(idea: str) -> Dict[str, Any]:
 
     def _do():
         row = telos_db.add_entry(Section.IDEAS, idea)
-        return {"status": "success", "entry": _serialize_entry(row)}
+        return {"status": "success", "entry": row.to_dict()}
 
     return _wrap("add idea", _do)
 
@@ -409,7 +393,7 @@ def telos_upsert_identity(
         row = telos_db.upsert_singleton(
             Section.IDENTITY, IDENTITY_REF, content, metadata
         )
-        return {"status": "success", "entry": _serialize_entry(row)}
+        return {"status": "success", "entry": row.to_dict()}
 
     return _wrap("upsert identity", _do)
 
@@ -442,7 +426,7 @@ def telos_add_entry(
             ref_code=ref_code or None,
             metadata=metadata or {},
         )
-        return {"status": "success", "entry": _serialize_entry(row)}
+        return {"status": "success", "entry": row.to_dict()}
 
     return _wrap(f"add {section}", _do)
 
@@ -489,7 +473,7 @@ def telos_update_entry(
                 "status": "error",
                 "message": f"No entry {ref_code} in {sec.value}.",
             }
-        return {"status": "success", "entry": _serialize_entry(row)}
+        return {"status": "success", "entry": row.to_dict()}
 
     return _wrap(f"update {section}:{ref_code}", _do)
 
@@ -515,7 +499,7 @@ def telos_add_goal(
             if v
         }
         row = telos_db.add_entry(Section.GOALS, title, metadata=metadata)
-        return {"status": "success", "entry": _serialize_entry(row)}
+        return {"status": "success", "entry": row.to_dict()}
 
     return _wrap("add goal", _do)
 
@@ -546,7 +530,7 @@ def telos_complete_goal(ref_code: str, resolution: str = "") -> Dict[str, Any]:
             journal_body,
             metadata={"event_type": "goal_completed", "related_refs": [ref_code]},
         )
-        return {"status": "success", "entry": _serialize_entry(updated)}
+        return {"status": "success", "entry": updated.to_dict()}
 
     return _wrap(f"complete goal {ref_code}", _do)
 
@@ -660,18 +644,18 @@ def telos_import_markdown(markdown_text: str, replace: bool = False) -> Dict[str
 # Project-task tools (replace the deprecated tools/todo module)
 # ---------------------------------------------------------------------------
 
-_VALID_TASK_STATUSES = {"backlog", "inprogress", "done"}
+_VALID_TASK_STATUSES = frozenset({"backlog", "inprogress", "done"})
 
 
 def _require_project(ref_code: str):
-    """Return (entry, None) if the project exists; else (None, error_dict)."""
-    project = telos_db.get_entry(Section.PROJECTS, ref_code)
-    if not project:
+    """Return (entry_id, None) if the project exists; else (None, error_dict)."""
+    project_id = telos_db.resolve_project_id(ref_code)
+    if not project_id:
         return None, {
             "status": "error",
             "message": f"No project {ref_code}. Use telos_list_projects first.",
         }
-    return project, None
+    return project_id, None
 
 
 def telos_list_projects() -> Dict[str, Any]:
@@ -681,7 +665,7 @@ def telos_list_projects() -> Dict[str, Any]:
     """
 
     def _do():
-        rows = telos_db.list_section(Section.PROJECTS, status="active")
+        rows = telos_db.list_active_projects()
         out = []
         for p in rows:
             name = (p.content or "").splitlines()[0].strip()
@@ -709,7 +693,7 @@ def telos_get_project(ref_or_name: str) -> Dict[str, Any]:
         needle = ref_or_name.strip()
         project = telos_db.get_entry(Section.PROJECTS, needle)
         if project is None:
-            for p in telos_db.list_section(Section.PROJECTS, status="active"):
+            for p in telos_db.list_active_projects():
                 first = (p.content or "").splitlines()[0].lower()
                 if needle.lower() in first:
                     project = p
@@ -717,32 +701,31 @@ def telos_get_project(ref_or_name: str) -> Dict[str, Any]:
         if project is None:
             return {"status": "error", "message": f"Unknown project: {ref_or_name!r}."}
 
-        ref = project.ref_code
+        children = telos_db.list_project_children(
+            project.ref_code,
+            (
+                Section.MILESTONES,
+                Section.PROJECT_TASKS,
+                Section.EXPLORATIONS,
+                Section.GOALS,
+            ),
+        )
 
         def _children(section: Section):
-            return [
-                _serialize_entry(e)
-                for e in telos_db.list_section(section, status="active")
-                if (e.metadata or {}).get("parent_project") == ref
-            ]
+            return [e.to_dict() for e in children[section]]
 
-        tasks = _children(Section.PROJECT_TASKS)
         grouped: Dict[str, list] = {"backlog": [], "inprogress": [], "done": []}
-        for t in tasks:
+        for t in _children(Section.PROJECT_TASKS):
             status_key = (t.get("metadata") or {}).get("task_status") or "backlog"
             grouped.setdefault(status_key, []).append(t)
 
         return {
             "status": "success",
-            "project": _serialize_entry(project),
+            "project": project.to_dict(),
             "milestones": _children(Section.MILESTONES),
             "tasks": grouped,
             "explorations": _children(Section.EXPLORATIONS),
-            "goals": [
-                _serialize_entry(g)
-                for g in telos_db.list_section(Section.GOALS, status="active")
-                if (g.metadata or {}).get("parent_project") == ref
-            ],
+            "goals": _children(Section.GOALS),
         }
 
     return _wrap(f"get project {ref_or_name}", _do)
@@ -773,7 +756,7 @@ def telos_add_milestone(
         if deadline:
             metadata["deadline"] = deadline
         row = telos_db.add_entry(Section.MILESTONES, content, metadata=metadata)
-        return {"status": "success", "entry": _serialize_entry(row)}
+        return {"status": "success", "entry": row.to_dict()}
 
     return _wrap("add milestone", _do)
 
@@ -793,7 +776,7 @@ def telos_complete_milestone(ref_code: str, resolution: str = "") -> Dict[str, A
         )
         if not row:
             return {"status": "error", "message": f"No milestone {ref_code}."}
-        return {"status": "success", "entry": _serialize_entry(row)}
+        return {"status": "success", "entry": row.to_dict()}
 
     return _wrap(f"complete milestone {ref_code}", _do)
 
@@ -831,8 +814,7 @@ def telos_add_task(
         if err:
             return err
         if parent_milestone:
-            ms = telos_db.get_entry(Section.MILESTONES, parent_milestone)
-            if not ms:
+            if not telos_db.resolve_entry_id(Section.MILESTONES, parent_milestone):
                 return {
                     "status": "error",
                     "message": f"No milestone {parent_milestone}.",
@@ -848,7 +830,7 @@ def telos_add_task(
         if category:
             metadata["category"] = category
         row = telos_db.add_entry(Section.PROJECT_TASKS, description, metadata=metadata)
-        return {"status": "success", "entry": _serialize_entry(row)}
+        return {"status": "success", "entry": row.to_dict()}
 
     return _wrap("add task", _do)
 
@@ -860,23 +842,25 @@ def telos_list_tasks(
     include_inactive: bool = False,
 ) -> Dict[str, Any]:
     """List project tasks, optionally filtered by parent project, milestone,
-    and/or kanban status."""
+    and/or kanban status. Each entry carries its parent's project_name."""
+    if task_status and task_status not in _VALID_TASK_STATUSES:
+        return {
+            "status": "error",
+            "message": (
+                f"invalid task_status {task_status!r}. "
+                f"Valid: {sorted(_VALID_TASK_STATUSES)}."
+            ),
+        }
 
     def _do():
         status = None if include_inactive else "active"
-        rows = telos_db.list_section(
-            Section.PROJECT_TASKS, status=status, order_by="sort_order_asc"
+        rows = telos_db.list_project_tasks(
+            [parent_project] if parent_project else None,
+            status=status,
+            parent_milestone=parent_milestone or None,
+            task_status=task_status or None,
         )
-        out = []
-        for r in rows:
-            meta = r.metadata or {}
-            if parent_project and meta.get("parent_project") != parent_project:
-                continue
-            if parent_milestone and meta.get("parent_milestone") != parent_milestone:
-                continue
-            if task_status and meta.get("task_status") != task_status:
-                continue
-            out.append(_serialize_entry(r))
+        out = [{**r.to_dict(), "project_name": name} for r, name in rows]
         return {"status": "success", "entries": out}
 
     return _wrap("list tasks", _do)
@@ -895,7 +879,7 @@ def telos_complete_task(ref_code: str) -> Dict[str, Any]:
         )
         if not row:
             return {"status": "error", "message": f"No task {ref_code}."}
-        return {"status": "success", "entry": _serialize_entry(row)}
+        return {"status": "success", "entry": row.to_dict()}
 
     return _wrap(f"complete task {ref_code}", _do)
 
@@ -936,7 +920,7 @@ def telos_add_exploration(
             content,
             metadata={"parent_project": parent_project},
         )
-        return {"status": "success", "entry": _serialize_entry(row)}
+        return {"status": "success", "entry": row.to_dict()}
 
     return _wrap("add exploration", _do)
 
@@ -957,40 +941,40 @@ def _now_iso() -> str:
 # ---------------------------------------------------------------------------
 
 # Read tools
-telos_get_section_tool = FunctionTool(telos_get_section)
-telos_get_entry_tool = FunctionTool(telos_get_entry)
-telos_get_full_tool = FunctionTool(telos_get_full)
-telos_search_journal_tool = FunctionTool(telos_search_journal)
+telos_get_section_tool = CachedFunctionTool(telos_get_section)
+telos_get_entry_tool = CachedFunctionTool(telos_get_entry)
+telos_get_full_tool = CachedFunctionTool(telos_get_full)
+telos_search_journal_tool = CachedFunctionTool(telos_search_journal)
 
 # Silent-update tools
-telos_add_journal_tool = FunctionTool(telos_add_journal)
-telos_add_prediction_tool = FunctionTool(telos_add_prediction)
-telos_resolve_prediction_tool = FunctionTool(telos_resolve_prediction)
-telos_note_wrong_tool = FunctionTool(telos_note_wrong)
-telos_note_taste_tool = FunctionTool(telos_note_taste)
-telos_add_wisdom_tool = FunctionTool(telos_add_wisdom)
-telos_add_idea_tool = FunctionTool(telos_add_idea)
+telos_add_journal_tool = CachedFunctionTool(telos_add_journal)
+telos_add_prediction_tool = CachedFunctionTool(telos_add_prediction)
+telos_resolve_prediction_tool = CachedFunctionTool(telos_resolve_prediction)
+telos_note_wrong_tool = CachedFunctionTool(telos_note_wrong)
+telos_note_taste_tool = CachedFunctionTool(telos_note_taste)
+telos_add_wisdom_tool = CachedFunctionTool(telos_add_wisdom)
+telos_add_idea_tool = CachedFunctionTool(telos_add_idea)
 
 # Confirm-required tools
-telos_upsert_identity_tool = FunctionTool(telos_upsert_identity)
-telos_add_entry_tool = FunctionTool(telos_add_entry)
-telos_update_entry_tool = FunctionTool(telos_update_entry)
-telos_add_goal_tool = FunctionTool(telos_add_goal)
-telos_complete_goal_tool = FunctionTool(telos_complete_goal)
-telos_archive_tool = FunctionTool(telos_archive)
-telos_delete_entry_tool = FunctionTool(telos_delete_entry)
-telos_import_markdown_tool = FunctionTool(telos_import_markdown)
+telos_upsert_identity_tool = CachedFunctionTool(telos_upsert_identity)
+telos_add_entry_tool = CachedFunctionTool(telos_add_entry)
+telos_update_entry_tool = CachedFunctionTool(telos_update_entry)
+telos_add_goal_tool = CachedFunctionTool(telos_add_goal)
+telos_complete_goal_tool = CachedFunctionTool(telos_complete_goal)
+telos_archive_tool = CachedFunctionTool(telos_archive)
+telos_delete_entry_tool = CachedFunctionTool(telos_delete_entry)
+telos_import_markdown_tool = CachedFunctionTool(telos_import_markdown)
 
 # Project hierarchy tools (replace the deprecated tools/todo module)
-telos_list_projects_tool = FunctionTool(telos_list_projects)
-telos_get_project_tool = FunctionTool(telos_get_project)
-telos_add_milestone_tool = FunctionTool(telos_add_milestone)
-telos_complete_milestone_tool = FunctionTool(telos_complete_milestone)
-telos_add_task_tool = FunctionTool(telos_add_task)
-telos_list_tasks_tool = FunctionTool(telos_list_tasks)
-telos_complete_task_tool = FunctionTool(telos_complete_task)
-telos_archive_task_tool = FunctionTool(telos_archive_task)
-telos_add_exploration_tool = FunctionTool(telos_add_exploration)
+telos_list_projects_tool = CachedFunctionTool(telos_list_projects)
+telos_get_project_tool = CachedFunctionTool(telos_get_project)
+telos_add_milestone_tool = CachedFunctionTool(telos_add_milestone)
+telos_complete_milestone_tool = CachedFunctionTool(telos_complete_milestone)
+telos_add_task_tool = CachedFunctionTool(telos_add_task)
+telos_list_tasks_tool = CachedFunctionTool(telos_list_tasks)
+telos_complete_task_tool = CachedFunctionTool(telos_complete_task)
+telos_archive_task_tool = CachedFunctionTool(telos_archive_task)
+telos_add_exploration_tool = CachedFunctionTool(telos_add_exploration)
 
 
 TELOS_TOOLS = [
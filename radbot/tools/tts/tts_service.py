@@ -8,27 +8,144 @@ so no Application Default Credentials are needed.
 """
 
 import base64
-import hashlib
+import functools
 import json
 import logging
 import re
+import threading
 from collections import OrderedDict
-from typing import Optional
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from typing import Optional, Tuple
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+# orjson is optional: when present it encodes straight to bytes and is
+# several times faster than the stdlib. Both loaders accept bytes.
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
 # Singleton
 _instance: Optional["TTSService"] = None
+_instance_lock = threading.Lock()
 
 # REST endpoints for Google Cloud TTS
 TTS_API_URL = "https://texttospeech.googleapis.com/v1/text:synthesize"
 TTS_API_URL_BETA = "https://texttospeech.googleapis.com/v1beta1/text:synthesize"
 
+# Shared keep-alive session: successive syntheses reuse the pooled TLS
+# connection to the TTS endpoint instead of a fresh handshake per call.
+# Only connection failures are retried; a POST that reached the API is not.
+_http = requests.Session()
+_http.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=2))
+
+# Async counterpart, created lazily on first use inside the event loop.
+_async_http: Optional[httpx.AsyncClient] = None
+
+
+def _get_async_http() -> httpx.AsyncClient:
+    global _async_http
+    if _async_http is None or _async_http.is_closed:
+        _async_http = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+            transport=httpx.AsyncHTTPTransport(retries=2),
+        )
+    return _async_http
+
+
 # Voice prefixes that require the v1beta1 endpoint
 _BETA_VOICE_PREFIXES = ("Chirp", "chirp")
 
+# clean_text() patterns, compiled once.
+_RE_CODE_BLOCK = re.compile(r"```[\s\S]*?```")
+_RE_INLINE_CODE = re.compile(r"`[^`]+`")
+_RE_HTML_TAG = re.compile(r"<[^>]+>")
+_RE_HEADER = re.compile(r"^#{1,6}\s+", re.MULTILINE)
+_RE_BOLD_ITALIC_STAR = re.compile(r"\*{1,3}([^*]+)\*{1,3}")
+_RE_BOLD_ITALIC_UNDERSCORE = re.compile(r"_{1,3}([^_]+)_{1,3}")
+# Images ![alt](url) and links [text](url) -> alt / text, in one pass.
+_RE_IMAGE_OR_LINK = re.compile(r"!\[([^\]]*)\]\([^)]+\)|\[([^\]]+)\]\([^)]+\)")
+# Horizontal rules and bullet markers, stripped in one pass.
+_RE_RULE_OR_BULLET = re.compile(r"^(?:[-*_]{3,}\s*$|\s*[-*+]\s+)", re.MULTILINE)
+# Numbered-list prefixes. Kept as its own pass: its \s+ may run across a
+# newline, and the sequential order lets a bullet removed above expose one.
+_RE_NUMBERED = re.compile(r"^\s*\d+\.\s+", re.MULTILINE)
+_RE_WHITESPACE = re.compile(r"\s+")
+
+# The base64 audio blob in a synthesize response. Base64 never needs JSON
+# escaping, so when this matches the span can be decoded in place.
+_RE_AUDIO_CONTENT = re.compile(rb'"audioContent"\s*:\s*"([A-Za-z0-9+/=]*)"')
+
+
+def _decode_audio_content(raw: bytes) -> bytes:
+    """Return the decoded ``audioContent`` of a raw synthesize response.
+
+    The blob (hundreds of KB for long replies) is decoded straight from a
+    view of the response bytes, skipping the str that a full JSON parse
+    would materialize. Anything unexpected falls back to the parser.
+    """
+    m = _RE_AUDIO_CONTENT.search(raw)
+    if m and m.end(1) > m.start(1):
+        return base64.b64decode(memoryview(raw)[m.start(1) : m.end(1)])
+    audio_content_b64 = _json_loads(raw).get("audioContent")
+    if not audio_content_b64:
+        raise RuntimeError("TTS API returned no audio content")
+    return base64.b64decode(audio_content_b64)
+
+
+# (cleaned text, voice, language, rate, pitch)
+_CacheKey = Tuple[str, str, str, float, float]
+
+
+class _AudioCache:
+    """LRU of synthesized MP3 blobs, bounded by entry count and total bytes.
+
+    A long reply's MP3 runs to hundreds of KB, so a count-only bound let
+    the cache grow to tens of MB. The byte total lives on this object so
+    per-request service copies (see web/api/tts.py) share it with the
+    singleton.
+    """
+
+    def __init__(self, max_items: int, max_bytes: int):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._data: OrderedDict[_CacheKey, bytes] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: _CacheKey) -> Optional[bytes]:
+        audio = self._data.get(key)
+        if audio is not None:
+            self._data.move_to_end(key)
+        return audio
+
+    def put(self, key: _CacheKey, audio: bytes) -> None:
+        old = self._data.pop(key, None)
+        if old is not None:
+            self.nbytes -= len(old)
+        self._data[key] = audio
+        self.nbytes += len(audio)
+        # Always keep the newest entry, even if it alone exceeds max_bytes.
+        while len(self._data) > 1 and (
+            len(self._data) > self.max_items or self.nbytes > self.max_bytes
+        ):
+            _, evicted = self._data.popitem(last=False)
+            self.nbytes -= len(evicted)
+
 
 class TTSService:
     """Google Cloud TTS wrapper using REST API with API key auth."""
@@ -38,7 +155,9 @@ class TTSService:
     DEFAULT_SPEAKING_RATE = 1.0
     DEFAULT_PITCH = 0.0
     MAX_TEXT_LENGTH = 5000
+    CLEAN_HEADROOM = 4
     CACHE_MAX_SIZE = 100
+    CACHE_MAX_BYTES = 32 * 1024 * 1024
 
     def __init__(
         self,
@@ -55,7 +174,7 @@ class TTSService:
         )
         self.pitch = pitch if pitch is not None else self.DEFAULT_PITCH
         self._api_key = api_key
-        self._cache: OrderedDict[str, bytes] = OrderedDict()
+        self._cache = _AudioCache(self.CACHE_MAX_SIZE, self.CACHE_MAX_BYTES)
 
     @classmethod
     def get_instance(cls) -> Optional["TTSService"]:
@@ -64,9 +183,14 @@ class TTSService:
     @classmethod
     def create_instance(cls, **kwargs) -> "TTSService":
         global _instance
-        if _instance is None:
-            _instance = cls(**kwargs)
-        return _instance
+        if _instance is not None:
+            return _instance
+        # Double-checked: concurrent first requests must not each build a
+        # service, or they'd split the audio cache between them.
+        with _instance_lock:
+            if _instance is None:
+                _instance = cls(**kwargs)
+            return _instance
 
     def _get_api_key(self) -> str:
         """Get the Google API key, resolving lazily from config if needed."""
@@ -94,52 +218,58 @@ class TTSService:
     def clean_text(text: str) -> str:
         """Strip markdown, HTML tags, and code blocks from text for cleaner speech."""
         # Remove code blocks (``` ... ```)
-        text = re.sub(r"```[\s\S]*?```", " code block omitted ", text)
+        text = _RE_CODE_BLOCK.sub(" code block omitted ", text)
         # Remove inline code (`...`)
-        text = re.sub(r"`[^`]+`", "", text)
+        text = _RE_INLINE_CODE.sub("", text)
         # Remove HTML tags
-        text = re.sub(r"<[^>]+>", "", text)
+        text = _RE_HTML_TAG.sub("", text)
         # Remove markdown headers (# ## ### etc.)
-        text = re.sub(r"^#{1,6}\s+", "", text, flags=re.MULTILINE)
+        text = _RE_HEADER.sub("", text)
         # Remove markdown bold/italic markers
-        text = re.sub(r"\*{1,3}([^*]+)\*{1,3}", r"\1", text)
-        text = re.sub(r"_{1,3}([^_]+)_{1,3}", r"\1", text)
-        # Remove markdown links [text](url)
-        text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
-        # Remove markdown images ![alt](url)
-        text = re.sub(r"!\[([^\]]*)\]\([^)]+\)", r"\1", text)
-        # Remove horizontal rules
-        text = re.sub(r"^[-*_]{3,}\s*$", "", text, flags=re.MULTILINE)
-        # Remove bullet points
-        text = re.sub(r"^\s*[-*+]\s+", "", text, flags=re.MULTILINE)
+        text = _RE_BOLD_ITALIC_STAR.sub(r"\1", text)
+        text = _RE_BOLD_ITALIC_UNDERSCORE.sub(r"\1", text)
+        # Replace markdown images/links with their alt/link text
+        text = _RE_IMAGE_OR_LINK.sub(lambda m: m.group(1) or m.group(2) or "", text)
+        # Remove horizontal rules and bullet points
+        text = _RE_RULE_OR_BULLET.sub("", text)
         # Remove numbered lists prefix
-        text = re.sub(r"^\s*\d+\.\s+", "", text, flags=re.MULTILINE)
+        text = _RE_NUMBERED.sub("", text)
         # Collapse multiple whitespace/newlines
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
-
-    def _cache_key(self, text: str) -> str:
-        """Create a cache key from text + voice config."""
-        raw = f"{text}|{self.voice_name}|{self.language_code}|{self.speaking_rate}|{self.pitch}"
-        return hashlib.sha256(raw.encode()).hexdigest()
+        return _RE_WHITESPACE.sub(" ", text).strip()
 
-    def synthesize(self, text: str) -> bytes:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _clean_cached(text: str) -> str:
+        """clean_text() memoized on the raw input, so repeated prompts (replays
+        from the web UI) skip the regex pipeline before the audio cache probe."""
+        return TTSService.clean_text(text)
+
+    def _cache_key(self, text: str) -> _CacheKey:
+        """Create a cache key from text + voice config.
+
+        The key never leaves the process, so the plain tuple is used as-is:
+        the text's hash is computed once and cached on the str, where a
+        digest re-hashed the whole formatted string on every lookup.
         """
-        Synthesize text to MP3 audio bytes via the REST API.
-
-        Text is cleaned and truncated before synthesis.
-        Results are cached in an in-memory LRU cache.
-
-        Args:
-            text: The raw text (may include markdown/HTML).
+        return (
+            text,
+            self.voice_name,
+            self.language_code,
+            self.speaking_rate,
+            self.pitch,
+        )
 
-        Returns:
-            MP3 audio bytes.
+    def _prepare(self, text: str) -> tuple[str, _CacheKey, Optional[bytes]]:
+        """Clean/truncate ``text`` and probe the cache.
 
-        Raises:
-            Exception if API key is missing or synthesis fails.
+        Returns ``(cleaned, cache_key, cached_audio_or_None)``.
         """
-        cleaned = self.clean_text(text)
+        # Bound the regex work (and the memo's footprint) on huge inputs;
+        # the headroom covers markup that cleaning strips away.
+        raw_limit = self.MAX_TEXT_LENGTH * self.CLEAN_HEADROOM
+        if len(text) > raw_limit:
+            text = text[:raw_limit]
+        cleaned = self._clean_cached(text)
         if not cleaned:
             raise ValueError("No speakable text after cleaning")
 
@@ -150,12 +280,13 @@ class TTSService:
 
         # Check cache
         key = self._cache_key(cleaned)
-        if key in self._cache:
-            self._cache.move_to_end(key)
+        audio = self._cache.get(key)
+        if audio is not None:
             logger.debug("TTS cache hit")
-            return self._cache[key]
+        return cleaned, key, audio
 
-        # Build REST API request
+    def _build_request(self, cleaned: str) -> tuple[str, bytes]:
+        """Return the ``(url, body)`` of the REST synthesize request."""
         api_key = self._get_api_key()
 
         # Chirp3-HD and other newer voices require the v1beta1 endpoint
@@ -177,39 +308,79 @@ class TTSService:
             },
             "audioConfig": audio_config,
         }
-
-        request_body = json.dumps(payload).encode("utf-8")
-        req = Request(
-            url,
-            data=request_body,
-            headers={"Content-Type": "application/json"},
-            method="POST",
+        return url, _json_dumps(payload)
+
+    def _finish(
+        self, cleaned: str, key: _CacheKey, status_code: int, raw: bytes
+    ) -> bytes:
+        """Check the API status, decode the audio and cache it."""
+        if not 200 <= status_code < 300:
+            error_body = raw.decode("utf-8", errors="replace")
+            logger.error(f"TTS API HTTP error {status_code}: {error_body}")
+            raise RuntimeError(f"TTS API error ({status_code}): {error_body}")
+
+        audio_bytes = _decode_audio_content(raw)
+        logger.info(
+            f"TTS synthesized {len(audio_bytes)} bytes for {len(cleaned)} chars"
         )
 
+        self._cache.put(key, audio_bytes)
+        return audio_bytes
+
+    def synthesize(self, text: str) -> bytes:
+        """
+        Synthesize text to MP3 audio bytes via the REST API.
+
+        Text is cleaned and truncated before synthesis.
+        Results are cached in an in-memory LRU cache.
+
+        Args:
+            text: The raw text (may include markdown/HTML).
+
+        Returns:
+            MP3 audio bytes.
+
+        Raises:
+            Exception if API key is missing or synthesis fails.
+        """
+        cleaned, key, cached = self._prepare(text)
+        if cached is not None:
+            return cached
+
+        url, body = self._build_request(cleaned)
         try:
-            with urlopen(req, timeout=30) as resp:
-                response_data = json.loads(resp.read().decode("utf-8"))
-        except HTTPError as e:
-            error_body = e.read().decode("utf-8", errors="replace")
-            logger.error(f"TTS API HTTP error {e.code}: {error_body}")
-            raise RuntimeError(f"TTS API error ({e.code}): {error_body}") from e
-        except URLError as e:
+            resp = _http.post(
+                url,
+                data=body,
+                headers={"Content-Type": "application/json"},
+                timeout=30,
+            )
+        except requests.RequestException as e:
             logger.error(f"TTS API connection error: {e}")
             raise RuntimeError(f"TTS API connection error: {e}") from e
+        return self._finish(cleaned, key, resp.status_code, resp.content)
 
-        # Decode base64 audio content
-        audio_content_b64 = response_data.get("audioContent")
-        if not audio_content_b64:
-            raise RuntimeError("TTS API returned no audio content")
-
-        audio_bytes = base64.b64decode(audio_content_b64)
-        logger.info(
-            f"TTS synthesized {len(audio_bytes)} bytes for {len(cleaned)} chars"
-        )
+    async def synthesize_async(self, text: str) -> bytes:
+        """
+        Async counterpart of :meth:`synthesize`.
 
-        # Cache (LRU eviction)
-        self._cache[key] = audio_bytes
-        if len(self._cache) > self.CACHE_MAX_SIZE:
-            self._cache.popitem(last=False)
+        Awaits the API call on a shared ``httpx.AsyncClient`` instead of
+        blocking the event loop, so concurrent requests overlap their
+        network round-trips. Cleaning and the cache are shared with the
+        sync path.
+        """
+        cleaned, key, cached = self._prepare(text)
+        if cached is not None:
+            return cached
 
-        return audio_bytes
+        url, body = self._build_request(cleaned)
+        try:
+            resp = await _get_async_http().post(
+                url,
+                content=body,
+                headers={"Content-Type": "application/json"},
+            )
+        except httpx.HTTPError as e:
+            logger.error(f"TTS API connection error: {e}")
+            raise RuntimeError(f"TTS API connection error: {e}") from e
+        return self._finish(cleaned, key, resp.status_code, resp.content)
@@ -17,13 +17,18 @@ dict, and keeps going in her turn to synthesize the final response.
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import logging
-from typing import Any, Dict, List
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
 
 from google.adk.tools import FunctionTool
 from google.genai import types as genai_types
 
-from radbot.config.adk_config import create_client_with_config_settings
+from radbot.config.adk_config import get_shared_client
 from radbot.tools.shared.sanitize import sanitize_external_content
 
 logger = logging.getLogger(__name__)
@@ -33,6 +38,46 @@ logger = logging.getLogger(__name__)
 # synthesis happens in scout's main Pro turn.
 _GROUNDED_SEARCH_MODEL = "gemini-2.5-flash"
 
+# Successful results, keyed on the normalized query. Repeat questions inside
+# the TTL skip the model round trip (~1s and a billed grounded call). Set
+# RADBOT_WEBSEARCH_CACHE=0 to always go upstream.
+_CACHE_TTL = 300.0
+_CACHE_MAX_ENTRIES = 256
+_SEARCH_CACHE: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = (
+    OrderedDict()
+)
+
+
+# Upstream calls currently running, keyed like the cache.
+_INFLIGHT: Dict[Tuple[str, str], "asyncio.Task[Dict[str, Any]]"] = {}
+
+
+def _cache_enabled() -> bool:
+    return os.getenv("RADBOT_WEBSEARCH_CACHE", "1").lower() not in ("0", "false")
+
+
+def _cache_key(query: str) -> Tuple[str, str]:
+    return (" ".join(query.lower().split()), _GROUNDED_SEARCH_MODEL)
+
+
+def _cache_get(key: Tuple[str, str]) -> Dict[str, Any] | None:
+    hit = _SEARCH_CACHE.get(key)
+    if hit is None:
+        return None
+    stored_at, result = hit
+    if time.monotonic() - stored_at >= _CACHE_TTL:
+        del _SEARCH_CACHE[key]
+        return None
+    _SEARCH_CACHE.move_to_end(key)
+    return copy.deepcopy(result)
+
+
+def _cache_put(key: Tuple[str, str], result: Dict[str, Any]) -> None:
+    _SEARCH_CACHE[key] = (time.monotonic(), copy.deepcopy(result))
+    _SEARCH_CACHE.move_to_end(key)
+    while len(_SEARCH_CACHE) > _CACHE_MAX_ENTRIES:
+        _SEARCH_CACHE.popitem(last=False)
+
 
 def _extract_citations(response: Any) -> List[Dict[str, str]]:
     """Pull ``[{title, url}]`` out of a grounded response's metadata.
@@ -64,28 +109,10 @@ def _extract_citations(response: Any) -> List[Dict[str, str]]:
     return unique
 
 
-async def grounded_search(query: str) -> Dict[str, Any]:
-    """Perform a grounded Google Search and return the synthesized answer.
-
-    This is scout's stateless alternative to the ``search_agent`` sub-agent
-    — same backing capability (Gemini + Google Search grounding), but as
-    a FunctionTool so control stays with scout through the turn.
-
-    Args:
-        query: Natural-language search query. Prefer primary-source framing
-            ("official docs for X", "arxiv paper on Y") over listicle-bait.
-
-    Returns:
-        ``{"status": "success", "query": str, "answer": str,
-           "citations": [{"title": str, "url": str}], "model": str}``
-        on success; ``{"status": "error", "message": str}`` on failure.
-        The answer text is already sanitized at the external-content boundary.
-    """
-    if not query or not isinstance(query, str):
-        return {"status": "error", "message": "query must be a non-empty string"}
-
+async def _search_upstream(query: str) -> Dict[str, Any]:
+    """Run one grounded model call; always returns a result dict."""
     try:
-        client = create_client_with_config_settings()
+        client = get_shared_client()
     except Exception as e:
         logger.error("grounded_search: genai client unavailable: %s", e)
         return {"status": "error", "message": f"genai client unavailable: {e}"}
@@ -125,4 +152,53 @@ async def grounded_search(query: str) -> Dict[str, Any]:
     }
 
 
+async def grounded_search(query: str) -> Dict[str, Any]:
+    """Perform a grounded Google Search and return the synthesized answer.
+
+    This is scout's stateless alternative to the ``search_agent`` sub-agent
+    — same backing capability (Gemini + Google Search grounding), but as
+    a FunctionTool so control stays with scout through the turn.
+
+    Args:
+        query: Natural-language search query. Prefer primary-source framing
+            ("official docs for X", "arxiv paper on Y") over listicle-bait.
+
+    Returns:
+        ``{"status": "success", "query": str, "answer": str,
+           "citations": [{"title": str, "url": str}], "model": str}``
+        on success; ``{"status": "error", "message": str}`` on failure.
+        The answer text is already sanitized at the external-content boundary.
+    """
+    if not query or not isinstance(query, str):
+        return {"status": "error", "message": "query must be a non-empty string"}
+
+    use_cache = _cache_enabled()
+    key = _cache_key(query)
+    if use_cache:
+        cached = _cache_get(key)
+        if cached is not None:
+            logger.debug("grounded_search cache hit query=%r", query)
+            return {**cached, "query": query}
+
+    # Identical concurrent searches share one upstream call. The task is
+    # shielded so a cancelled caller doesn't cancel it for the others.
+    loop = asyncio.get_running_loop()
+    task = _INFLIGHT.get(key)
+    if task is not None and task.get_loop() is loop:
+        logger.debug("grounded_search joined in-flight query=%r", query)
+        result = await asyncio.shield(task)
+        return {**copy.deepcopy(result), "query": query}
+
+    task = loop.create_task(_search_upstream(query))
+    _INFLIGHT[key] = task
+    try:
+        result = await asyncio.shield(task)
+    finally:
+        if _INFLIGHT.get(key) is task:
+            del _INFLIGHT[key]
+    if use_cache and result.get("status") == "success":
+        _cache_put(key, result)
+    return result
+
+
 grounded_search_tool = FunctionTool(grounded_search)
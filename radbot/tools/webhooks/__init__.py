@@ -9,12 +9,14 @@ from .db import init_webhook_schema
 from .webhook_tools import (
     WEBHOOK_TOOLS,
     create_webhook_tool,
+    create_webhooks_tool,
     delete_webhook_tool,
     list_webhooks_tool,
 )
 
 __all__ = [
     "create_webhook_tool",
+    "create_webhooks_tool",
     "list_webhooks_tool",
     "delete_webhook_tool",
     "WEBHOOK_TOOLS",
@@ -3,17 +3,27 @@ Database operations for the Webhook Tool.
 
 Handles schema creation and CRUD operations for webhook definitions,
 reusing the existing PostgreSQL connection pool.
+
+Returned rows carry ``webhook_id`` as a ``str``: no UUID typecaster is
+registered with psycopg2, so callers can use it without converting.
 """
 
+import atexit
+import copy
 import json
 import logging
+import threading
+import time
 import uuid
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
 
 import psycopg2
 import psycopg2.extras
 
-from radbot.db.connection import get_db_connection, get_db_cursor
+from radbot.db.connection import execute_prepared, get_db_connection, get_db_cursor
+
+from .template_renderer import compile_template
 
 logger = logging.getLogger(__name__)
 
@@ -54,12 +64,17 @@ def create_webhook(
     secret: Optional[str] = None,
     metadata: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    """Insert a new webhook definition and return its data."""
+    """Insert a new webhook definition and return its data.
+
+    The prompt template is compiled here so the first trigger already finds
+    it in ``compile_template``'s cache.
+    """
+    compile_template(prompt_template)
     sql = """
         INSERT INTO webhook_definitions (name, path_suffix, prompt_template, secret, metadata)
-        VALUES (%s, %s, %s, %s, %s)
+        VALUES ($1, $2, $3, $4, $5)
         RETURNING webhook_id, name, path_suffix, prompt_template, secret, enabled,
-                  created_at, last_triggered_at, trigger_count, metadata;
+                  created_at, last_triggered_at, trigger_count, metadata
     """
     meta_json = json.dumps(metadata) if metadata else None
     params = (name, path_suffix, prompt_template, secret, meta_json)
@@ -67,74 +82,313 @@ def create_webhook(
     try:
         with get_db_connection() as conn:
             with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
-                cursor.execute(sql, params)
+                execute_prepared(cursor, "webhooks_create", sql, params)
                 conn.commit()
                 row = cursor.fetchone()
+                _invalidate_path_cache(path_suffix)
+                bump_version()
                 return dict(row) if row else {}
     except psycopg2.IntegrityError as e:
-        logger.error(f"Integrity error creating webhook (duplicate name or path?): {e}")
+        logger.error(
+            "Integrity error creating webhook (duplicate name or path?): %s", e
+        )
         raise
     except psycopg2.Error as e:
-        logger.error(f"Database error creating webhook: {e}")
+        logger.error("Database error creating webhook: %s", e)
         raise
 
 
-def list_webhooks(enabled_only: bool = False) -> List[Dict[str, Any]]:
-    """List all webhook definitions."""
-    sql = "SELECT * FROM webhook_definitions"
-    if enabled_only:
-        sql += " WHERE enabled = TRUE"
-    sql += " ORDER BY created_at DESC;"
+def bulk_create_webhooks(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Insert several webhook definitions in one statement.
+
+    Each item takes the keyword arguments of :func:`create_webhook`. All
+    rows are inserted in one transaction (a duplicate name or path fails the
+    whole batch) and returned in input order.
+    """
+    if not items:
+        return []
+    sql = """
+        INSERT INTO webhook_definitions (name, path_suffix, prompt_template, secret, metadata)
+        VALUES %s
+        RETURNING webhook_id, name, path_suffix, prompt_template, secret, enabled,
+                  created_at, last_triggered_at, trigger_count, metadata
+    """
+    values = []
+    for item in items:
+        compile_template(item["prompt_template"])
+        metadata = item.get("metadata")
+        values.append(
+            (
+                item["name"],
+                item["path_suffix"],
+                item["prompt_template"],
+                item.get("secret"),
+                json.dumps(metadata) if metadata else None,
+            )
+        )
 
     try:
         with get_db_connection() as conn:
             with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
-                cursor.execute(sql)
-                return [dict(row) for row in cursor.fetchall()]
+                rows = psycopg2.extras.execute_values(
+                    cursor, sql, values, page_size=len(values), fetch=True
+                )
+                conn.commit()
+    except psycopg2.IntegrityError as e:
+        logger.error(
+            "Integrity error creating webhooks (duplicate name or path?): %s", e
+        )
+        raise
     except psycopg2.Error as e:
-        logger.error(f"Database error listing webhooks: {e}")
+        logger.error("Database error creating %d webhooks: %s", len(values), e)
         raise
+    for item in items:
+        _invalidate_path_cache(item["path_suffix"])
+    bump_version()
+    by_suffix = {row["path_suffix"]: dict(row) for row in rows}
+    return [by_suffix[item["path_suffix"]] for item in items]
 
 
-def get_webhook_by_path(path_suffix: str) -> Optional[Dict[str, Any]]:
-    """Look up a webhook by its path_suffix."""
-    sql = "SELECT * FROM webhook_definitions WHERE path_suffix = %s AND enabled = TRUE;"
+# Listings never need the plaintext secret, only whether one is set, so it is
+# masked in SQL and never leaves the database.
+_LIST_COLUMNS = (
+    "webhook_id, name, path_suffix, prompt_template, "
+    "CASE WHEN secret <> '' THEN '***' END AS secret, enabled, "
+    "created_at, last_triggered_at, trigger_count, metadata"
+)
+
+# What the trigger endpoint needs to verify and render a delivery.
+_DISPATCH_COLUMNS = "webhook_id, name, path_suffix, prompt_template, secret"
+
+# Definitions change rarely, so list results are cached in-process and
+# invalidated by a version counter bumped on every write (create, delete,
+# trigger flush).
+_version_lock = threading.Lock()
+_version = 0
+_list_cache: Dict[bool, Tuple[int, List[Dict[str, Any]]]] = {}
+
+
+def bump_version() -> None:
+    """Invalidate cached ``list_webhooks`` results."""
+    global _version
+    with _version_lock:
+        _version += 1
+
+
+def get_version() -> int:
+    """Current webhook definitions version (see :func:`bump_version`)."""
+    return _version
+
+
+def list_webhooks(enabled_only: bool = False) -> List[Dict[str, Any]]:
+    """List all webhook definitions.
+
+    Rows are shaped server-side with ``json_agg`` so the whole result set
+    arrives as one JSON document (timestamps already ISO-formatted) rather
+    than one ``RealDictRow`` per row copied into a dict in Python. Results
+    are served from the in-process cache until the next write.
+    """
+    where = " WHERE enabled = TRUE" if enabled_only else ""
+    sql = f"""
+        SELECT COALESCE(json_agg(row_to_json(w) ORDER BY w.created_at DESC), '[]'::json)
+        FROM (SELECT {_LIST_COLUMNS} FROM webhook_definitions{where}) w
+    """
+
+    version = get_version()
+    cached = _list_cache.get(enabled_only)
+    if cached is not None and cached[0] == version:
+        return copy.deepcopy(cached[1])
+
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor() as cursor:
+                execute_prepared(
+                    cursor,
+                    "webhooks_list_enabled" if enabled_only else "webhooks_list_all",
+                    sql,
+                )
+                rows = cursor.fetchone()[0]
+    except psycopg2.Error as e:
+        logger.error("Database error listing webhooks: %s", e)
+        raise
+    _list_cache[enabled_only] = (version, rows)
+    return copy.deepcopy(rows)
+
+
+# Enabled-webhook lookups by path, including misses, for the trigger
+# endpoint. Definitions change rarely; create/delete invalidate explicitly
+# and the TTL bounds staleness from writes made by other processes.
+PATH_CACHE_TTL_S = 30.0
+_path_cache_lock = threading.Lock()
+_PATH_CACHE: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+
+
+def _invalidate_path_cache(path_suffix: Optional[str] = None) -> None:
+    with _path_cache_lock:
+        if path_suffix is None:
+            _PATH_CACHE.clear()
+        else:
+            _PATH_CACHE.pop(path_suffix, None)
+
+
+def get_webhooks_by_suffixes(suffixes: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Look up enabled webhooks for several path suffixes in one query.
+
+    Returns a dict keyed by ``path_suffix``; suffixes with no enabled
+    webhook are absent. Suffixes found in the path cache (hits or misses
+    younger than ``PATH_CACHE_TTL_S``) are not queried; the rest go to the
+    database in a single ``ANY($1::text[])`` prepared statement.
+    """
+    now = time.monotonic()
+    found: Dict[str, Dict[str, Any]] = {}
+    missing: List[str] = []
+    with _path_cache_lock:
+        for suffix in dict.fromkeys(suffixes):
+            hit = _PATH_CACHE.get(suffix)
+            if hit is not None and now - hit[0] < PATH_CACHE_TTL_S:
+                if hit[1]:
+                    found[suffix] = dict(hit[1])
+            else:
+                missing.append(suffix)
+    if not missing:
+        return found
+
+    sql = (
+        f"SELECT {_DISPATCH_COLUMNS} FROM webhook_definitions "
+        "WHERE path_suffix = ANY($1::text[]) AND enabled = TRUE"
+    )
     try:
         with get_db_connection() as conn:
             with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
-                cursor.execute(sql, (path_suffix,))
-                row = cursor.fetchone()
-                return dict(row) if row else None
+                execute_prepared(cursor, "webhooks_by_suffixes", sql, (missing,))
+                rows = {row["path_suffix"]: dict(row) for row in cursor.fetchall()}
     except psycopg2.Error as e:
-        logger.error(f"Database error looking up webhook by path '{path_suffix}': {e}")
+        logger.error("Database error looking up webhooks by path %s: %s", missing, e)
         raise
+    with _path_cache_lock:
+        for suffix in missing:
+            _PATH_CACHE[suffix] = (now, rows.get(suffix))
+    for suffix, webhook in rows.items():
+        found[suffix] = dict(webhook)
+    return found
+
+
+def get_webhook_by_path(path_suffix: str) -> Optional[Dict[str, Any]]:
+    """Look up an enabled webhook by its path_suffix.
+
+    Returns only the columns the trigger endpoint uses (see
+    ``_DISPATCH_COLUMNS``), not the full row. Results are cached for
+    ``PATH_CACHE_TTL_S`` seconds.
+    """
+    return get_webhooks_by_suffixes([path_suffix]).get(path_suffix)
 
 
 def delete_webhook(webhook_id: uuid.UUID) -> bool:
     """Delete a webhook definition. Returns True if a row was deleted."""
-    sql = "DELETE FROM webhook_definitions WHERE webhook_id = %s RETURNING webhook_id;"
+    sql = "DELETE FROM webhook_definitions WHERE webhook_id = $1"
     try:
         with get_db_connection() as conn:
             with get_db_cursor(conn, commit=True) as cursor:
-                cursor.execute(sql, (str(webhook_id),))
-                return cursor.rowcount > 0
+                execute_prepared(cursor, "webhooks_delete", sql, (webhook_id,))
+                deleted = cursor.rowcount > 0
     except psycopg2.Error as e:
-        logger.error(f"Database error deleting webhook {webhook_id}: {e}")
+        logger.error("Database error deleting webhook %s: %s", webhook_id, e)
         raise
+    if deleted:
+        _invalidate_path_cache()
+        bump_version()
+    return deleted
+
+
+# Trigger bookkeeping is buffered in-process and written in one batched
+# UPDATE at most every ``TRIGGER_FLUSH_INTERVAL_S`` seconds, keeping the
+# DB round trip off the webhook request path.
+TRIGGER_FLUSH_INTERVAL_S = 0.5
+# Failed background flushes retry after an exponentially growing delay,
+# capped here, until one succeeds.
+TRIGGER_FLUSH_MAX_BACKOFF_S = 30.0
+
+_trigger_lock = threading.Lock()
+_pending_triggers: Dict[str, Tuple[int, datetime]] = {}
+_flush_timer: Optional[threading.Timer] = None
+_flush_failures = 0
+_atexit_registered = False
 
 
 def record_trigger(webhook_id: uuid.UUID) -> None:
-    """Increment trigger_count and set last_triggered_at."""
+    """Count one trigger; trigger_count / last_triggered_at are written in batches."""
+    global _atexit_registered
+    key = str(webhook_id)
+    now = datetime.now(timezone.utc)
+    with _trigger_lock:
+        count, _ = _pending_triggers.get(key, (0, now))
+        _pending_triggers[key] = (count + 1, now)
+        if _flush_timer is None:
+            _arm_flush_timer(TRIGGER_FLUSH_INTERVAL_S)
+        if not _atexit_registered:
+            atexit.register(flush_triggers)
+            _atexit_registered = True
+
+
+def _arm_flush_timer(delay: float) -> None:
+    """Schedule the next background flush. Caller holds ``_trigger_lock``."""
+    global _flush_timer
+    _flush_timer = threading.Timer(delay, _flush_from_timer)
+    _flush_timer.daemon = True
+    _flush_timer.start()
+
+
+def _flush_from_timer() -> None:
+    global _flush_timer, _flush_failures
+    with _trigger_lock:
+        _flush_timer = None
+    try:
+        flush_triggers()
+    except Exception:
+        # Already logged and the counts were put back; retry with backoff
+        # rather than waiting for the next trigger to arm a timer.
+        with _trigger_lock:
+            _flush_failures += 1
+            if _flush_timer is None and _pending_triggers:
+                delay = TRIGGER_FLUSH_INTERVAL_S * 2**_flush_failures
+                _arm_flush_timer(min(delay, TRIGGER_FLUSH_MAX_BACKOFF_S))
+
+
+def flush_triggers() -> int:
+    """Write all buffered triggers in one UPDATE. Returns the number of webhooks updated.
+
+    On any error the counts are merged back into the buffer so the next
+    flush retries them, and the error is re-raised.
+    """
+    global _pending_triggers, _flush_failures
+    with _trigger_lock:
+        batch, _pending_triggers = _pending_triggers, {}
+    if not batch:
+        return 0
+
     sql = """
-        UPDATE webhook_definitions
-        SET last_triggered_at = CURRENT_TIMESTAMP,
-            trigger_count = trigger_count + 1
-        WHERE webhook_id = %s;
+        UPDATE webhook_definitions AS w
+        SET trigger_count = w.trigger_count + v.delta,
+            last_triggered_at = GREATEST(w.last_triggered_at, v.ts)
+        FROM (VALUES %s) AS v(id, delta, ts)
+        WHERE w.webhook_id = v.id::uuid;
     """
+    rows = [(wid, count, ts) for wid, (count, ts) in batch.items()]
     try:
         with get_db_connection() as conn:
             with get_db_cursor(conn, commit=True) as cursor:
-                cursor.execute(sql, (str(webhook_id),))
-    except psycopg2.Error as e:
-        logger.error(f"Database error recording trigger for webhook {webhook_id}: {e}")
+                psycopg2.extras.execute_values(cursor, sql, rows)
+                updated = cursor.rowcount
+    except BaseException as e:
+        # Not only psycopg2 errors: pool init (missing credentials) or pool
+        # exhaustion must not drop the swapped-out batch either.
+        logger.error("Error recording %d webhook triggers: %s", len(rows), e)
+        with _trigger_lock:
+            for wid, (count, ts) in batch.items():
+                pending, last = _pending_triggers.get(wid, (0, ts))
+                _pending_triggers[wid] = (pending + count, max(last, ts))
         raise
+    with _trigger_lock:
+        _flush_failures = 0
+    bump_version()
+    return updated
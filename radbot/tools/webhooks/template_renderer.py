@@ -3,38 +3,86 @@ Simple template renderer for webhook prompt templates.
 
 Supports ``{{payload.key.subkey}}`` style substitution using dot-notation
 paths into the incoming JSON payload.
+
+Templates are constant per webhook definition, so they are compiled once
+(``compile_template``) into literal text and pre-split paths; each trigger
+then only walks the paths (``render_compiled``).
 """
 
+import functools
 import logging
 import re
-from typing import Any, Dict
+import sys
+from typing import Any, Dict, Tuple, Union
+
+from radbot.tools.shared.sanitize import sanitize_text
 
 logger = logging.getLogger(__name__)
 
 _TEMPLATE_PATTERN = re.compile(r"\{\{(.*?)\}\}")
 
+# A compiled template: literal strings interleaved with path tuples.
+Segment = Union[str, Tuple[str, ...]]
+CompiledTemplate = Tuple[Segment, ...]
 
-def _resolve_path(obj: Any, path: str) -> str:
-    """Walk a dot-separated path into a nested dict/list and return the value as a string."""
-    parts = path.strip().split(".")
-    current = obj
-    for part in parts:
-        if isinstance(current, dict):
-            current = current.get(part)
-        elif isinstance(current, (list, tuple)):
-            try:
-                current = current[int(part)]
-            except (ValueError, IndexError):
-                return ""
-        else:
-            return ""
-        if current is None:
-            return ""
-    from radbot.tools.shared.sanitize import sanitize_text
 
+def _resolve_parts(obj: Any, parts: Tuple[str, ...]) -> str:
+    """Walk pre-split path parts into a nested dict/list and return the value as a string.
+
+    One subscript per part; any miss (absent key, bad index, or stepping
+    into a scalar or ``None``) ends the walk with ``""``.
+    """
+    current = obj
+    try:
+        for part in parts:
+            current = current[int(part)] if type(current) is list else current[part]
+    except (KeyError, IndexError, TypeError, ValueError):
+        return ""
+    if current is None:
+        return ""
     return sanitize_text(str(current), source="webhook")
 
 
+def _resolve_root(payload: Dict[str, Any], parts: Tuple[str, ...]) -> str:
+    """Resolve *parts* from the template root without building a context dict.
+
+    Templates can use ``{{payload.x}}`` naturally, but also bare ``{{x}}``.
+    A top-level ``"payload"`` key in the payload itself takes precedence.
+    """
+    if parts[0] == "payload" and (
+        not isinstance(payload, dict) or "payload" not in payload
+    ):
+        return _resolve_parts(payload, parts[1:])
+    return _resolve_parts(payload, parts)
+
+
+@functools.lru_cache(maxsize=128)
+def compile_template(template: str) -> CompiledTemplate:
+    """
+    Split *template* into literal text and ``{{path}}`` placeholders.
+
+    Placeholders become tuples of path parts, e.g. ``{{payload.repo.name}}``
+    compiles to ``("payload", "repo", "name")``. Path parts are interned so
+    dict lookups against JSON keys can short-circuit on identity. Empty
+    literals are dropped. Results are cached per template string.
+    """
+    pieces = _TEMPLATE_PATTERN.split(template)
+    segments = []
+    for i, piece in enumerate(pieces):
+        if i % 2:
+            segments.append(tuple(sys.intern(p) for p in piece.strip().split(".")))
+        elif piece:
+            segments.append(piece)
+    return tuple(segments)
+
+
+def render_compiled(segments: CompiledTemplate, payload: Dict[str, Any]) -> str:
+    """Render a template produced by ``compile_template`` against *payload*."""
+    return "".join(
+        seg if isinstance(seg, str) else _resolve_root(payload, seg) for seg in segments
+    )
+
+
 def render_template(template: str, payload: Dict[str, Any]) -> str:
     """
     Replace all ``{{path}}`` placeholders in *template* with values
@@ -46,13 +94,4 @@ def render_template(template: str, payload: Dict[str, Any]) -> str:
 
         render_template("Repo {{payload.repo.name}} pushed", {"payload": {...}})
     """
-    # Wrap the raw payload under a "payload" key so templates can use
-    # {{payload.x}} naturally, but also support bare {{key}}.
-    context = {"payload": payload}
-    context.update(payload)
-
-    def _replace(match: re.Match) -> str:
-        path = match.group(1)
-        return _resolve_path(context, path)
-
-    return _TEMPLATE_PATTERN.sub(_replace, template)
+    return render_compiled(compile_template(template), payload)
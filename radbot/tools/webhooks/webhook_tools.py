@@ -6,13 +6,11 @@ webhook definitions.
 """
 
 import logging
-import traceback
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from google.adk.tools import FunctionTool
-
-from radbot.tools.shared.errors import truncate_error
-from radbot.tools.shared.serialization import serialize_rows
+from radbot.tools.shared.errors import exception_text, truncate_error
+from radbot.tools.shared.function_tool import CachedFunctionTool
+from radbot.tools.shared.serialization import serialize_row
 from radbot.tools.shared.validation import validate_uuid
 
 from . import db as webhook_db
@@ -20,6 +18,10 @@ from . import db as webhook_db
 logger = logging.getLogger(__name__)
 
 
+def _trigger_url(path_suffix: str) -> str:
+    return f"/api/webhooks/trigger/{path_suffix}"
+
+
 def create_webhook(
     name: str,
     path_suffix: str,
@@ -52,16 +54,76 @@ def create_webhook(
             prompt_template=prompt_template,
             secret=secret,
         )
-        webhook_id = str(row["webhook_id"])
         return {
             "status": "success",
-            "webhook_id": webhook_id,
-            "trigger_url": f"/api/webhooks/trigger/{path_suffix}",
+            "webhook_id": row["webhook_id"],
+            "trigger_url": _trigger_url(path_suffix),
+        }
+    except Exception as e:
+        error_message = f"Failed to create webhook: {exception_text(e)}"
+        logger.error("Error in create_webhook: %s", error_message)
+        logger.debug("Traceback:", exc_info=True)
+        return {"status": "error", "message": truncate_error(error_message)}
+
+
+def create_webhooks(webhooks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Registers several webhook endpoints in one step.
+
+    Use this instead of repeated create_webhook calls when setting up more
+    than one webhook. Either all webhooks are created or none are.
+
+    Args:
+        webhooks: List of objects, each with "name", "path_suffix" and
+            "prompt_template" (same meaning as in create_webhook) and an
+            optional "secret".
+
+    Returns:
+        On success: {"status": "success", "webhooks": [{"webhook_id": "...", "name": "...", "trigger_url": "..."}]}
+        On failure: {"status": "error", "message": "..."}
+    """
+    if not webhooks:
+        return {"status": "error", "message": "No webhooks provided."}
+    items = []
+    for i, w in enumerate(webhooks, 1):
+        if not isinstance(w, dict):
+            return {"status": "error", "message": f"Webhook {i} must be an object."}
+        missing = [
+            k
+            for k in ("name", "path_suffix", "prompt_template")
+            if not isinstance(w.get(k), str) or not w[k]
+        ]
+        if missing:
+            return {
+                "status": "error",
+                "message": f"Webhook {i} is missing {', '.join(missing)}.",
+            }
+        items.append(
+            {
+                "name": w["name"],
+                "path_suffix": w["path_suffix"],
+                "prompt_template": w["prompt_template"],
+                "secret": w.get("secret"),
+            }
+        )
+
+    try:
+        rows = webhook_db.bulk_create_webhooks(items)
+        return {
+            "status": "success",
+            "webhooks": [
+                {
+                    "webhook_id": row["webhook_id"],
+                    "name": row["name"],
+                    "trigger_url": _trigger_url(row["path_suffix"]),
+                }
+                for row in rows
+            ],
         }
     except Exception as e:
-        error_message = f"Failed to create webhook: {str(e)}"
-        logger.error(f"Error in create_webhook: {error_message}")
-        logger.debug(traceback.format_exc())
+        error_message = f"Failed to create webhooks: {exception_text(e)}"
+        logger.error("Error in create_webhooks: %s", error_message)
+        logger.debug("Traceback:", exc_info=True)
         return {"status": "error", "message": truncate_error(error_message)}
 
 
@@ -74,16 +136,18 @@ def list_webhooks() -> Dict[str, Any]:
         On failure: {"status": "error", "message": "..."}
     """
     try:
-        webhooks = webhook_db.list_webhooks()
-        serialised = serialize_rows(webhooks, mask_fields={"secret": "***"})
-        for item, w in zip(serialised, webhooks):
-            item["trigger_url"] = f"/api/webhooks/trigger/{w['path_suffix']}"
-
+        serialised = [
+            {
+                **serialize_row(w, mask_fields={"secret": "***"}),
+                "trigger_url": _trigger_url(w["path_suffix"]),
+            }
+            for w in webhook_db.list_webhooks()
+        ]
         return {"status": "success", "webhooks": serialised}
     except Exception as e:
-        error_message = f"Failed to list webhooks: {str(e)}"
-        logger.error(f"Error in list_webhooks: {error_message}")
-        logger.debug(traceback.format_exc())
+        error_message = f"Failed to list webhooks: {exception_text(e)}"
+        logger.error("Error in list_webhooks: %s", error_message)
+        logger.debug("Traceback:", exc_info=True)
         return {"status": "error", "message": truncate_error(error_message)}
 
 
@@ -103,25 +167,25 @@ def delete_webhook(webhook_id: str) -> Dict[str, Any]:
         if err:
             return err
 
-        success = webhook_db.delete_webhook(wh_uuid)
-        if success:
+        if webhook_db.delete_webhook(wh_uuid):
             return {"status": "success", "webhook_id": webhook_id}
-        else:
-            return {"status": "error", "message": f"Webhook {webhook_id} not found."}
+        return {"status": "error", "message": f"Webhook {webhook_id} not found."}
     except Exception as e:
-        error_message = f"Failed to delete webhook: {str(e)}"
-        logger.error(f"Error in delete_webhook: {error_message}")
-        logger.debug(traceback.format_exc())
+        error_message = f"Failed to delete webhook: {exception_text(e)}"
+        logger.error("Error in delete_webhook: %s", error_message)
+        logger.debug("Traceback:", exc_info=True)
         return {"status": "error", "message": truncate_error(error_message)}
 
 
 # Wrap as ADK FunctionTools
-create_webhook_tool = FunctionTool(create_webhook)
-list_webhooks_tool = FunctionTool(list_webhooks)
-delete_webhook_tool = FunctionTool(delete_webhook)
+create_webhook_tool = CachedFunctionTool(create_webhook)
+create_webhooks_tool = CachedFunctionTool(create_webhooks)
+list_webhooks_tool = CachedFunctionTool(list_webhooks)
+delete_webhook_tool = CachedFunctionTool(delete_webhook)
 
 WEBHOOK_TOOLS = [
     create_webhook_tool,
+    create_webhooks_tool,
     list_webhooks_tool,
     delete_webhook_tool,
 ]
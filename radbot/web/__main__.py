@@ -6,19 +6,10 @@ Usage:
 """
 
 import argparse
-import logging
 
 from dotenv import load_dotenv
 
 from radbot.logging_config import setup_logging
-from radbot.web.app import start_server
-
-# Load environment variables
-load_dotenv()
-
-# Set up logging (single entry-point call)
-setup_logging()
-logger = logging.getLogger(__name__)
 
 
 def main():
@@ -30,6 +21,16 @@ def main():
 
     args = parser.parse_args()
 
+    # Load environment variables
+    load_dotenv()
+
+    # Set up logging (single entry-point call)
+    setup_logging()
+
+    # Imported after parsing so ``--help`` and usage errors don't pay for
+    # loading the whole app (agents, tools, ADK) first.
+    from radbot.web.app import start_server
+
     # Start the server
     start_server(host=args.host, port=args.port, reload=args.reload)
 
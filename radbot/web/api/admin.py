@@ -3,17 +3,25 @@
 All endpoints require a bearer token matching ``RADBOT_ADMIN_TOKEN``.
 """
 
+import asyncio
+import hashlib
+import hmac
 import json
 import logging
 import os
-from typing import Any, Dict, Optional
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from google_auth_oauthlib.flow import Flow
+from pydantic import BaseModel
 
 from radbot.credentials.store import CredentialStore, get_credential_store
+from radbot.web.spa import react_index_html
 
 logger = logging.getLogger(__name__)
 
@@ -45,18 +53,30 @@ _INTEGRATION_POST_RESET_HOOKS: list[tuple[str, str, bool]] = [
 ]
 
 
-def _reset_integration_clients() -> None:
-    """Reset all integration client singletons for hot-reload."""
-    import asyncio
+def _call_client_resets(module_filter: str = "") -> None:
+    """Call the registered reset functions whose module path contains ``module_filter``.
+
+    Blocking: the first call imports the client modules, and some resets
+    close HTTP sessions.
+    """
     import importlib
 
     for module_path, func_name in _INTEGRATION_RESET_REGISTRY:
+        if module_filter not in module_path:
+            continue
         try:
             module = importlib.import_module(module_path)
             getattr(module, func_name)()
         except Exception:
             pass  # Module may not be installed/configured
 
+
+async def _reset_integration_clients() -> None:
+    """Reset all integration client singletons for hot-reload."""
+    import importlib
+
+    await asyncio.to_thread(_call_client_resets)
+
     for module_path, func_name, is_async in _INTEGRATION_POST_RESET_HOOKS:
         try:
             module = importlib.import_module(module_path)
@@ -91,7 +111,7 @@ def _verify_admin(
     if not expected:
         raise HTTPException(503, "Admin API disabled — RADBOT_ADMIN_TOKEN not set")
     # Accept Bearer header only — query params leak into logs/history/referrers
-    if creds and creds.credentials == expected:
+    if creds and hmac.compare_digest(creds.credentials.encode(), expected.encode()):
         return
     raise HTTPException(401, "Invalid or missing admin bearer token")
 
@@ -111,14 +131,8 @@ def _require_store() -> CredentialStore:
 @router.get("/", response_class=HTMLResponse)
 async def admin_page(request: Request):
     """Serve the admin page (React SPA)."""
-    dist_index = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)), "static", "dist", "index.html"
-    )
-    if os.path.isfile(dist_index):
-        with open(dist_index, "r") as f:
-            html = f.read()
-        html = html.replace('"/assets/', '"/static/dist/assets/')
-        html = html.replace("'/assets/", "'/static/dist/assets/")
+    html = react_index_html()
+    if html is not None:
         return HTMLResponse(content=html)
     return HTMLResponse(
         content="<h1>RadBot Admin</h1><p>React frontend not built. Run <code>make build-frontend</code> first.</p>",
@@ -135,14 +149,20 @@ async def list_credentials(_: None = Depends(_verify_admin)):
     return store.list()
 
 
+class CredentialBody(BaseModel):
+    name: str = ""
+    value: str = ""
+    credential_type: str = "api_key"
+    description: Optional[str] = None
+
+
 @router.post("/api/credentials")
-async def store_credential(request: Request, _: None = Depends(_verify_admin)):
+async def store_credential(body: CredentialBody, _: None = Depends(_verify_admin)):
     store = _require_store()
-    body = await request.json()
-    name = body.get("name", "").strip()
-    value = body.get("value", "")
-    cred_type = body.get("credential_type", "api_key")
-    description = body.get("description")
+    name = body.name.strip()
+    value = body.value
+    cred_type = body.credential_type
+    description = body.description
 
     if not name or not value:
         raise HTTPException(400, "name and value are required")
@@ -150,16 +170,7 @@ async def store_credential(request: Request, _: None = Depends(_verify_admin)):
     store.set(name, value, credential_type=cred_type, description=description)
     # Reset HA client singletons when the HA token is updated
     if name == "ha_token":
-        import importlib
-
-        for mod_path, fn_name in _INTEGRATION_RESET_REGISTRY:
-            if "homeassistant" not in mod_path:
-                continue
-            try:
-                module = importlib.import_module(mod_path)
-                getattr(module, fn_name)()
-            except Exception:
-                pass
+        await asyncio.to_thread(_call_client_resets, "homeassistant")
     return {"status": "ok", "name": name}
 
 
@@ -178,17 +189,43 @@ async def delete_credential(name: str, _: None = Depends(_verify_admin)):
 # The value is a JSON string of that config section.
 
 
+# The admin UI polls GET /api/config. The encoded response is reused until
+# this process writes a credential (store.version) or the TTL lapses (writes
+# from other processes), and is served with an ETag so unchanged polls get a
+# bodyless 304.
+_ALL_CONFIG_TTL = 3.0
+_all_config_cache: Optional[Tuple[int, float, bytes, str]] = None
+
+
 @router.get("/api/config")
-async def get_all_config(_: None = Depends(_verify_admin)):
+async def get_all_config(request: Request, _: None = Depends(_verify_admin)):
     """Return all config sections stored in the DB (as a merged dict)."""
+    global _all_config_cache
     store = _require_store()
+    now = time.monotonic()
+    cached = _all_config_cache
+    if (
+        cached is None
+        or cached[0] != store.version
+        or now - cached[1] >= _ALL_CONFIG_TTL
+    ):
+        version = store.version
+        body = json.dumps(
+            _load_all_config(store), ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        cached = _all_config_cache = (version, now, body, etag)
+    _, _, body, etag = cached
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _load_all_config(store: CredentialStore) -> Dict[str, Any]:
     result = {}
-    for entry in store.list():
-        name = entry["name"]
-        if not name.startswith("config:"):
-            continue
+    for name, raw in store.get_many("config:").items():
         section = name[len("config:") :]
-        raw = store.get(name)
         if raw:
             try:
                 result[section] = json.loads(raw)
@@ -210,24 +247,8 @@ async def get_config_section(section: str, _: None = Depends(_verify_admin)):
         return {"_raw": raw}
 
 
-@router.put("/api/config/{section}")
-async def save_config_section(
-    section: str, request: Request, _: None = Depends(_verify_admin)
-):
-    """Save a config section to the DB.  Body is the JSON object for that section."""
-    if section == "database":
-        raise HTTPException(
-            400,
-            "Cannot override database config from admin — it is the bootstrap config",
-        )
-    store = _require_store()
-    body = await request.json()
-    store.set(
-        f"config:{section}",
-        json.dumps(body),
-        credential_type="config",
-        description=f"Config section: {section}",
-    )
+def _apply_config_reloads(section: str) -> None:
+    """Hot-reload the running config after ``section`` was saved (blocking)."""
     # Hot-reload into the running config
     try:
         from radbot.config.config_loader import config_loader
@@ -271,9 +292,33 @@ async def save_config_section(
                 )
         except Exception as e:
             logger.warning(f"Memory service hot-reload failed: {e}")
+
+
+@router.put("/api/config/{section}")
+async def save_config_section(
+    section: str, request: Request, _: None = Depends(_verify_admin)
+):
+    """Save a config section to the DB.  Body is the JSON object for that section."""
+    if section == "database":
+        raise HTTPException(
+            400,
+            "Cannot override database config from admin — it is the bootstrap config",
+        )
+    store = _require_store()
+    body = await request.json()
+    store.set(
+        f"config:{section}",
+        json.dumps(body),
+        credential_type="config",
+        description=f"Config section: {section}",
+    )
+    # The reloads block (DB reads, Qdrant handshake), so they run in a worker
+    # thread; the response still waits for them so the UI's follow-up reads
+    # see the new config.
+    await asyncio.to_thread(_apply_config_reloads, section)
     # Reset client singletons so next call picks up new config
     if section == "integrations":
-        _reset_integration_clients()
+        await _reset_integration_clients()
     return {"status": "ok", "section": section}
 
 
@@ -289,23 +334,101 @@ async def delete_config_section(section: str, _: None = Depends(_verify_admin)):
 # ------------------------------------------------------------------
 # Live config view (read-only, shows merged file+DB config)
 # ------------------------------------------------------------------
+# Config paths masked in the live view. A path ending at a dict masks every
+# value in it (``api_keys``); otherwise the single leaf is masked.
+_SENSITIVE_PATHS: frozenset[tuple[str, ...]] = frozenset(
+    {
+        ("database", "password"),
+        ("api_keys",),
+        ("vector_db", "api_key"),
+        ("integrations", "jira", "api_token"),
+        ("integrations", "home_assistant", "token"),
+        ("integrations", "overseerr", "api_key"),
+        ("integrations", "lidarr", "api_key"),
+        ("integrations", "ntfy", "token"),
+        ("integrations", "picnic", "password"),
+        ("integrations", "github", "private_key"),
+        ("integrations", "youtube", "api_key"),
+    }
+)
+
+
+def _redacted(cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """Return ``cfg`` with ``_SENSITIVE_PATHS`` masked, copy-on-write.
+
+    Only the dicts along a sensitive path are copied; everything else is
+    shared with ``cfg``, which is never mutated. Empty values stay as-is so
+    the view still shows what is unset.
+    """
+    out = dict(cfg)
+    copied = {id(out)}
+    for path in _SENSITIVE_PATHS:
+        node = out
+        for key in path[:-1]:
+            child = node.get(key)
+            if not isinstance(child, dict):
+                break
+            if id(child) not in copied:
+                child = node[key] = dict(child)
+                copied.add(id(child))
+            node = child
+        else:
+            value = node.get(path[-1])
+            if isinstance(value, dict):
+                node[path[-1]] = {k: "***" if v else v for k, v in value.items()}
+            elif value:
+                node[path[-1]] = "***"
+    return out
+
+
 @router.get("/api/config-live")
 async def get_live_config(_: None = Depends(_verify_admin)):
     """Return the current merged config (file + DB overrides)."""
-    # Return a copy, redacting sensitive fields
-    import copy
-
     from radbot.config.config_loader import config_loader
 
-    cfg = copy.deepcopy(config_loader.get_config())
-    # Redact known sensitive fields
-    if "database" in cfg and "password" in cfg["database"]:
-        cfg["database"]["password"] = "***"
-    if "api_keys" in cfg:
-        for k in cfg["api_keys"]:
-            if cfg["api_keys"][k]:
-                cfg["api_keys"][k] = "***"
-    return cfg
+    return _redacted(config_loader.get_config())
+
+
+def _config_section(*path: str) -> Dict[str, Any]:
+    """Return the config dict at ``path`` (e.g. ``"integrations", "jira"``).
+
+    Missing sections, and a config loader that fails to load, both give ``{}``.
+    """
+    try:
+        from radbot.config.config_loader import config_loader
+
+        section: Any = config_loader.get_config()
+    except Exception:
+        return {}
+    for key in path:
+        section = section.get(key) if isinstance(section, dict) else None
+    return section if isinstance(section, dict) else {}
+
+
+# Decrypted credential-store values for the test endpoints, tagged with the
+# store version they were read at so any write through the store drops them.
+_secret_cache: Dict[str, Tuple[int, str]] = {}
+
+
+def _resolve_secret(value: str, store_key: str, fallback: str = "") -> str:
+    """Pick a secret: the request value, else the credential store, else ``fallback``.
+
+    ``"***"`` (the redacted placeholder the admin UI echoes back) counts as
+    no value.
+    """
+    if value and value != "***":
+        return value
+    store = get_credential_store()
+    if store.available:
+        version = store.version
+        cached = _secret_cache.get(store_key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        secret = store.get(store_key)
+        if secret:
+            _secret_cache[store_key] = (version, secret)
+            return secret
+    return fallback
 
 
 # ------------------------------------------------------------------
@@ -318,6 +441,20 @@ def _get_oauth_redirect_uri(request: Request, callback_path: str) -> str:
     return f"{scheme}://{host}{callback_path}"
 
 
+_GMAIL_SCOPES = ("https://www.googleapis.com/auth/gmail.readonly",)
+_CALENDAR_SCOPES = ("https://www.googleapis.com/auth/calendar",)
+
+
+@lru_cache(maxsize=4)
+def _parse_client_config(client_json: str) -> Dict[str, Any]:
+    """Parse an OAuth client secrets document, cached per distinct document.
+
+    The returned dict is shared between calls; ``Flow.from_client_config``
+    only reads it.
+    """
+    return json.loads(client_json)
+
+
 @router.get("/api/credentials/gmail/setup")
 async def gmail_oauth_setup(
     request: Request,
@@ -339,17 +476,11 @@ async def gmail_oauth_setup(
             pass
         if not client_file:
             # Also try config_loader directly
-            try:
-                from radbot.config.config_loader import config_loader
-
-                gmail_cfg = (
-                    config_loader.get_config().get("integrations", {}).get("gmail", {})
-                )
-                client_file = gmail_cfg.get("oauth_client_file", "")
-                if client_file:
-                    client_file = os.path.expanduser(client_file)
-            except Exception:
-                pass
+            client_file = _config_section("integrations", "gmail").get(
+                "oauth_client_file", ""
+            )
+            if client_file:
+                client_file = os.path.expanduser(client_file)
         if not client_file or not os.path.exists(client_file):
             raise HTTPException(
                 400,
@@ -364,16 +495,14 @@ async def gmail_oauth_setup(
         with open(resolved) as f:
             client_json = f.read()
 
-    from google_auth_oauthlib.flow import Flow
-
-    SCOPES = ["https://www.googleapis.com/auth/gmail.readonly"]
     redirect_uri = _get_oauth_redirect_uri(
         request, "/admin/api/credentials/gmail/callback"
     )
 
-    client_config = json.loads(client_json)
     flow = Flow.from_client_config(
-        client_config, scopes=SCOPES, redirect_uri=redirect_uri
+        _parse_client_config(client_json),
+        scopes=list(_GMAIL_SCOPES),
+        redirect_uri=redirect_uri,
     )
     auth_url, state = flow.authorization_url(
         access_type="offline",
@@ -416,10 +545,6 @@ async def gmail_oauth_callback(request: Request, code: str = "", state: str = ""
     """Handle the Gmail OAuth callback and store the token."""
     store = _require_store()
 
-    from google_auth_oauthlib.flow import Flow
-
-    SCOPES = ["https://www.googleapis.com/auth/gmail.readonly"]
-
     state_json = store.get("_oauth_state_gmail")
     if not state_json:
         raise HTTPException(400, "No OAuth flow in progress")
@@ -437,26 +562,21 @@ async def gmail_oauth_callback(request: Request, code: str = "", state: str = ""
         except Exception:
             pass
         if not client_file:
-            try:
-                from radbot.config.config_loader import config_loader
-
-                gmail_cfg = (
-                    config_loader.get_config().get("integrations", {}).get("gmail", {})
-                )
-                client_file = gmail_cfg.get("oauth_client_file", "")
-                if client_file:
-                    client_file = os.path.expanduser(client_file)
-            except Exception:
-                pass
+            client_file = _config_section("integrations", "gmail").get(
+                "oauth_client_file", ""
+            )
+            if client_file:
+                client_file = os.path.expanduser(client_file)
         if client_file and os.path.exists(client_file):
             with open(client_file) as f:
                 client_json = f.read()
         else:
             raise HTTPException(400, "No Gmail OAuth client configured")
 
-    client_config = json.loads(client_json)
     flow = Flow.from_client_config(
-        client_config, scopes=SCOPES, redirect_uri=redirect_uri
+        _parse_client_config(client_json),
+        scopes=list(_GMAIL_SCOPES),
+        redirect_uri=redirect_uri,
     )
     # Google may return additional scopes (e.g. cloud-platform); accept them
     os.environ["OAUTHLIB_RELAX_TOKEN_SCOPE"] = "1"
@@ -464,13 +584,14 @@ async def gmail_oauth_callback(request: Request, code: str = "", state: str = ""
     creds = flow.credentials
 
     account_label = state_data.get("account", "default")
-    store.set(
-        f"gmail_token_{account_label}",
-        creds.to_json(),
-        credential_type="oauth_token",
-        description=f"Gmail OAuth token ({account_label} account)",
-    )
-    store.delete("_oauth_state_gmail")
+    with store.batch() as batch:
+        batch.set(
+            f"gmail_token_{account_label}",
+            creds.to_json(),
+            credential_type="oauth_token",
+            description=f"Gmail OAuth token ({account_label} account)",
+        )
+        batch.delete("_oauth_state_gmail")
     return HTMLResponse(
         f"<h2>Gmail token stored for account '{account_label}'.</h2>"
         "<p><a href='/admin/'>Back to admin</a></p>"
@@ -490,16 +611,14 @@ async def calendar_oauth_setup(request: Request, _: None = Depends(_verify_admin
             "Store it as 'calendar_oauth_client' via the admin UI first.",
         )
 
-    from google_auth_oauthlib.flow import Flow
-
-    SCOPES = ["https://www.googleapis.com/auth/calendar"]
     redirect_uri = _get_oauth_redirect_uri(
         request, "/admin/api/credentials/calendar/callback"
     )
 
-    client_config = json.loads(client_json)
     flow = Flow.from_client_config(
-        client_config, scopes=SCOPES, redirect_uri=redirect_uri
+        _parse_client_config(client_json),
+        scopes=list(_CALENDAR_SCOPES),
+        redirect_uri=redirect_uri,
     )
     auth_url, state = flow.authorization_url(
         access_type="offline",
@@ -520,10 +639,6 @@ async def calendar_oauth_callback(request: Request, code: str = "", state: str =
     """Handle the Google Calendar OAuth callback and store the token."""
     store = _require_store()
 
-    from google_auth_oauthlib.flow import Flow
-
-    SCOPES = ["https://www.googleapis.com/auth/calendar"]
-
     state_json = store.get("_oauth_state_calendar")
     if not state_json:
         raise HTTPException(400, "No OAuth flow in progress")
@@ -535,20 +650,22 @@ async def calendar_oauth_callback(request: Request, code: str = "", state: str =
     if not client_json:
         raise HTTPException(400, "No Calendar OAuth client configured")
 
-    client_config = json.loads(client_json)
     flow = Flow.from_client_config(
-        client_config, scopes=SCOPES, redirect_uri=redirect_uri
+        _parse_client_config(client_json),
+        scopes=list(_CALENDAR_SCOPES),
+        redirect_uri=redirect_uri,
     )
     flow.fetch_token(code=code)
     creds = flow.credentials
 
-    store.set(
-        "calendar_token",
-        creds.to_json(),
-        credential_type="oauth_token",
-        description="Google Calendar OAuth token",
-    )
-    store.delete("_oauth_state_calendar")
+    with store.batch() as batch:
+        batch.set(
+            "calendar_token",
+            creds.to_json(),
+            credential_type="oauth_token",
+            description="Google Calendar OAuth token",
+        )
+        batch.delete("_oauth_state_calendar")
     return HTMLResponse(
         "<h2>Calendar token stored successfully.</h2><p><a href='/admin/'>Back to admin</a></p>"
     )
@@ -557,14 +674,30 @@ async def calendar_oauth_callback(request: Request, code: str = "", state: str =
 # ------------------------------------------------------------------
 # Gmail accounts discovery
 # ------------------------------------------------------------------
+# discover_accounts() refreshes each stored token and calls the Gmail API for
+# its address, so results are reused until the credential store changes (a
+# new token from the OAuth callback bumps its version) or the TTL lapses.
+_GMAIL_ACCOUNTS_TTL = 60.0
+_gmail_accounts_cache: Optional[Tuple[int, float, List[Dict[str, str]]]] = None
+
+
 @router.get("/api/gmail/accounts")
 async def list_gmail_accounts(_: None = Depends(_verify_admin)):
     """List all discovered Gmail accounts (credential store + file tokens)."""
+    global _gmail_accounts_cache
     try:
         from radbot.tools.gmail.gmail_auth import discover_accounts
 
-        accounts = discover_accounts()
-        return {"accounts": accounts}
+        version = get_credential_store().version
+        now = time.monotonic()
+        cached = _gmail_accounts_cache
+        if (
+            cached is None
+            or cached[0] != version
+            or now - cached[1] >= _GMAIL_ACCOUNTS_TTL
+        ):
+            cached = _gmail_accounts_cache = (version, now, discover_accounts())
+        return {"accounts": [dict(a) for a in cached[2]]}
     except Exception as e:
         logger.warning(f"Gmail account discovery failed: {e}")
         return {"accounts": [], "error": str(e)}
@@ -581,25 +714,101 @@ def _err(message: str) -> Dict[str, Any]:
     return {"status": "error", "message": message}
 
 
+# One pooled client for all test endpoints, so repeated tests against the
+# same host reuse the connection instead of redoing the TCP/TLS handshake.
+_test_http: Optional[httpx.AsyncClient] = None
+
+
+def _get_test_http() -> httpx.AsyncClient:
+    global _test_http
+    if _test_http is None or _test_http.is_closed:
+        _test_http = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        )
+    return _test_http
+
+
+async def close_test_http() -> None:
+    """Close the shared test-endpoint HTTP client (app shutdown)."""
+    global _test_http
+    if _test_http is not None:
+        await _test_http.aclose()
+        _test_http = None
+
+
+# Request bodies. Every field is optional: blanks fall back to stored config.
+class GoogleTestBody(BaseModel):
+    api_key: str = ""
+
+
+class JiraTestBody(BaseModel):
+    url: str = ""
+    email: str = ""
+    api_token: str = ""
+
+
+class OverseerrTestBody(BaseModel):
+    url: str = ""
+    api_key: str = ""
+
+
+class HomeAssistantTestBody(BaseModel):
+    url: str = ""
+    token: str = ""
+
+
+class QdrantTestBody(BaseModel):
+    url: str = ""
+    api_key: str = ""
+    host: str = ""
+    port: Optional[int] = None
+
+
+class NtfyTestBody(BaseModel):
+    url: str = ""
+    topic: str = ""
+    token: str = ""
+
+
+class PicnicTestBody(BaseModel):
+    username: str = ""
+    password: str = ""
+    country_code: str = "DE"
+
+
+class GitHubTestBody(BaseModel):
+    app_id: Union[str, int] = ""
+    installation_id: Union[str, int] = ""
+    private_key: str = ""
+
+
+class NomadTestBody(BaseModel):
+    addr: str = ""
+    token: str = ""
+
+
+class LidarrTestBody(BaseModel):
+    url: str = ""
+    api_key: str = ""
+
+
+class YouTubeTestBody(BaseModel):
+    api_key: str = ""
+
+
+class KideoTestBody(BaseModel):
+    url: str = ""
+
+
 @router.post("/api/test/google")
-async def test_google(request: Request, _: None = Depends(_verify_admin)):
+async def test_google(
+    body: GoogleTestBody = GoogleTestBody(), _: None = Depends(_verify_admin)
+):
     """Test Google API key by listing models."""
-    try:
-        body = await request.json()
-    except Exception:
-        body = {}
-    api_key = body.get("api_key", "")
-    if not api_key:
-        store = get_credential_store()
-        if store.available:
-            api_key = store.get("google_api_key") or ""
-    if not api_key:
-        try:
-            from radbot.config.config_loader import config_loader
-
-            api_key = config_loader.get_config().get("api_keys", {}).get("google", "")
-        except Exception:
-            pass
+    api_key = _resolve_secret(
+        body.api_key, "google_api_key", _config_section("api_keys").get("google", "")
+    )
     if not api_key:
         return _err("No Google API key configured")
     try:
@@ -615,17 +824,9 @@ async def test_google(request: Request, _: None = Depends(_verify_admin)):
 @router.get("/api/models")
 async def list_models(_: None = Depends(_verify_admin)):
     """List available Gemini models that support content generation."""
-    api_key = ""
-    store = get_credential_store()
-    if store.available:
-        api_key = store.get("google_api_key") or ""
-    if not api_key:
-        try:
-            from radbot.config.config_loader import config_loader
-
-            api_key = config_loader.get_config().get("api_keys", {}).get("google", "")
-        except Exception:
-            pass
+    api_key = _resolve_secret(
+        "", "google_api_key", _config_section("api_keys").get("google", "")
+    )
     if not api_key:
         return {"models": []}
     try:
@@ -670,13 +871,12 @@ async def test_gmail(account: str, _: None = Depends(_verify_admin)):
 
 
 @router.post("/api/test/calendar")
-async def test_calendar(request: Request, _: None = Depends(_verify_admin)):
+async def test_calendar(_: None = Depends(_verify_admin)):
     """Test Google Calendar connectivity by listing 1 event."""
     try:
-        from radbot.config.config_loader import config_loader
         from radbot.tools.calendar.calendar_auth import get_calendar_service
 
-        cal_cfg = config_loader.get_config().get("integrations", {}).get("calendar", {})
+        cal_cfg = _config_section("integrations", "calendar")
         calendar_id = cal_cfg.get("calendar_id", "primary")
         service = get_calendar_service(force_new=True)
         if not service:
@@ -703,174 +903,96 @@ async def test_calendar(request: Request, _: None = Depends(_verify_admin)):
 
 
 @router.post("/api/test/jira")
-async def test_jira(request: Request, _: None = Depends(_verify_admin)):
+async def test_jira(
+    body: JiraTestBody = JiraTestBody(), _: None = Depends(_verify_admin)
+):
     """Test Jira connectivity with provided or stored credentials."""
-    try:
-        body = await request.json()
-    except Exception:
-        body = {}
-
-    url = body.get("url", "")
-    email = body.get("email", "")
-    api_token = body.get("api_token", "")
+    url = body.url
+    email = body.email
+    api_token = body.api_token
 
     # Fall back to stored config/credentials
+    cfg = _config_section("integrations", "jira")
     if not url or not email:
-        try:
-            from radbot.config.config_loader import config_loader
-
-            jira_cfg = (
-                config_loader.get_config().get("integrations", {}).get("jira", {})
-            )
-            url = url or jira_cfg.get("url", "")
-            email = email or jira_cfg.get("email", "")
-        except Exception:
-            pass
-    if not api_token or api_token == "***":
-        store = get_credential_store()
-        if store.available:
-            api_token = store.get("jira_api_token") or ""
-        if not api_token:
-            try:
-                from radbot.config.config_loader import config_loader
-
-                api_token = (
-                    config_loader.get_config()
-                    .get("integrations", {})
-                    .get("jira", {})
-                    .get("api_token", "")
-                )
-            except Exception:
-                pass
+        url = url or cfg.get("url", "")
+        email = email or cfg.get("email", "")
+    api_token = _resolve_secret(api_token, "jira_api_token", cfg.get("api_token", ""))
 
     if not url or not email or not api_token:
         return _err("Jira URL, email, and API token are all required")
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(
-                f"{url.rstrip('/')}/rest/api/2/myself",
-                auth=(email, api_token),
+        client = _get_test_http()
+        resp = await client.get(
+            f"{url.rstrip('/')}/rest/api/2/myself",
+            auth=(email, api_token),
+        )
+        if resp.status_code == 200:
+            data = resp.json()
+            return _ok(
+                f"Connected as {data.get('displayName', data.get('name', 'unknown'))}"
             )
-            if resp.status_code == 200:
-                data = resp.json()
-                return _ok(
-                    f"Connected as {data.get('displayName', data.get('name', 'unknown'))}"
-                )
-            return _err(f"Jira returned HTTP {resp.status_code}: {resp.text[:200]}")
+        return _err(f"Jira returned HTTP {resp.status_code}: {resp.text[:200]}")
     except Exception as e:
         return _err(f"Jira connection failed: {e}")
 
 
 @router.post("/api/test/overseerr")
-async def test_overseerr(request: Request, _: None = Depends(_verify_admin)):
+async def test_overseerr(
+    body: OverseerrTestBody = OverseerrTestBody(), _: None = Depends(_verify_admin)
+):
     """Test Overseerr connectivity with provided or stored credentials."""
-    try:
-        body = await request.json()
-    except Exception:
-        body = {}
-
-    url = body.get("url", "")
-    api_key = body.get("api_key", "")
+    url = body.url
+    api_key = body.api_key
 
     # Fall back to stored config/credentials
+    cfg = _config_section("integrations", "overseerr")
     if not url:
-        try:
-            from radbot.config.config_loader import config_loader
-
-            overseerr_cfg = (
-                config_loader.get_config().get("integrations", {}).get("overseerr", {})
-            )
-            url = url or overseerr_cfg.get("url", "")
-        except Exception:
-            pass
-    if not api_key or api_key == "***":
-        store = get_credential_store()
-        if store.available:
-            api_key = store.get("overseerr_api_key") or ""
-        if not api_key:
-            try:
-                from radbot.config.config_loader import config_loader
-
-                api_key = (
-                    config_loader.get_config()
-                    .get("integrations", {})
-                    .get("overseerr", {})
-                    .get("api_key", "")
-                )
-            except Exception:
-                pass
+        url = url or cfg.get("url", "")
+    api_key = _resolve_secret(api_key, "overseerr_api_key", cfg.get("api_key", ""))
 
     if not url or not api_key:
         return _err("Overseerr URL and API key are both required")
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(
-                f"{url.rstrip('/')}/api/v1/status",
-                headers={"X-Api-Key": api_key},
-            )
-            if resp.status_code == 200:
-                data = resp.json()
-                return _ok(f"Connected to Overseerr v{data.get('version', '?')}")
-            return _err(
-                f"Overseerr returned HTTP {resp.status_code}: {resp.text[:200]}"
-            )
+        client = _get_test_http()
+        resp = await client.get(
+            f"{url.rstrip('/')}/api/v1/status",
+            headers={"X-Api-Key": api_key},
+        )
+        if resp.status_code == 200:
+            data = resp.json()
+            return _ok(f"Connected to Overseerr v{data.get('version', '?')}")
+        return _err(f"Overseerr returned HTTP {resp.status_code}: {resp.text[:200]}")
     except Exception as e:
         return _err(f"Overseerr connection failed: {e}")
 
 
 @router.post("/api/test/home-assistant")
-async def test_home_assistant(request: Request, _: None = Depends(_verify_admin)):
+async def test_home_assistant(
+    body: HomeAssistantTestBody = HomeAssistantTestBody(),
+    _: None = Depends(_verify_admin),
+):
     """Test Home Assistant connectivity."""
-    try:
-        body = await request.json()
-    except Exception:
-        body = {}
-
-    ha_url = body.get("url", "")
-    ha_token = body.get("token", "")
+    ha_url = body.url
+    ha_token = body.token
 
+    cfg = _config_section("integrations", "home_assistant")
     if not ha_url:
-        try:
-            from radbot.config.config_loader import config_loader
-
-            ha_cfg = (
-                config_loader.get_config()
-                .get("integrations", {})
-                .get("home_assistant", {})
-            )
-            ha_url = ha_url or ha_cfg.get("url", "")
-        except Exception:
-            pass
-    if not ha_token or ha_token == "***":
-        store = get_credential_store()
-        if store.available:
-            ha_token = store.get("ha_token") or ""
-        if not ha_token:
-            try:
-                from radbot.config.config_loader import config_loader
-
-                ha_token = (
-                    config_loader.get_config()
-                    .get("integrations", {})
-                    .get("home_assistant", {})
-                    .get("token", "")
-                )
-            except Exception:
-                pass
+        ha_url = ha_url or cfg.get("url", "")
+    ha_token = _resolve_secret(ha_token, "ha_token", cfg.get("token", ""))
 
     if not ha_url or not ha_token:
         return _err("Home Assistant URL and token are required")
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(
-                f"{ha_url.rstrip('/')}/api/",
-                headers={"Authorization": f"Bearer {ha_token}"},
-            )
-            if resp.status_code != 200:
-                return _err(f"Home Assistant returned HTTP {resp.status_code}")
+        client = _get_test_http()
+        resp = await client.get(
+            f"{ha_url.rstrip('/')}/api/",
+            headers={"Authorization": f"Bearer {ha_token}"},
+        )
+        if resp.status_code != 200:
+            return _err(f"Home Assistant returned HTTP {resp.status_code}")
 
         # Also probe the MCP endpoint so the admin gets a single go/no-go
         # signal. We don't fail the whole test if MCP is absent — some HA
@@ -891,42 +1013,22 @@ async def test_home_assistant(request: Request, _: None = Depends(_verify_admin)
 
 
 @router.post("/api/test/qdrant")
-async def test_qdrant(request: Request, _: None = Depends(_verify_admin)):
+async def test_qdrant(
+    body: QdrantTestBody = QdrantTestBody(), _: None = Depends(_verify_admin)
+):
     """Test Qdrant vector DB connectivity."""
-    try:
-        body = await request.json()
-    except Exception:
-        body = {}
-
-    url = body.get("url", "")
-    api_key = body.get("api_key", "")
-    host = body.get("host", "")
-    port = body.get("port", None)
+    url = body.url
+    api_key = body.api_key
+    host = body.host
+    port = body.port
 
     # Fall back to config
+    cfg = _config_section("vector_db")
     if not url and not host:
-        try:
-            from radbot.config.config_loader import config_loader
-
-            vdb = config_loader.get_config().get("vector_db", {})
-            url = url or vdb.get("url", "")
-            host = host or vdb.get("host", "")
-            port = port or vdb.get("port", None)
-        except Exception:
-            pass
-    if not api_key or api_key == "***":
-        store = get_credential_store()
-        if store.available:
-            api_key = store.get("qdrant_api_key") or ""
-        if not api_key:
-            try:
-                from radbot.config.config_loader import config_loader
-
-                api_key = (
-                    config_loader.get_config().get("vector_db", {}).get("api_key", "")
-                )
-            except Exception:
-                pass
+        url = url or cfg.get("url", "")
+        host = host or cfg.get("host", "")
+        port = port or cfg.get("port", None)
+    api_key = _resolve_secret(api_key, "qdrant_api_key", cfg.get("api_key", ""))
 
     try:
         from qdrant_client import QdrantClient
@@ -952,45 +1054,20 @@ async def test_qdrant(request: Request, _: None = Depends(_verify_admin)):
 
 
 @router.post("/api/test/ntfy")
-async def test_ntfy(request: Request, _: None = Depends(_verify_admin)):
+async def test_ntfy(
+    body: NtfyTestBody = NtfyTestBody(), _: None = Depends(_verify_admin)
+):
     """Test ntfy push notification by sending a test message."""
-    try:
-        body = await request.json()
-    except Exception:
-        body = {}
-
-    url = body.get("url", "")
-    topic = body.get("topic", "")
-    token = body.get("token", "")
+    url = body.url
+    topic = body.topic
+    token = body.token
 
     # Fall back to stored config
+    cfg = _config_section("integrations", "ntfy")
     if not url or not topic:
-        try:
-            from radbot.config.config_loader import config_loader
-
-            ntfy_cfg = (
-                config_loader.get_config().get("integrations", {}).get("ntfy", {})
-            )
-            url = url or ntfy_cfg.get("url", "https://ntfy.sh")
-            topic = topic or ntfy_cfg.get("topic", "")
-        except Exception:
-            pass
-    if not token or token == "***":
-        store = get_credential_store()
-        if store.available:
-            token = store.get("ntfy_token") or ""
-        if not token:
-            try:
-                from radbot.config.config_loader import config_loader
-
-                token = (
-                    config_loader.get_config()
-                    .get("integrations", {})
-                    .get("ntfy", {})
-                    .get("token", "")
-                )
-            except Exception:
-                pass
+        url = url or cfg.get("url", "https://ntfy.sh")
+        topic = topic or cfg.get("topic", "")
+    token = _resolve_secret(token, "ntfy_token", cfg.get("token", ""))
 
     if not topic:
         return _err("ntfy topic is required")
@@ -1003,63 +1080,38 @@ async def test_ntfy(request: Request, _: None = Depends(_verify_admin)):
         if token:
             headers["Authorization"] = f"Bearer {token}"
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(
-                f"{url.rstrip('/')}/{topic}",
-                content="Push notifications are working!",
-                headers=headers,
-            )
-            if resp.status_code == 200:
-                return _ok(f"Test notification sent to {topic}")
-            return _err(f"ntfy returned HTTP {resp.status_code}: {resp.text[:200]}")
+        client = _get_test_http()
+        resp = await client.post(
+            f"{url.rstrip('/')}/{topic}",
+            content="Push notifications are working!",
+            headers=headers,
+        )
+        if resp.status_code == 200:
+            return _ok(f"Test notification sent to {topic}")
+        return _err(f"ntfy returned HTTP {resp.status_code}: {resp.text[:200]}")
     except Exception as e:
         return _err(f"ntfy test failed: {e}")
 
 
 @router.post("/api/test/picnic")
-async def test_picnic(request: Request, _: None = Depends(_verify_admin)):
+async def test_picnic(
+    body: PicnicTestBody = PicnicTestBody(), _: None = Depends(_verify_admin)
+):
     """Test Picnic connectivity by logging in with credentials."""
-    try:
-        body = await request.json()
-    except Exception:
-        body = {}
-
-    username = body.get("username", "")
-    password = body.get("password", "")
-    country_code = body.get("country_code", "DE")
+    username = body.username
+    password = body.password
+    country_code = body.country_code
 
     # Fall back to stored config/credentials
+    cfg = _config_section("integrations", "picnic")
     if not username:
-        try:
-            from radbot.config.config_loader import config_loader
-
-            picnic_cfg = (
-                config_loader.get_config().get("integrations", {}).get("picnic", {})
-            )
-            username = username or picnic_cfg.get("username", "")
-            country_code = picnic_cfg.get("country_code", country_code)
-        except Exception:
-            pass
+        username = username or cfg.get("username", "")
+        country_code = cfg.get("country_code", country_code)
     if not username:
         store = get_credential_store()
         if store.available:
             username = store.get("picnic_username") or ""
-    if not password or password == "***":
-        store = get_credential_store()
-        if store.available:
-            password = store.get("picnic_password") or ""
-        if not password:
-            try:
-                from radbot.config.config_loader import config_loader
-
-                password = (
-                    config_loader.get_config()
-                    .get("integrations", {})
-                    .get("picnic", {})
-                    .get("password", "")
-                )
-            except Exception:
-                pass
+    password = _resolve_secret(password, "picnic_password", cfg.get("password", ""))
 
     if not username or not password:
         return _err("Picnic username and password are both required")
@@ -1082,45 +1134,22 @@ async def test_picnic(request: Request, _: None = Depends(_verify_admin)):
 
 
 @router.post("/api/test/github")
-async def test_github(request: Request, _: None = Depends(_verify_admin)):
+async def test_github(
+    body: GitHubTestBody = GitHubTestBody(), _: None = Depends(_verify_admin)
+):
     """Test GitHub App connectivity by verifying the JWT against the GitHub API."""
-    try:
-        body = await request.json()
-    except Exception:
-        body = {}
-
-    app_id = body.get("app_id", "")
-    installation_id = body.get("installation_id", "")
-    private_key = body.get("private_key", "")
+    app_id = body.app_id
+    installation_id = body.installation_id
+    private_key = body.private_key
 
     # Fall back to stored config
+    cfg = _config_section("integrations", "github")
     if not app_id or not installation_id:
-        try:
-            from radbot.config.config_loader import config_loader
-
-            gh_cfg = (
-                config_loader.get_config().get("integrations", {}).get("github", {})
-            )
-            app_id = app_id or gh_cfg.get("app_id", "")
-            installation_id = installation_id or gh_cfg.get("installation_id", "")
-        except Exception:
-            pass
-    if not private_key or private_key == "***":
-        store = get_credential_store()
-        if store.available:
-            private_key = store.get("github_app_private_key") or ""
-        if not private_key:
-            try:
-                from radbot.config.config_loader import config_loader
-
-                private_key = (
-                    config_loader.get_config()
-                    .get("integrations", {})
-                    .get("github", {})
-                    .get("private_key", "")
-                )
-            except Exception:
-                pass
+        app_id = app_id or cfg.get("app_id", "")
+        installation_id = installation_id or cfg.get("installation_id", "")
+    private_key = _resolve_secret(
+        private_key, "github_app_private_key", cfg.get("private_key", "")
+    )
 
     if not app_id or not installation_id or not private_key:
         return _err("GitHub App ID, Installation ID, and private key are all required")
@@ -1138,7 +1167,7 @@ async def test_github(request: Request, _: None = Depends(_verify_admin)):
 
 
 @router.post("/api/test/claude-code")
-async def test_claude_code(request: Request, _: None = Depends(_verify_admin)):
+async def test_claude_code(_: None = Depends(_verify_admin)):
     """Test Claude Code CLI availability and token configuration."""
     try:
         from radbot.tools.claude_code.claude_code_client import get_claude_code_status
@@ -1152,15 +1181,12 @@ async def test_claude_code(request: Request, _: None = Depends(_verify_admin)):
 
 
 @router.post("/api/test/nomad")
-async def test_nomad(request: Request, _: None = Depends(_verify_admin)):
+async def test_nomad(
+    body: NomadTestBody = NomadTestBody(), _: None = Depends(_verify_admin)
+):
     """Test Nomad API connectivity using the configured address and token."""
-    try:
-        body = await request.json()
-    except Exception:
-        body = {}
-
-    addr = body.get("addr", "").strip()
-    token = body.get("token", "").strip()
+    addr = body.addr.strip()
+    token = body.token.strip()
 
     if not addr:
         return _err("Nomad address is required")
@@ -1178,135 +1204,85 @@ async def test_nomad(request: Request, _: None = Depends(_verify_admin)):
 
 
 @router.post("/api/test/lidarr")
-async def test_lidarr(request: Request, _: None = Depends(_verify_admin)):
+async def test_lidarr(
+    body: LidarrTestBody = LidarrTestBody(), _: None = Depends(_verify_admin)
+):
     """Test Lidarr connectivity with provided or stored credentials."""
-    try:
-        body = await request.json()
-    except Exception:
-        body = {}
-
-    url = body.get("url", "")
-    api_key = body.get("api_key", "")
+    url = body.url
+    api_key = body.api_key
 
     # Fall back to stored config/credentials
+    cfg = _config_section("integrations", "lidarr")
     if not url:
-        try:
-            from radbot.config.config_loader import config_loader
-
-            lidarr_cfg = (
-                config_loader.get_config().get("integrations", {}).get("lidarr", {})
-            )
-            url = url or lidarr_cfg.get("url", "")
-        except Exception:
-            pass
-    if not api_key or api_key == "***":
-        store = get_credential_store()
-        if store.available:
-            api_key = store.get("lidarr_api_key") or ""
-        if not api_key:
-            try:
-                from radbot.config.config_loader import config_loader
-
-                api_key = (
-                    config_loader.get_config()
-                    .get("integrations", {})
-                    .get("lidarr", {})
-                    .get("api_key", "")
-                )
-            except Exception:
-                pass
+        url = url or cfg.get("url", "")
+    api_key = _resolve_secret(api_key, "lidarr_api_key", cfg.get("api_key", ""))
 
     if not url or not api_key:
         return _err("Lidarr URL and API key are both required")
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(
-                f"{url.rstrip('/')}/api/v1/system/status",
-                headers={"X-Api-Key": api_key},
-            )
-            if resp.status_code == 200:
-                data = resp.json()
-                return _ok(f"Connected to Lidarr v{data.get('version', '?')}")
-            return _err(f"Lidarr returned HTTP {resp.status_code}: {resp.text[:200]}")
+        client = _get_test_http()
+        resp = await client.get(
+            f"{url.rstrip('/')}/api/v1/system/status",
+            headers={"X-Api-Key": api_key},
+        )
+        if resp.status_code == 200:
+            data = resp.json()
+            return _ok(f"Connected to Lidarr v{data.get('version', '?')}")
+        return _err(f"Lidarr returned HTTP {resp.status_code}: {resp.text[:200]}")
     except Exception as e:
         return _err(f"Lidarr connection failed: {e}")
 
 
 @router.post("/api/test/youtube")
-async def test_youtube(request: Request, _: None = Depends(_verify_admin)):
+async def test_youtube(
+    body: YouTubeTestBody = YouTubeTestBody(), _: None = Depends(_verify_admin)
+):
     """Test YouTube Data API v3 connectivity with provided or stored API key."""
-    try:
-        body = await request.json()
-    except Exception:
-        body = {}
-
-    api_key = body.get("api_key", "")
+    api_key = body.api_key
 
     # Fall back to stored credentials
-    if not api_key or api_key == "***":
-        store = get_credential_store()
-        if store.available:
-            api_key = store.get("youtube_api_key") or ""
-        if not api_key:
-            try:
-                from radbot.config.config_loader import config_loader
-
-                api_key = (
-                    config_loader.get_config()
-                    .get("integrations", {})
-                    .get("youtube", {})
-                    .get("api_key", "")
-                )
-            except Exception:
-                pass
-        if not api_key:
-            api_key = os.environ.get("YOUTUBE_API_KEY", "")
+    api_key = _resolve_secret(
+        api_key,
+        "youtube_api_key",
+        _config_section("integrations", "youtube").get("api_key", "")
+        or os.environ.get("YOUTUBE_API_KEY", ""),
+    )
 
     if not api_key:
         return _err("YouTube API key is required")
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(
-                "https://www.googleapis.com/youtube/v3/search",
-                params={
-                    "part": "snippet",
-                    "q": "test",
-                    "maxResults": 1,
-                    "type": "video",
-                    "key": api_key,
-                },
-            )
-            if resp.status_code == 200:
-                return _ok("YouTube Data API v3 connected successfully")
-            data = resp.json()
-            err_msg = data.get("error", {}).get("message", resp.text[:200])
-            return _err(f"YouTube API error: {err_msg}")
+        client = _get_test_http()
+        resp = await client.get(
+            "https://www.googleapis.com/youtube/v3/search",
+            params={
+                "part": "snippet",
+                "q": "test",
+                "maxResults": 1,
+                "type": "video",
+                "key": api_key,
+            },
+        )
+        if resp.status_code == 200:
+            return _ok("YouTube Data API v3 connected successfully")
+        data = resp.json()
+        err_msg = data.get("error", {}).get("message", resp.text[:200])
+        return _err(f"YouTube API error: {err_msg}")
     except Exception as e:
         return _err(f"YouTube connection failed: {e}")
 
 
 @router.post("/api/test/kideo")
-async def test_kideo(request: Request, _: None = Depends(_verify_admin)):
+async def test_kideo(
+    body: KideoTestBody = KideoTestBody(), _: None = Depends(_verify_admin)
+):
     """Test Kideo connectivity."""
-    try:
-        body = await request.json()
-    except Exception:
-        body = {}
-
-    url = body.get("url", "")
+    url = body.url
 
+    cfg = _config_section("integrations", "kideo")
     if not url:
-        try:
-            from radbot.config.config_loader import config_loader
-
-            kideo_cfg = (
-                config_loader.get_config().get("integrations", {}).get("kideo", {})
-            )
-            url = kideo_cfg.get("url", "")
-        except Exception:
-            pass
+        url = cfg.get("url", "")
     if not url:
         url = os.environ.get("KIDEO_URL", "")
 
@@ -1314,12 +1290,12 @@ async def test_kideo(request: Request, _: None = Depends(_verify_admin)):
         return _err("Kideo URL is required")
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(f"{url.rstrip('/')}/api/collections")
-            if resp.status_code == 200:
-                data = resp.json()
-                return _ok(f"Connected to Kideo — {len(data)} collection(s)")
-            return _err(f"Kideo returned HTTP {resp.status_code}: {resp.text[:200]}")
+        client = _get_test_http()
+        resp = await client.get(f"{url.rstrip('/')}/api/collections")
+        if resp.status_code == 200:
+            data = resp.json()
+            return _ok(f"Connected to Kideo — {len(data)} collection(s)")
+        return _err(f"Kideo returned HTTP {resp.status_code}: {resp.text[:200]}")
     except Exception as e:
         return _err(f"Kideo connection failed: {e}")
 
@@ -99,7 +99,9 @@ def _require_admin(request: Request):
         raise HTTPException(503, "Admin API disabled")
 
     auth = request.headers.get("Authorization", "")
-    if auth.startswith("Bearer ") and auth[7:] == expected:
+    if auth.startswith("Bearer ") and hmac.compare_digest(
+        auth[7:].encode(), expected.encode()
+    ):
         return
     raise HTTPException(401, "Invalid or missing admin bearer token")
 
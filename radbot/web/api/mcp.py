@@ -23,6 +23,7 @@ with `metadata_merge`.
 
 from __future__ import annotations
 
+import hmac
 import logging
 import os
 import secrets
@@ -62,7 +63,7 @@ def _verify_admin(
             pass
     if not expected:
         raise HTTPException(503, "Admin API disabled — RADBOT_ADMIN_TOKEN not set")
-    if creds and creds.credentials == expected:
+    if creds and hmac.compare_digest(creds.credentials.encode(), expected.encode()):
         return
     raise HTTPException(401, "Invalid or missing admin bearer token")
 
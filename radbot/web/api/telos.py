@@ -7,6 +7,7 @@ the admin panel, and supports markdown import/export for power users.
 
 from __future__ import annotations
 
+import hmac
 import logging
 import os
 from typing import Any, Dict, List, Optional
@@ -50,7 +51,9 @@ def _require_admin(request: Request) -> None:
     if not expected:
         raise HTTPException(503, "Admin API disabled — RADBOT_ADMIN_TOKEN not set")
     auth = request.headers.get("Authorization", "")
-    if auth.startswith("Bearer ") and auth[7:] == expected:
+    if auth.startswith("Bearer ") and hmac.compare_digest(
+        auth[7:].encode(), expected.encode()
+    ):
         return
     raise HTTPException(401, "Invalid or missing admin bearer token")
 
@@ -60,20 +63,6 @@ def _require_admin(request: Request) -> None:
 # ---------------------------------------------------------------------------
 
 
-def _serialize(entry: Entry) -> Dict[str, Any]:
-    return {
-        "entry_id": entry.entry_id,
-        "section": entry.section.value,
-        "ref_code": entry.ref_code,
-        "content": entry.content,
-        "metadata": entry.metadata,
-        "status": entry.status,
-        "sort_order": entry.sort_order,
-        "created_at": entry.created_at.isoformat() if entry.created_at else None,
-        "updated_at": entry.updated_at.isoformat() if entry.updated_at else None,
-    }
-
-
 def _parse_section(name: str) -> Section:
     try:
         return Section(name)
@@ -150,24 +139,10 @@ class ResolvePredictionInput(BaseModel):
 async def projects_summary() -> Dict[str, Any]:
     """Flat list of projects with derived milestone/task counts. Feeds the
     `/projects` page left rail. Unauth'd read."""
-    projects = telos_db.list_section(Section.PROJECTS, status=None)
-    milestones = telos_db.list_section(Section.MILESTONES, status="active")
-    tasks = telos_db.list_section(Section.PROJECT_TASKS, status="active")
-
     items = []
-    for p in projects:
+    for p, counts in telos_db.project_summaries():
         if not p.ref_code:
             continue
-        p_milestones = [
-            m
-            for m in milestones
-            if (m.metadata or {}).get("parent_project") == p.ref_code
-        ]
-        p_tasks = [
-            t for t in tasks if (t.metadata or {}).get("parent_project") == p.ref_code
-        ]
-        done = [t for t in p_tasks if (t.metadata or {}).get("task_status") == "done"]
-        active = [t for t in p_tasks if (t.metadata or {}).get("task_status") != "done"]
         items.append(
             {
                 "ref_code": p.ref_code,
@@ -175,9 +150,7 @@ async def projects_summary() -> Dict[str, Any]:
                     (p.content or "").splitlines()[0][:160] if p.content else p.ref_code
                 ),
                 "status": p.status,
-                "milestone_count": len(p_milestones),
-                "active_task_count": len(active),
-                "done_task_count": len(done),
+                **counts,
                 "sort_order": p.sort_order,
                 "updated_at": p.updated_at.isoformat() if p.updated_at else None,
             }
@@ -207,7 +180,7 @@ async def projects_entries(
         except ValueError:
             continue
         entries = telos_db.list_section(sec, status=status)
-        out[sec.value] = [_serialize(e) for e in entries]
+        out[sec.value] = [e.to_dict() for e in entries]
     return {"sections": out}
 
 
@@ -236,7 +209,7 @@ async def patch_project_task(
     )
     if not entry:
         raise HTTPException(404, f"No task {ref_code}.")
-    return _serialize(entry)
+    return entry.to_dict()
 
 
 # ---------------------------------------------------------------------------
@@ -281,7 +254,7 @@ async def get_section(
     entries = telos_db.list_section(sec, status=status, order_by=order)
     return {
         "section": sec.value,
-        "entries": [_serialize(e) for e in entries],
+        "entries": [e.to_dict() for e in entries],
     }
 
 
@@ -295,7 +268,7 @@ async def get_entry(
     entry = telos_db.get_entry(sec, ref_code)
     if not entry:
         raise HTTPException(404, f"No entry {ref_code} in {sec.value}.")
-    return _serialize(entry)
+    return entry.to_dict()
 
 
 @router.post("/entry/{section}", status_code=201)
@@ -315,7 +288,7 @@ async def add_entry(
         status=body.status,
         sort_order=body.sort_order,
     )
-    return _serialize(entry)
+    return entry.to_dict()
 
 
 @router.put("/entry/{section}/{ref_code}")
@@ -343,7 +316,7 @@ async def update_entry(
     )
     if not entry:
         raise HTTPException(404, f"No entry {ref_code} in {sec.value}.")
-    return _serialize(entry)
+    return entry.to_dict()
 
 
 @router.post("/archive/{section}/{ref_code}")
@@ -463,6 +436,6 @@ async def resolve_prediction(
 
     return {
         "status": "success",
-        "entry": _serialize(updated) if updated else None,
+        "entry": updated.to_dict() if updated else None,
         "miscalibrated": miscalibrated,
     }
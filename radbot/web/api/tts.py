@@ -2,6 +2,7 @@
 FastAPI router for Text-to-Speech synthesis.
 """
 
+import copy
 import logging
 from typing import Optional
 
@@ -40,29 +41,22 @@ async def synthesize(body: SynthesizeRequest):
             # Create a default instance
             service = TTSService.create_instance()
 
-        # Override voice settings if provided in the request
-        original_voice = service.voice_name
-        original_lang = service.language_code
-        original_rate = service.speaking_rate
-        original_pitch = service.pitch
+        # Override voice settings on a shallow copy: the synthesis awaits, so
+        # mutating the shared singleton would leak into concurrent requests.
+        # The copy still shares the singleton's audio cache.
+        overrides = {
+            "voice_name": body.voice_name,
+            "language_code": body.language_code,
+            "speaking_rate": body.speaking_rate,
+            "pitch": body.pitch,
+        }
+        overrides = {k: v for k, v in overrides.items() if v is not None and v != ""}
+        if overrides:
+            service = copy.copy(service)
+            for attr, value in overrides.items():
+                setattr(service, attr, value)
 
-        try:
-            if body.voice_name:
-                service.voice_name = body.voice_name
-            if body.language_code:
-                service.language_code = body.language_code
-            if body.speaking_rate is not None:
-                service.speaking_rate = body.speaking_rate
-            if body.pitch is not None:
-                service.pitch = body.pitch
-
-            audio_bytes = service.synthesize(body.text)
-        finally:
-            # Restore original settings
-            service.voice_name = original_voice
-            service.language_code = original_lang
-            service.speaking_rate = original_rate
-            service.pitch = original_pitch
+        audio_bytes = await service.synthesize_async(body.text)
 
         return Response(
             content=audio_bytes,
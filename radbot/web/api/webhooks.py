@@ -37,7 +37,7 @@ async def list_webhook_definitions():
         webhooks = list_webhooks()
         return serialize_rows(webhooks, mask_fields={"secret": "***"})
     except Exception as e:
-        logger.error(f"Error listing webhooks: {e}", exc_info=True)
+        logger.error("Error listing webhooks: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -53,9 +53,9 @@ async def create_webhook_definition(body: WebhookCreateBody):
             prompt_template=body.prompt_template,
             secret=body.secret,
         )
-        return {"status": "success", "webhook_id": str(row["webhook_id"])}
+        return {"status": "success", "webhook_id": row["webhook_id"]}
     except Exception as e:
-        logger.error(f"Error creating webhook: {e}", exc_info=True)
+        logger.error("Error creating webhook: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -77,7 +77,7 @@ async def delete_webhook_definition(webhook_id: str):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error deleting webhook: {e}", exc_info=True)
+        logger.error("Error deleting webhook: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -100,9 +100,12 @@ async def trigger_webhook(path_suffix: str, request: Request):
     """
     try:
         from radbot.tools.webhooks.db import get_webhook_by_path, record_trigger
-        from radbot.tools.webhooks.template_renderer import render_template
+        from radbot.tools.webhooks.template_renderer import (
+            compile_template,
+            render_compiled,
+        )
     except Exception as e:
-        logger.error(f"Failed to import webhook modules: {e}")
+        logger.error("Failed to import webhook modules: %s", e)
         raise HTTPException(status_code=500, detail="Webhook system not available")
 
     # Look up webhook
@@ -132,29 +135,33 @@ async def trigger_webhook(path_suffix: str, request: Request):
         raise HTTPException(status_code=400, detail="Invalid JSON payload")
 
     # Render the prompt
-    rendered_prompt = render_template(webhook["prompt_template"], payload)
+    rendered_prompt = render_compiled(
+        compile_template(webhook["prompt_template"]), payload
+    )
     logger.info(
-        f"Webhook '{webhook['name']}' triggered, rendered prompt: {rendered_prompt[:100]}"
+        "Webhook '%s' triggered, rendered prompt: %s",
+        webhook["name"],
+        rendered_prompt[:100],
     )
 
     # Record the trigger
     try:
         record_trigger(webhook["webhook_id"])
     except Exception as e:
-        logger.warning(f"Failed to record webhook trigger: {e}")
+        logger.warning("Failed to record webhook trigger: %s", e)
 
     # Process the prompt asynchronously and push results via WebSocket
     import asyncio
 
     asyncio.create_task(
         _process_and_broadcast(
-            webhook_id=str(webhook["webhook_id"]),
+            webhook_id=webhook["webhook_id"],
             webhook_name=webhook["name"],
             prompt=rendered_prompt,
         )
     )
 
-    return {"status": "accepted", "webhook_id": str(webhook["webhook_id"])}
+    return {"status": "accepted", "webhook_id": webhook["webhook_id"]}
 
 
 async def _process_and_broadcast(
@@ -173,11 +180,15 @@ async def _process_and_broadcast(
         result = await runner.process_message(prompt)
         response_text = result.get("response", "")
         logger.info(
-            f"Webhook '{webhook_name}' processed, response length={len(response_text)}"
+            "Webhook '%s' processed, response length=%s",
+            webhook_name,
+            len(response_text),
         )
     except Exception as e:
         response_text = f"Error processing webhook: {e}"
-        logger.error(f"Error processing webhook '{webhook_name}': {e}", exc_info=True)
+        logger.error(
+            "Error processing webhook '%s': %s", webhook_name, e, exc_info=True
+        )
 
     # Broadcast to all active WebSocket connections
     try:
@@ -193,4 +204,4 @@ async def _process_and_broadcast(
         }
         await manager.broadcast_to_all_sessions(message_payload)
     except Exception as e:
-        logger.error(f"Failed to broadcast webhook result: {e}")
+        logger.error("Failed to broadcast webhook result: %s", e)
@@ -58,6 +58,7 @@ from radbot.web.api.terminal import router as terminal_router
 from radbot.web.api.tts import router as tts_router
 from radbot.web.api.videos import router as videos_router
 from radbot.web.api.webhooks import router as webhooks_router
+from radbot.web.spa import react_index_html
 
 logger = logging.getLogger(__name__)
 
@@ -552,6 +553,28 @@ async def shutdown_terminals():
         logger.error(f"Error shutting down terminal sessions: {e}", exc_info=True)
 
 
+@app.on_event("shutdown")
+async def shutdown_webhook_triggers():
+    """Write any buffered webhook trigger counts."""
+    try:
+        from radbot.tools.webhooks.db import flush_triggers
+
+        flush_triggers()
+    except Exception as e:
+        logger.error(f"Error flushing webhook triggers: {e}", exc_info=True)
+
+
+@app.on_event("shutdown")
+async def shutdown_admin_http_client():
+    """Close the admin test endpoints' shared HTTP client."""
+    try:
+        from radbot.web.api.admin import close_test_http
+
+        await close_test_http()
+    except Exception as e:
+        logger.error(f"Error closing admin HTTP client: {e}", exc_info=True)
+
+
 # Handle X-Forwarded-Proto/Host behind reverse proxies (Traefik, etc.)
 # This ensures redirects use the correct scheme (https) when behind a proxy.
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware  # noqa: E402
@@ -757,23 +780,11 @@ class ConnectionManager:
 manager = ConnectionManager()
 
 
-def _react_index_path() -> Optional[str]:
-    """Return the path to the React build index.html if it exists."""
-    dist_index = os.path.join(os.path.dirname(__file__), "static", "dist", "index.html")
-    return dist_index if os.path.isfile(dist_index) else None
-
-
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
     """Render the main chat interface (React SPA)."""
-    react_index = _react_index_path()
-    if react_index:
-        with open(react_index, "r") as f:
-            html = f.read()
-        # Rewrite asset paths: Vite outputs /assets/... but we serve from /static/dist/assets/...
-        html = html.replace('"/assets/', '"/static/dist/assets/')
-        html = html.replace("'/assets/", "'/static/dist/assets/")
-        html = html.replace('"/favicon.png"', '"/static/dist/favicon.png"')
+    html = react_index_html()
+    if html is not None:
         return HTMLResponse(content=html)
     return HTMLResponse(
         content="<h1>RadBot</h1><p>React frontend not built. Run <code>make build-frontend</code> first.</p>",
@@ -0,0 +1,40 @@
+"""Cached React SPA entry page.
+
+Vite emits ``index.html`` with root-relative ``/assets/...`` URLs, but the
+build is served from ``/static/dist/``. The rewritten page is kept in memory
+and only re-read when the file's mtime changes (i.e. after a rebuild).
+"""
+
+import os
+import threading
+from typing import Optional, Tuple
+
+DIST_INDEX = os.path.join(os.path.dirname(__file__), "static", "dist", "index.html")
+
+_cache: Optional[Tuple[int, str]] = None
+_cache_lock = threading.Lock()
+
+
+def _rewrite(html: str) -> str:
+    html = html.replace('"/assets/', '"/static/dist/assets/')
+    html = html.replace("'/assets/", "'/static/dist/assets/")
+    return html.replace('"/favicon.png"', '"/static/dist/favicon.png"')
+
+
+def react_index_html() -> Optional[str]:
+    """Return the rewritten SPA ``index.html``, or None if the frontend isn't built."""
+    global _cache
+    try:
+        mtime = os.stat(DIST_INDEX).st_mtime_ns
+    except OSError:
+        return None
+    cached = _cache
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with _cache_lock:
+        if _cache is not None and _cache[0] == mtime:
+            return _cache[1]
+        with open(DIST_INDEX, "r") as f:
+            html = _rewrite(f.read())
+        _cache = (mtime, html)
+        return html
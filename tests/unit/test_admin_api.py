@@ -0,0 +1,233 @@
+"""Unit tests for radbot.web.api.admin (auth guard and config endpoints)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from radbot.web.api.admin import _verify_admin
+
+
+def _creds(token):
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+class TestVerifyAdmin:
+    def test_accepts_matching_token(self, monkeypatch):
+        monkeypatch.setenv("RADBOT_ADMIN_TOKEN", "s3cret-tøken")
+        assert _verify_admin(MagicMock(), _creds("s3cret-tøken")) is None
+
+    @pytest.mark.parametrize("token", ["wrong", "s3cret", "s3cret-tøken!", "ünï"])
+    def test_rejects_other_tokens(self, monkeypatch, token):
+        monkeypatch.setenv("RADBOT_ADMIN_TOKEN", "s3cret-tøken")
+        with pytest.raises(HTTPException) as exc:
+            _verify_admin(MagicMock(), _creds(token))
+        assert exc.value.status_code == 401
+
+    def test_missing_credentials(self, monkeypatch):
+        monkeypatch.setenv("RADBOT_ADMIN_TOKEN", "s3cret")
+        with pytest.raises(HTTPException) as exc:
+            _verify_admin(MagicMock(), None)
+        assert exc.value.status_code == 401
+
+
+class TestLiveConfig:
+    async def test_redacts_without_mutating_live_config(self):
+        from unittest.mock import patch
+
+        from radbot.web.api import admin
+
+        live = {
+            "database": {"host": "db", "password": "pw"},
+            "api_keys": {"google": "k", "empty": ""},
+            "agent": {"main_model": "m"},
+        }
+        with patch(
+            "radbot.config.config_loader.config_loader.get_config",
+            return_value=live,
+        ):
+            out = await admin.get_live_config(None)
+        assert out["database"] == {"host": "db", "password": "***"}
+        assert out["api_keys"] == {"google": "***", "empty": ""}
+        assert out["agent"] == {"main_model": "m"}
+        assert live["database"]["password"] == "pw"
+        assert live["api_keys"]["google"] == "k"
+
+    def test_redaction_shares_untouched_subtrees(self):
+        from radbot.web.api import admin
+
+        rules = {"big": ["blob"]}
+        live = {
+            "rules": rules,
+            "integrations": {
+                "jira": {"url": "u", "api_token": "t"},
+                "ntfy": {"topic": "x", "token": ""},
+                "kideo": {"url": "k"},
+            },
+        }
+        out = admin._redacted(live)
+        assert out["rules"] is rules
+        assert out["integrations"]["jira"] == {"url": "u", "api_token": "***"}
+        assert out["integrations"]["ntfy"] == {"topic": "x", "token": ""}
+        assert out["integrations"]["kideo"] is live["integrations"]["kideo"]
+        assert live["integrations"]["jira"]["api_token"] == "t"
+
+
+class TestConfigSection:
+    def test_walks_path_and_defaults_to_empty(self):
+        from unittest.mock import patch
+
+        from radbot.web.api import admin
+
+        live = {"integrations": {"jira": {"url": "u"}, "odd": "x"}}
+        with patch(
+            "radbot.config.config_loader.config_loader.get_config",
+            return_value=live,
+        ):
+            assert admin._config_section("integrations", "jira") == {"url": "u"}
+            assert admin._config_section("integrations", "missing") == {}
+            assert admin._config_section("integrations", "odd") == {}
+            assert admin._config_section("integrations", "odd", "deeper") == {}
+
+
+class _FakeStore:
+    available = True
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.version = 0
+        self.gets = 0
+
+    def get(self, name):
+        self.gets += 1
+        return self.entries.get(name)
+
+    def get_many(self, prefix):
+        self.gets += 1
+        return {n: v for n, v in self.entries.items() if n.startswith(prefix)}
+
+
+class TestResolveSecret:
+    def test_precedence_and_version_cache(self, monkeypatch):
+        from radbot.web.api import admin
+
+        store = _FakeStore({"jira_api_token": "stored"})
+        monkeypatch.setattr(admin, "get_credential_store", lambda: store)
+        monkeypatch.setattr(admin, "_secret_cache", {})
+
+        assert admin._resolve_secret("given", "jira_api_token", "cfg") == "given"
+        assert store.gets == 0
+        assert admin._resolve_secret("***", "jira_api_token", "cfg") == "stored"
+        assert admin._resolve_secret("", "jira_api_token", "cfg") == "stored"
+        assert store.gets == 1
+
+        store.entries["jira_api_token"] = "rotated"
+        store.version += 1
+        assert admin._resolve_secret("", "jira_api_token", "cfg") == "rotated"
+        assert admin._resolve_secret("", "missing_key", "cfg") == "cfg"
+        assert admin._resolve_secret("", "missing_key") == ""
+
+
+def _request(etag=None):
+    req = MagicMock()
+    req.headers = {"if-none-match": etag} if etag else {}
+    return req
+
+
+class TestAllConfigCache:
+    async def test_cached_until_version_changes_with_etag(self, monkeypatch):
+        import json
+        from unittest.mock import patch
+
+        from radbot.web.api import admin
+
+        store = _FakeStore({"config:agent": '{"m": 1}', "ha_token": "x"})
+        monkeypatch.setattr(admin, "_all_config_cache", None)
+        with patch.object(admin, "_require_store", return_value=store):
+            first = await admin.get_all_config(_request(), None)
+            assert json.loads(first.body) == {"agent": {"m": 1}}
+            etag = first.headers["etag"]
+
+            again = await admin.get_all_config(_request(), None)
+            assert again.body == first.body and store.gets == 1
+
+            not_modified = await admin.get_all_config(_request(etag), None)
+            assert not_modified.status_code == 304
+
+            store.entries["config:agent"] = '{"m": 2}'
+            store.version += 1
+            fresh = await admin.get_all_config(_request(etag), None)
+        assert fresh.status_code == 200
+        assert json.loads(fresh.body) == {"agent": {"m": 2}}
+        assert fresh.headers["etag"] != etag
+
+    async def test_ttl_expiry_reloads(self, monkeypatch):
+        from unittest.mock import patch
+
+        from radbot.web.api import admin
+
+        store = _FakeStore({"config:agent": '{"m": 1}'})
+        monkeypatch.setattr(admin, "_all_config_cache", None)
+        monkeypatch.setattr(admin, "_ALL_CONFIG_TTL", 0.0)
+        with patch.object(admin, "_require_store", return_value=store):
+            await admin.get_all_config(_request(), None)
+            await admin.get_all_config(_request(), None)
+        assert store.gets == 2
+
+
+class TestGmailAccountsCache:
+    async def test_reused_until_store_version_changes(self, monkeypatch):
+        from unittest.mock import patch
+
+        from radbot.web.api import admin
+
+        store = _FakeStore({})
+        monkeypatch.setattr(admin, "get_credential_store", lambda: store)
+        monkeypatch.setattr(admin, "_gmail_accounts_cache", None)
+        found = [{"account": "default", "email": "a@b", "source": "x"}]
+        with patch(
+            "radbot.tools.gmail.gmail_auth.discover_accounts", return_value=found
+        ) as discover:
+            first = await admin.list_gmail_accounts(None)
+            await admin.list_gmail_accounts(None)
+            assert discover.call_count == 1
+            store.version += 1
+            await admin.list_gmail_accounts(None)
+            assert discover.call_count == 2
+        assert first == {"accounts": found}
+
+
+class TestRequestBodies:
+    def _client(self, monkeypatch):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from radbot.web.api import admin
+
+        monkeypatch.setenv("RADBOT_ADMIN_TOKEN", "t")
+        app = FastAPI()
+        app.include_router(admin.router)
+        return TestClient(app, headers={"Authorization": "Bearer t"})
+
+    def test_test_endpoint_body_is_optional(self, monkeypatch):
+        from radbot.web.api import admin
+
+        monkeypatch.setattr(admin, "_config_section", lambda *path: {})
+        monkeypatch.delenv("KIDEO_URL", raising=False)
+        client = self._client(monkeypatch)
+        for kwargs in ({}, {"json": {}}):
+            resp = client.post("/admin/api/test/kideo", **kwargs)
+            assert resp.json() == {
+                "status": "error",
+                "message": "Kideo URL is required",
+            }
+
+    def test_credential_requires_name_and_value(self, monkeypatch):
+        from radbot.web.api import admin
+
+        monkeypatch.setattr(admin, "_require_store", lambda: _FakeStore({}))
+        resp = self._client(monkeypatch).post(
+            "/admin/api/credentials", json={"name": "  ", "value": "v"}
+        )
+        assert resp.status_code == 400
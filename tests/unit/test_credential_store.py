@@ -0,0 +1,88 @@
+"""Unit tests for radbot.credentials.store.CredentialStore."""
+
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+from radbot.credentials import store as store_module
+from radbot.credentials.crypto import encrypt
+from radbot.credentials.store import CredentialStore
+
+KEY = "test-master-key"
+
+
+def _fake_conn(rows):
+    cur = MagicMock()
+    cur.fetchall.return_value = rows
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cur
+
+    @contextmanager
+    def _conn():
+        yield conn
+
+    return patch.object(store_module, "get_db_connection", _conn), cur
+
+
+def _row(name, value, key=KEY):
+    ciphertext, salt = encrypt(value, key)
+    return (name, ciphertext.decode("utf-8"), memoryview(salt))
+
+
+class TestGetMany:
+    def test_one_query_decrypts_all(self):
+        store = CredentialStore(master_key=KEY)
+        patcher, cur = _fake_conn(
+            [_row("config:agent", '{"a": 1}'), _row("config:tts", "{}")]
+        )
+        with patcher:
+            values = store.get_many("config:")
+        assert values == {"config:agent": '{"a": 1}', "config:tts": "{}"}
+        cur.execute.assert_called_once()
+        assert cur.execute.call_args.args[1] == ("config:%",)
+
+    def test_like_wildcards_in_prefix_escaped(self):
+        store = CredentialStore(master_key=KEY)
+        patcher, cur = _fake_conn([])
+        with patcher:
+            store.get_many("gmail_token_")
+        assert cur.execute.call_args.args[1] == ("gmail\\_token\\_%",)
+
+    def test_undecryptable_entries_skipped(self):
+        store = CredentialStore(master_key=KEY)
+        patcher, _ = _fake_conn(
+            [_row("config:ok", "v"), _row("config:bad", "v", key="other-key")]
+        )
+        with patcher:
+            assert store.get_many("config:") == {"config:ok": "v"}
+
+    def test_unavailable_store_returns_empty(self):
+        store = CredentialStore(master_key=KEY)
+        store._master_key = ""
+        assert store.get_many("config:") == {}
+
+
+class TestBatch:
+    def test_writes_share_one_transaction(self):
+        store = CredentialStore(master_key=KEY)
+        patcher, cur = _fake_conn([])
+        with patcher:
+            with store.batch() as batch:
+                batch.set("gmail_token_work", "tok", credential_type="oauth_token")
+                batch.delete("_oauth_state_gmail")
+                assert cur.execute.call_count == 0
+        assert cur.execute.call_count == 2
+        assert cur.execute.call_args.args[1] == ("_oauth_state_gmail",)
+        assert store.version == 1
+
+    def test_nothing_written_when_block_raises(self):
+        store = CredentialStore(master_key=KEY)
+        patcher, cur = _fake_conn([])
+        with patcher:
+            try:
+                with store.batch() as batch:
+                    batch.delete("x")
+                    raise ValueError("boom")
+            except ValueError:
+                pass
+        cur.execute.assert_not_called()
+        assert store.version == 0
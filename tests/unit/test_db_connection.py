@@ -0,0 +1,102 @@
+"""Unit tests for radbot.db.connection helpers (no live database)."""
+
+from unittest.mock import MagicMock
+
+import psycopg2.errors
+import psycopg2.extensions
+import pytest
+
+from radbot.db import connection as db_connection
+
+
+class _FakeConn:
+    """Weak-referenceable stand-in for a psycopg2 connection."""
+
+    def __init__(self, status=psycopg2.extensions.TRANSACTION_STATUS_IDLE):
+        self.status = status
+        self.rollback = MagicMock()
+
+    def get_transaction_status(self):
+        return self.status
+
+
+def _cursor_for(conn: _FakeConn) -> MagicMock:
+    cursor = MagicMock()
+    cursor.connection = conn
+    return cursor
+
+
+class TestExecutePrepared:
+    def test_prepares_once_per_connection(self):
+        conn = _FakeConn()
+        cursor = _cursor_for(conn)
+
+        db_connection.execute_prepared(cursor, "q1", "SELECT $1", ("a",))
+        db_connection.execute_prepared(cursor, "q1", "SELECT $1", ("b",))
+
+        statements = [c.args[0] for c in cursor.execute.call_args_list]
+        assert statements == [
+            "PREPARE q1 AS SELECT $1",
+            "EXECUTE q1 (%s)",
+            "EXECUTE q1 (%s)",
+        ]
+        assert cursor.execute.call_args_list[-1].args[1] == ("b",)
+
+    def test_new_connection_prepares_again(self):
+        first, second = _cursor_for(_FakeConn()), _cursor_for(_FakeConn())
+
+        db_connection.execute_prepared(first, "q2", "SELECT 1")
+        db_connection.execute_prepared(second, "q2", "SELECT 1")
+
+        assert first.execute.call_args_list[0].args[0] == "PREPARE q2 AS SELECT 1"
+        assert second.execute.call_args_list[0].args[0] == "PREPARE q2 AS SELECT 1"
+        assert second.execute.call_args_list[1].args[0] == "EXECUTE q2"
+
+    def test_failed_prepare_is_not_recorded(self):
+        conn = _FakeConn()
+        cursor = _cursor_for(conn)
+        cursor.execute.side_effect = [RuntimeError("boom"), None, None]
+
+        try:
+            db_connection.execute_prepared(cursor, "q3", "SELECT 1")
+        except RuntimeError:
+            pass
+        db_connection.execute_prepared(cursor, "q3", "SELECT 1")
+
+        assert cursor.execute.call_args_list[1].args[0] == "PREPARE q3 AS SELECT 1"
+
+    @pytest.mark.parametrize(
+        "error, deallocate",
+        [
+            (psycopg2.errors.InvalidSqlStatementName, False),
+            (psycopg2.errors.FeatureNotSupported, True),
+        ],
+    )
+    def test_stale_statement_is_reprepared_once(self, error, deallocate):
+        conn = _FakeConn()
+        cursor = _cursor_for(conn)
+        db_connection.execute_prepared(cursor, "q4", "SELECT $1", ("a",))
+        cursor.execute.reset_mock()
+        cursor.execute.side_effect = [error("stale"), None, None, None]
+
+        db_connection.execute_prepared(cursor, "q4", "SELECT $1", ("b",))
+
+        conn.rollback.assert_called_once()
+        statements = [c.args[0] for c in cursor.execute.call_args_list]
+        assert statements == [
+            "EXECUTE q4 (%s)",
+            *(["DEALLOCATE q4"] if deallocate else []),
+            "PREPARE q4 AS SELECT $1",
+            "EXECUTE q4 (%s)",
+        ]
+
+    def test_stale_statement_inside_open_transaction_raises(self):
+        conn = _FakeConn()
+        cursor = _cursor_for(conn)
+        db_connection.execute_prepared(cursor, "q5", "SELECT 1")
+        conn.status = psycopg2.extensions.TRANSACTION_STATUS_INTRANS
+        cursor.execute.side_effect = psycopg2.errors.InvalidSqlStatementName("gone")
+
+        with pytest.raises(psycopg2.errors.InvalidSqlStatementName):
+            db_connection.execute_prepared(cursor, "q5", "SELECT 1")
+        conn.rollback.assert_not_called()
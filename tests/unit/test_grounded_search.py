@@ -0,0 +1,170 @@
+"""Unit tests for `radbot.tools.web_research.grounded_search`.
+
+All model calls are mocked — the suite never hits Gemini.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from radbot.config import adk_config
+from radbot.tools.web_research import grounded_search as gs_module
+
+
+def _fake_client(answer: str = "grounded answer"):
+    calls: list[str] = []
+
+    async def fake_generate_content(*, model, contents, config):  # noqa: ARG001
+        calls.append(contents)
+        return SimpleNamespace(text=answer, candidates=[])
+
+    client = SimpleNamespace(
+        aio=SimpleNamespace(
+            models=SimpleNamespace(generate_content=fake_generate_content)
+        )
+    )
+    return client, calls
+
+
+class TestSharedClient:
+    def test_reused_until_settings_change(self):
+        built = []
+
+        def _build():
+            built.append(object())
+            return built[-1]
+
+        with (
+            patch.object(adk_config, "_shared_client", None),
+            patch.object(adk_config, "_shared_client_key", None),
+            patch.object(
+                adk_config, "create_client_with_config_settings", side_effect=_build
+            ),
+            patch.object(
+                adk_config, "_client_settings_key", side_effect=[("a",), ("a",), ("b",)]
+            ),
+        ):
+            first = adk_config.get_shared_client()
+            assert adk_config.get_shared_client() is first
+            assert adk_config.get_shared_client() is not first
+        assert len(built) == 2
+
+
+class TestGroundedSearch:
+    def setup_method(self):
+        gs_module._SEARCH_CACHE.clear()
+
+    async def test_uses_shared_client(self):
+        client, calls = _fake_client()
+        with patch.object(gs_module, "get_shared_client", return_value=client):
+            result = await gs_module.grounded_search("what is radbot")
+        assert result["status"] == "success"
+        assert result["answer"] == "grounded answer"
+        assert calls == ["what is radbot"]
+
+
+class TestResultCache:
+    def setup_method(self):
+        gs_module._SEARCH_CACHE.clear()
+
+    async def test_repeat_query_served_from_cache(self):
+        client, calls = _fake_client()
+        with patch.object(gs_module, "get_shared_client", return_value=client):
+            first = await gs_module.grounded_search("What is  RadBot")
+            first["citations"].append({"title": "x", "url": "y"})
+            second = await gs_module.grounded_search("what is radbot")
+        assert len(calls) == 1
+        assert second["query"] == "what is radbot"
+        assert second["citations"] == []
+
+    async def test_expired_entry_refetched(self):
+        client, calls = _fake_client()
+        with (
+            patch.object(gs_module, "get_shared_client", return_value=client),
+            patch.object(gs_module, "_CACHE_TTL", 0.0),
+        ):
+            await gs_module.grounded_search("q")
+            await gs_module.grounded_search("q")
+        assert len(calls) == 2
+
+    async def test_disabled_by_env(self, monkeypatch):
+        monkeypatch.setenv("RADBOT_WEBSEARCH_CACHE", "0")
+        client, calls = _fake_client()
+        with patch.object(gs_module, "get_shared_client", return_value=client):
+            await gs_module.grounded_search("q")
+            await gs_module.grounded_search("q")
+        assert len(calls) == 2
+        assert not gs_module._SEARCH_CACHE
+
+    async def test_errors_not_cached(self):
+        async def boom(**_):
+            raise RuntimeError("quota")
+
+        client = SimpleNamespace(
+            aio=SimpleNamespace(models=SimpleNamespace(generate_content=boom))
+        )
+        with patch.object(gs_module, "get_shared_client", return_value=client):
+            result = await gs_module.grounded_search("q")
+        assert result["status"] == "error"
+        assert not gs_module._SEARCH_CACHE
+
+    def test_evicts_oldest_past_capacity(self):
+        with patch.object(gs_module, "_CACHE_MAX_ENTRIES", 2):
+            for q in ("a", "b", "c"):
+                gs_module._cache_put(gs_module._cache_key(q), {"answer": q})
+        assert gs_module._cache_get(gs_module._cache_key("a")) is None
+        assert gs_module._cache_get(gs_module._cache_key("c")) == {"answer": "c"}
+
+
+class TestInflightCoalescing:
+    def setup_method(self):
+        gs_module._SEARCH_CACHE.clear()
+
+    async def test_concurrent_identical_queries_share_one_call(self, monkeypatch):
+        monkeypatch.setenv("RADBOT_WEBSEARCH_CACHE", "0")
+        release = asyncio.Event()
+        calls: list[str] = []
+
+        async def slow_generate(*, model, contents, config):  # noqa: ARG001
+            calls.append(contents)
+            await release.wait()
+            return SimpleNamespace(text="shared", candidates=[])
+
+        client = SimpleNamespace(
+            aio=SimpleNamespace(models=SimpleNamespace(generate_content=slow_generate))
+        )
+        with patch.object(gs_module, "get_shared_client", return_value=client):
+            tasks = [
+                asyncio.create_task(gs_module.grounded_search(q))
+                for q in ("Same question", "same  question", "same question")
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks)
+        assert len(calls) == 1
+        assert [r["answer"] for r in results] == ["shared"] * 3
+        assert results[1]["query"] == "same  question"
+        assert not gs_module._INFLIGHT
+
+    async def test_cancelled_leader_does_not_cancel_followers(self, monkeypatch):
+        monkeypatch.setenv("RADBOT_WEBSEARCH_CACHE", "0")
+        release = asyncio.Event()
+
+        async def slow_generate(**_):
+            await release.wait()
+            return SimpleNamespace(text="done", candidates=[])
+
+        client = SimpleNamespace(
+            aio=SimpleNamespace(models=SimpleNamespace(generate_content=slow_generate))
+        )
+        with patch.object(gs_module, "get_shared_client", return_value=client):
+            leader = asyncio.create_task(gs_module.grounded_search("q"))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(gs_module.grounded_search("q"))
+            await asyncio.sleep(0)
+            leader.cancel()
+            release.set()
+            result = await follower
+        assert result["answer"] == "done"
@@ -1,5 +1,6 @@
 """Tests for radbot.tools.shared utilities."""
 
+import logging
 import uuid
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
@@ -7,7 +8,8 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from radbot.tools.shared.client_utils import client_or_error
-from radbot.tools.shared.errors import truncate_error
+from radbot.tools.shared.errors import exception_text, truncate_error
+from radbot.tools.shared.function_tool import CachedFunctionTool
 from radbot.tools.shared.retry import retry_on_error
 from radbot.tools.shared.serialization import serialize_row, serialize_rows
 from radbot.tools.shared.tool_decorator import tool_error_handler
@@ -62,6 +64,12 @@ class TestSerializeRows:
         result = serialize_rows(rows)
         assert result == [{"id": str(uid1)}, {"id": str(uid2)}]
 
+    def test_mask_applies_to_coerced_values(self):
+        uid = uuid.uuid4()
+        row = {"token": uid, "secret": "", "meta": {"a": 1}}
+        result = serialize_row(row, mask_fields={"token": "***", "secret": "***"})
+        assert result == {"token": "***", "secret": None, "meta": {"a": 1}}
+
     def test_mask_fields_propagated(self):
         rows = [{"secret": "a"}, {"secret": None}]
         result = serialize_rows(rows, mask_fields={"secret": "***"})
@@ -90,6 +98,28 @@ class TestValidateUuid:
         assert parsed is None
         assert err is not None
 
+    @pytest.mark.parametrize(
+        "form",
+        [
+            "12345678123456781234567812345678",
+            "{12345678-1234-5678-1234-567812345678}",
+            "urn:uuid:12345678-1234-5678-1234-567812345678",
+            "12345678-1234-5678-1234-567812345678".upper(),
+        ],
+    )
+    def test_alternate_spellings(self, form):
+        parsed, err = validate_uuid(form)
+        assert err is None
+        assert parsed == uuid.UUID("12345678-1234-5678-1234-567812345678")
+
+    @pytest.mark.parametrize(
+        "value", [None, "inbox", "12345678-1234-5678-1234-56781234567g", " " * 36]
+    )
+    def test_rejects_non_uuid(self, value):
+        parsed, err = validate_uuid(value)
+        assert parsed is None
+        assert err["status"] == "error"
+
 
 # ── errors ───────────────────────────────────────────────────────────────────
 
@@ -115,6 +145,17 @@ class TestTruncateError:
         assert result.endswith("...")
 
 
+class TestExceptionText:
+    def test_short_message_is_plain_str(self):
+        assert exception_text(ValueError("boom")) == "boom"
+
+    def test_huge_message_clipped_and_tagged(self):
+        result = exception_text(RuntimeError("q" * 10_000), max_length=100)
+        assert result.startswith("RuntimeError: ")
+        assert len(result) == len("RuntimeError: ") + 100
+        assert result.endswith("...")
+
+
 # ---------------------------------------------------------------------------
 # config_helper.py
 # ---------------------------------------------------------------------------
@@ -307,6 +348,23 @@ class TestToolErrorHandler:
         assert "Failed to frobnicate" in result["message"]
         assert "kaboom" in result["message"]
 
+    def test_traceback_logged_lazily_at_debug(self, caplog):
+        """The stack is attached via exc_info and only rendered at DEBUG."""
+
+        @tool_error_handler("frobnicate")
+        def bad_func():
+            raise ValueError("kaboom")
+
+        with caplog.at_level(logging.INFO, logger="radbot.tools.shared"):
+            bad_func()
+        assert all(r.exc_info is None for r in caplog.records)
+
+        caplog.clear()
+        with caplog.at_level(logging.DEBUG, logger="radbot.tools.shared"):
+            bad_func()
+        debug = [r for r in caplog.records if r.levelno == logging.DEBUG]
+        assert debug and debug[0].exc_info[0] is ValueError
+
     def test_error_message_truncated_to_300_chars(self):
         """Error message is truncated to 300 characters."""
 
@@ -415,3 +473,82 @@ class TestRetryOnError:
         expected_delays = [2.0, 4.0, 8.0]
         actual_delays = [call.args[0] for call in mock_sleep.call_args_list]
         assert actual_delays == expected_delays
+
+
+# ---------------------------------------------------------------------------
+# db_schema.py
+# ---------------------------------------------------------------------------
+
+
+class TestInitTableSchema:
+    """Tests for init_table_schema()."""
+
+    @patch("radbot.tools.shared.db_schema.get_db_cursor")
+    @patch("radbot.tools.shared.db_schema.get_db_connection")
+    def test_single_round_trip(self, mock_conn, mock_cursor):
+        """Probe, create, indexes and migrations go out in one execute."""
+        from psycopg2 import sql
+
+        from radbot.tools.shared.db_schema import init_table_schema
+
+        cursor = MagicMock()
+        mock_cursor.return_value.__enter__.return_value = cursor
+
+        init_table_schema(
+            table_name="things",
+            create_table_sql="CREATE TABLE things (id INT);",
+            create_index_sqls=["CREATE INDEX idx_things_id ON things (id)"],
+            migration_sqls=["ALTER TABLE things ADD COLUMN IF NOT EXISTS x INT;"],
+        )
+
+        assert cursor.execute.call_count == 1
+        script = cursor.execute.call_args[0][0]
+        parts = [p.string if isinstance(p, sql.SQL) else p.wrapped for p in script.seq]
+        assert "things" in parts
+        text = "".join(p for p in parts if p != "things")
+        assert "IS NULL THEN" in text
+        assert (
+            "CREATE TABLE things (id INT);\nCREATE INDEX idx_things_id ON things (id);"
+            in text
+        )
+        assert text.rstrip().endswith("ADD COLUMN IF NOT EXISTS x INT;")
+
+
+# ── function_tool ────────────────────────────────────────────────────────────
+
+
+def _sample_tool_fn(name: str, count: int = 1) -> dict:
+    """Say hello.
+
+    Args:
+        name: Who to greet.
+        count: How many times.
+    """
+    return {"status": "success"}
+
+
+class TestCachedFunctionTool:
+    def test_declaration_matches_function_tool(self):
+        from google.adk.tools import FunctionTool
+
+        cached = CachedFunctionTool(_sample_tool_fn)
+        assert (
+            cached._get_declaration()
+            == FunctionTool(_sample_tool_fn)._get_declaration()
+        )
+
+    def test_builds_once_and_returns_copies(self):
+        from google.adk.tools import FunctionTool
+
+        tool = CachedFunctionTool(_sample_tool_fn)
+        with patch.object(
+            FunctionTool,
+            "_get_declaration",
+            autospec=True,
+            side_effect=FunctionTool._get_declaration,
+        ) as build:
+            first = tool._get_declaration()
+            second = tool._get_declaration()
+        assert build.call_count == 1
+        assert first == second
+        assert first is not second
@@ -0,0 +1,37 @@
+"""Unit tests for radbot.web.spa."""
+
+import os
+
+from radbot.web import spa
+
+
+def test_missing_build_returns_none(tmp_path, monkeypatch):
+    monkeypatch.setattr(spa, "DIST_INDEX", str(tmp_path / "index.html"))
+    assert spa.react_index_html() is None
+
+
+def test_rewrites_and_caches_until_rebuilt(tmp_path, monkeypatch):
+    index = tmp_path / "index.html"
+    index.write_text(
+        '<script src="/assets/a.js"></script>'
+        "<link href='/assets/b.css'>"
+        '<link href="/favicon.png">'
+    )
+    monkeypatch.setattr(spa, "DIST_INDEX", str(index))
+    monkeypatch.setattr(spa, "_cache", None)
+
+    html = spa.react_index_html()
+    assert html == (
+        '<script src="/static/dist/assets/a.js"></script>'
+        "<link href='/static/dist/assets/b.css'>"
+        '<link href="/static/dist/favicon.png">'
+    )
+
+    # Same mtime: served from memory even if the content changed underneath.
+    stat = index.stat()
+    index.write_text("changed")
+    os.utime(index, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert spa.react_index_html() is html
+
+    os.utime(index, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert spa.react_index_html() == "changed"
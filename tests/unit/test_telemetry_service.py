@@ -97,6 +97,34 @@ def test_db_timeout_drops_batch(warn_log):
     assert any("DB write failed" in m for m in msgs), msgs
 
 
+def test_default_writer_reuses_connection_until_error():
+    """One connect serves many batches; a failure drops it so the next reconnects."""
+    from unittest.mock import MagicMock
+
+    from radbot.tools.telemetry import service
+
+    conns = [MagicMock(closed=0), MagicMock(closed=0)]
+    batch = [("dream_pass_complete", _payload())]
+    service._close_writer_conn()
+    with (
+        patch.object(service, "_db_dsn_kwargs", return_value={}),
+        patch.object(service.psycopg2, "connect", side_effect=conns) as connect,
+    ):
+        service._default_db_writer(batch)
+        service._default_db_writer(batch)
+        assert connect.call_count == 1
+
+        cur = conns[0].cursor.return_value.__enter__.return_value
+        cur.executemany.side_effect = psycopg2.OperationalError("gone")
+        with pytest.raises(psycopg2.OperationalError):
+            service._default_db_writer(batch)
+        conns[0].close.assert_called_once()
+
+        service._default_db_writer(batch)
+        assert connect.call_count == 2
+    service._close_writer_conn()
+
+
 # ------------------------------------------------------------------ kill switch
 
 
@@ -384,6 +384,60 @@ class TestToolsLayer:
         out = telos_tools.telos_get_section("not_a_real_section")
         assert out["status"] == "error"
 
+    def test_list_tasks_rejects_unknown_task_status(self):
+        from radbot.tools.telos import telos_tools
+
+        with patch.object(telos_tools.telos_db, "list_project_tasks") as mock_list:
+            out = telos_tools.telos_list_tasks(task_status="someday")
+        assert out["status"] == "error"
+        assert "someday" in out["message"]
+        mock_list.assert_not_called()
+
+    def test_list_tasks_pushes_filters_into_query(self):
+        from radbot.tools.telos import telos_tools
+
+        with patch.object(
+            telos_tools.telos_db, "list_project_tasks", return_value=[]
+        ) as mock_list:
+            out = telos_tools.telos_list_tasks(
+                parent_project="PRJ1", task_status="done"
+            )
+        assert out == {"status": "success", "entries": []}
+        mock_list.assert_called_once_with(
+            ["PRJ1"], status="active", parent_milestone=None, task_status="done"
+        )
+
+    def test_get_project_fetches_children_in_one_call(self):
+        from radbot.tools.telos import telos_tools
+
+        project = _fake_entry(Section.PROJECTS, "Radbot", "PRJ1")
+        task = _fake_entry(
+            Section.PROJECT_TASKS,
+            "Ship it",
+            "PT1",
+            metadata={"parent_project": "PRJ1", "task_status": "inprogress"},
+        )
+        children = {
+            Section.MILESTONES: [],
+            Section.PROJECT_TASKS: [task],
+            Section.EXPLORATIONS: [],
+            Section.GOALS: [],
+        }
+        with (
+            patch.object(telos_tools.telos_db, "get_entry", return_value=project),
+            patch.object(
+                telos_tools.telos_db, "list_project_children", return_value=children
+            ) as mock_children,
+            patch.object(telos_tools.telos_db, "list_section") as mock_list,
+        ):
+            out = telos_tools.telos_get_project("PRJ1")
+
+        assert out["status"] == "success"
+        assert [t["ref_code"] for t in out["tasks"]["inprogress"]] == ["PT1"]
+        mock_children.assert_called_once()
+        assert mock_children.call_args[0][0] == "PRJ1"
+        mock_list.assert_not_called()
+
     def test_resolve_prediction_adds_wrong_about_on_miscalibration(self):
         from radbot.tools.telos import telos_tools
 
@@ -582,3 +636,326 @@ class TestScoutTelosTools:
         from radbot.tools.telos.telos_tools import TELOS_TOOLS, telos_delete_entry_tool
 
         assert telos_delete_entry_tool not in TELOS_TOOLS
+
+
+# ---------------------------------------------------------------------------
+# DB layer (connection mocked)
+# ---------------------------------------------------------------------------
+
+
+def _mock_db(cursor: MagicMock):
+    """Patch get_db_connection in telos.db so every cursor() yields *cursor*."""
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cursor
+    conn.cursor.return_value.__exit__.return_value = False
+    ctx = MagicMock()
+    ctx.__enter__.return_value = conn
+    ctx.__exit__.return_value = False
+    return patch("radbot.tools.telos.db.get_db_connection", return_value=ctx)
+
+
+def _db_row(section: Section, ref_code: str | None, content: str, **meta) -> dict:
+    ts = datetime(2026, 4, 18, tzinfo=timezone.utc)
+    return {
+        "entry_id": "abcd",
+        "section": section.value,
+        "ref_code": ref_code,
+        "content": content,
+        "metadata": meta,
+        "status": "active",
+        "sort_order": 0,
+        "created_at": ts,
+        "updated_at": ts,
+    }
+
+
+class TestTelosDb:
+    def test_upsert_singleton_is_one_round_trip(self):
+        from radbot.tools.telos import db as telos_db
+
+        cursor = MagicMock()
+        cursor.fetchone.return_value = _db_row(
+            Section.IDENTITY, IDENTITY_REF, "Perry", name="Perry"
+        )
+        with _mock_db(cursor):
+            entry = telos_db.upsert_singleton(
+                Section.IDENTITY, IDENTITY_REF, "Perry", {"name": "Perry"}
+            )
+
+        assert cursor.execute.call_count == 1
+        sql, params = cursor.execute.call_args[0]
+        assert "ON CONFLICT (section, ref_code) DO UPDATE" in sql
+        assert params[:3] == ("identity", IDENTITY_REF, "Perry")
+        assert entry.metadata == {"name": "Perry"}
+
+    def test_archive_entry_reports_rowcount_without_returning(self):
+        from radbot.tools.telos import db as telos_db
+
+        cursor = MagicMock()
+        cursor.rowcount = 0
+        with (
+            _mock_db(cursor),
+            patch("radbot.tools.telos.db.execute_prepared") as mock_exec,
+        ):
+            assert telos_db.archive_entry(Section.PROJECT_TASKS, "PT9") is False
+        _cur, _name, sql, params = mock_exec.call_args[0]
+        assert "RETURNING" not in sql
+        assert params[:2] == ["project_tasks", ["PT9"]]
+        cursor.fetchone.assert_not_called()
+
+    def test_update_entry_prepares_one_statement_per_shape(self):
+        from radbot.tools.telos import db as telos_db
+
+        cursor = MagicMock()
+        cursor.fetchone.return_value = _db_row(Section.MILESTONES, "MS1", "Beta")
+        with (
+            _mock_db(cursor),
+            patch("radbot.tools.telos.db.execute_prepared") as mock_exec,
+        ):
+            telos_db.update_entry(
+                Section.MILESTONES, "MS1", status="completed", metadata_merge={"a": 1}
+            )
+            telos_db.update_entry(Section.MILESTONES, "MS2", content="Gamma")
+        (_, name1, sql1, params1), (_, name2, sql2, params2) = [
+            c.args for c in mock_exec.call_args_list
+        ]
+        assert name1 == "telos_update_mm_s"
+        assert "metadata = metadata || $3::jsonb, status = $4" in sql1
+        assert params1[:2] == ["milestones", "MS1"] and params1[3] == "completed"
+        assert name2 == "telos_update_c"
+        assert "content = $3" in sql2 and params2 == ["milestones", "MS2", "Gamma"]
+
+    def test_resolve_project_id_memoizes_hits_only(self):
+        from radbot.tools.telos import db as telos_db
+
+        telos_db.clear_project_id_cache()
+        project = _fake_entry(Section.PROJECTS, "Radbot", "PRJ1")
+        with patch.object(
+            telos_db, "get_entry", side_effect=[None, project]
+        ) as mock_get:
+            assert telos_db.resolve_project_id("PRJ1") is None
+            assert telos_db.resolve_project_id("PRJ1") == "abcd"
+            assert telos_db.resolve_project_id("PRJ1") == "abcd"
+        assert mock_get.call_count == 2
+        telos_db.clear_project_id_cache()
+
+    def test_resolve_entry_id_expires_after_ttl(self):
+        from radbot.tools.telos import db as telos_db
+
+        telos_db.clear_project_id_cache()
+        ms = _fake_entry(Section.MILESTONES, "Beta", "MS1")
+        with (
+            patch.object(telos_db, "get_entry", return_value=ms) as mock_get,
+            patch.object(
+                telos_db.time, "monotonic", side_effect=[0.0, 1.0, 1000.0, 1000.0]
+            ),
+        ):
+            assert telos_db.resolve_entry_id(Section.MILESTONES, "MS1") == "abcd"
+            assert telos_db.resolve_entry_id(Section.MILESTONES, "MS1") == "abcd"
+            assert telos_db.resolve_entry_id(Section.MILESTONES, "MS1") == "abcd"
+        assert mock_get.call_count == 2
+        telos_db.clear_project_id_cache()
+
+    def test_reset_all_clears_project_id_cache(self):
+        from radbot.tools.telos import db as telos_db
+
+        telos_db._entry_ids[(Section.PROJECTS, "PRJ9")] = ("stale", 0.0)
+        cursor = MagicMock()
+        cursor.rowcount = 3
+        with (
+            _mock_db(cursor),
+            patch("radbot.tools.telos.db.get_db_cursor") as mock_cursor,
+        ):
+            mock_cursor.return_value.__enter__.return_value = cursor
+            assert telos_db.reset_all() == 3
+        assert (Section.PROJECTS, "PRJ9") not in telos_db._entry_ids
+
+    def test_bulk_upsert_batches_and_preserves_input_order(self):
+        from radbot.tools.telos import db as telos_db
+
+        entries = [
+            Entry(section=Section.GOALS, ref_code="G1", content="old"),
+            Entry(section=Section.JOURNAL, content="log one"),
+            Entry(section=Section.GOALS, ref_code="G1", content="new"),
+            Entry(section=Section.JOURNAL, content="log two"),
+        ]
+        calls = []
+
+        def fake_execute_values(cursor, sql, argslist, **kwargs):
+            calls.append(argslist)
+            if "ON CONFLICT" in sql:
+                return [_db_row(Section.GOALS, "G1", argslist[0][2])]
+            return [_db_row(Section.JOURNAL, None, a[1]) for a in argslist]
+
+        with (
+            _mock_db(MagicMock()),
+            patch(
+                "radbot.tools.telos.db.psycopg2.extras.execute_values",
+                side_effect=fake_execute_values,
+            ),
+        ):
+            out = telos_db.bulk_upsert(entries)
+
+        # One statement per kind; the duplicate G1 collapses to its last value.
+        assert len(calls) == 2
+        assert len(calls[0]) == 1 and calls[0][0][2] == "new"
+        assert [e.content for e in out] == ["new", "log one", "new", "log two"]
+
+    def test_complete_tasks_uses_single_any_update(self):
+        from radbot.tools.telos import db as telos_db
+
+        cursor = MagicMock()
+        cursor.rowcount = 2
+        with (
+            _mock_db(cursor),
+            patch("radbot.tools.telos.db.get_db_cursor") as mock_cursor,
+            patch("radbot.tools.telos.db.execute_prepared") as mock_exec,
+        ):
+            mock_cursor.return_value.__enter__.return_value = cursor
+            n = telos_db.complete_tasks(["PT1", "PT2"])
+
+        assert n == 2
+        assert mock_exec.call_count == 1
+        _cur, name, sql, params = mock_exec.call_args[0]
+        assert name.startswith("telos_update_many_")
+        assert "ref_code = ANY($2)" in sql
+        assert params[:2] == ["project_tasks", ["PT1", "PT2"]]
+        merged = params[2].adapted
+        assert merged["task_status"] == "done"
+        assert datetime.fromisoformat(merged["completed_at"]).tzinfo is not None
+
+    def test_update_many_noop_without_codes(self):
+        from radbot.tools.telos import db as telos_db
+
+        with patch("radbot.tools.telos.db.get_db_connection") as mock_conn:
+            assert telos_db.archive_entries(Section.PROJECT_TASKS, []) == 0
+        mock_conn.assert_not_called()
+
+    def test_list_project_tasks_joins_project_name(self):
+        from radbot.tools.telos import db as telos_db
+
+        row = _db_row(Section.PROJECT_TASKS, "PT1", "Ship it", parent_project="PRJ1")
+        row["project_name"] = " Radbot \n"
+        orphan = _db_row(Section.PROJECT_TASKS, "PT2", "Stray", parent_project="PRJ9")
+        orphan["project_name"] = None
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [row, orphan]
+        with _mock_db(cursor):
+            rows = telos_db.list_project_tasks(["PRJ1", "PRJ9"])
+
+        assert cursor.execute.call_count == 1
+        sql, params = cursor.execute.call_args[0]
+        assert "LEFT JOIN telos_entries p" in sql
+        assert "= ANY(%s)" in sql
+        assert params == ("projects", "project_tasks", "active", ["PRJ1", "PRJ9"])
+        assert [(e.ref_code, name) for e, name in rows] == [
+            ("PT1", "Radbot"),
+            ("PT2", None),
+        ]
+
+    def test_project_summaries_aggregates_counts_in_one_query(self):
+        from radbot.tools.telos import db as telos_db
+
+        row = _db_row(Section.PROJECTS, "PRJ1", "Radbot")
+        row.update(milestone_count=2, active_task_count=5, done_task_count=1)
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [row]
+        with _mock_db(cursor):
+            out = telos_db.project_summaries()
+
+        assert cursor.execute.call_count == 1
+        sql, _params = cursor.execute.call_args[0]
+        assert "GROUP BY" in sql and "LEFT JOIN counts" in sql
+        [(entry, counts)] = out
+        assert entry.ref_code == "PRJ1"
+        assert counts == {
+            "milestone_count": 2,
+            "active_task_count": 5,
+            "done_task_count": 1,
+        }
+
+    def test_bulk_upsert_routes_large_loads_through_copy(self):
+        from radbot.tools.telos import db as telos_db
+
+        entries = [
+            Entry(section=Section.GOALS, ref_code="G1", content="goal"),
+            Entry(section=Section.JOURNAL, content="line one\nline two"),
+        ]
+        cursor = MagicMock()
+        cursor.fetchall.side_effect = [
+            [_db_row(Section.GOALS, "G1", "goal")],
+            [_db_row(Section.JOURNAL, None, "line one\nline two")],
+        ]
+        copied = []
+        cursor.copy_expert.side_effect = lambda sql, f: copied.append(f.read())
+        with (
+            _mock_db(cursor),
+            patch.object(telos_db, "_COPY_MIN_ROWS", 1),
+            patch("radbot.tools.telos.db.psycopg2.extras.execute_values") as ev,
+        ):
+            out = telos_db.bulk_upsert(entries)
+
+        ev.assert_not_called()
+        assert cursor.copy_expert.call_count == 1
+        assert copied[0].startswith("0,G1,goals,goal,{},active,0\r\n")
+        assert '1,,journal,"line one\nline two",{},active,0' in copied[0]
+        assert [e.content for e in out] == ["goal", "line one\nline two"]
+
+    def test_list_section_builds_entries_from_tuple_rows(self):
+        from types import SimpleNamespace
+
+        from radbot.tools.telos import db as telos_db
+
+        row = _db_row(Section.GOALS, "G1", "Ship v1", kpi="users")
+        # Column order deliberately differs from Entry's field order.
+        cols = [
+            "status",
+            "ref_code",
+            *(k for k in row if k not in ("status", "ref_code")),
+        ]
+        cursor = MagicMock()
+        cursor.description = [SimpleNamespace(name=c) for c in cols]
+        cursor.fetchall.return_value = [tuple(row[c] for c in cols)]
+        with _mock_db(cursor):
+            entries = telos_db.list_section(Section.GOALS)
+
+        sql, params = cursor.execute.call_args[0]
+        assert sql is telos_db._LIST_SECTION_SQL[(True, "sort_order_asc")]
+        assert params == ("goals", "active", None)
+        assert len(entries) == 1
+        e = entries[0]
+        assert (e.section, e.ref_code, e.content, e.status) == (
+            Section.GOALS,
+            "G1",
+            "Ship v1",
+            "active",
+        )
+        assert e.metadata == {"kpi": "users"}
+
+    def test_list_active_projects_cached_until_project_write(self):
+        from radbot.tools.telos import db as telos_db
+
+        telos_db._invalidate_projects(None)
+        project = Entry(section=Section.PROJECTS, ref_code="PRJ1", content="Radbot")
+        with patch.object(
+            telos_db, "list_section", return_value=[project]
+        ) as mock_list:
+            assert telos_db.list_active_projects() == [project]
+            assert telos_db.list_active_projects() == [project]
+            assert mock_list.call_count == 1
+
+            # Writes to other sections leave the cache alone...
+            telos_db._invalidate_projects(Section.GOALS)
+            telos_db.list_active_projects()
+            assert mock_list.call_count == 1
+
+            # ...project writes drop it.
+            telos_db._invalidate_projects(Section.PROJECTS)
+            telos_db.list_active_projects()
+            assert mock_list.call_count == 2
+
+            # So does the TTL.
+            with patch.object(telos_db, "_PROJECTS_TTL_SECONDS", 0):
+                telos_db.list_active_projects()
+            assert mock_list.call_count == 3
+        telos_db._invalidate_projects(None)
@@ -0,0 +1,171 @@
+"""Unit tests for radbot.tools.tts.tts_service."""
+
+import base64
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from radbot.tools.tts.tts_service import (
+    TTSService,
+    _AudioCache,
+    _decode_audio_content,
+)
+
+
+class TestCleanText:
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ("Run ```\nls -la\n``` now", "Run code block omitted now"),
+            ("Use `pip` to <b>install</b>", "Use to install"),
+            ("## Heading\nBody", "Heading Body"),
+            ("**bold**, *it* and __under__", "bold, it and under"),
+            ("See [the docs](http://x) here", "See the docs here"),
+            ("Logo: ![radbot](logo.png)", "Logo: radbot"),
+            ("- one\n* two\n+ three", "one two three"),
+            ("1. first\n2. second", "first second"),
+            ("above\n---\nbelow", "above below"),
+            ("  lots \n\n of   space  ", "lots of space"),
+        ],
+    )
+    def test_strips_markup(self, raw, expected):
+        assert TTSService.clean_text(raw) == expected
+
+    def test_empty_after_cleaning(self):
+        assert TTSService.clean_text("<br/>\n---\n") == ""
+
+
+class TestSynthesizeCache:
+    def test_repeat_text_skips_cleaning_and_api(self):
+        svc = TTSService(api_key="k")
+        TTSService._clean_cached.cache_clear()
+        with (
+            patch.object(
+                TTSService, "clean_text", wraps=TTSService.clean_text
+            ) as mock_clean,
+            patch.object(svc, "_get_api_key", side_effect=AssertionError("no API")),
+        ):
+            svc._cache.put(svc._cache_key("hello there"), b"mp3")
+            assert svc.synthesize("**hello** there") == b"mp3"
+            assert svc.synthesize("**hello** there") == b"mp3"
+        assert mock_clean.call_count == 1
+
+    def test_miss_posts_through_shared_session(self):
+        svc = TTSService(api_key="k")
+        resp = MagicMock(status_code=200, content=b'{"audioContent": "bXAz"}')
+        with patch(
+            "radbot.tools.tts.tts_service._http.post", return_value=resp
+        ) as post:
+            assert svc.synthesize("fresh words") == b"mp3"
+            assert svc.synthesize("fresh words") == b"mp3"
+        post.assert_called_once()
+        assert post.call_args.kwargs["timeout"] == 30
+
+    def test_http_error_raises_runtime_error(self):
+        svc = TTSService(api_key="k")
+        resp = MagicMock(status_code=403, content=b"denied")
+        with patch("radbot.tools.tts.tts_service._http.post", return_value=resp):
+            with pytest.raises(RuntimeError, match=r"\(403\): denied"):
+                svc.synthesize("other words")
+
+    def test_huge_input_truncated_before_cleaning(self):
+        svc = TTSService(api_key="k")
+        limit = TTSService.MAX_TEXT_LENGTH * TTSService.CLEAN_HEADROOM
+        with patch.object(
+            TTSService, "_clean_cached", return_value="spoken"
+        ) as mock_clean:
+            svc._cache.put(svc._cache_key("spoken"), b"mp3")
+            assert svc.synthesize("word " * limit) == b"mp3"
+        assert len(mock_clean.call_args.args[0]) == limit
+
+
+class TestSynthesizeAsync:
+    async def test_posts_through_async_client_and_shares_cache(self):
+        svc = TTSService(api_key="k")
+        client = MagicMock()
+        client.post = AsyncMock(
+            return_value=MagicMock(status_code=200, content=b'{"audioContent": "bXAz"}')
+        )
+        with patch("radbot.tools.tts.tts_service._get_async_http", return_value=client):
+            assert await svc.synthesize_async("async words") == b"mp3"
+        client.post.assert_awaited_once()
+        # The sync path hits the cache the async path filled.
+        with patch("radbot.tools.tts.tts_service._http.post") as post:
+            assert svc.synthesize("async words") == b"mp3"
+        post.assert_not_called()
+
+
+class TestAudioCache:
+    def test_evicts_oldest_past_byte_budget(self):
+        cache = _AudioCache(max_items=10, max_bytes=10)
+        cache.put("a", b"xxxx")
+        cache.put("b", b"xxxx")
+        assert cache.get("a") == b"xxxx"  # "a" is now most recent
+        cache.put("c", b"xxxx")
+        assert cache.get("b") is None
+        assert (len(cache), cache.nbytes) == (2, 8)
+
+    def test_evicts_past_item_count_and_replaces_in_place(self):
+        cache = _AudioCache(max_items=2, max_bytes=1 << 20)
+        cache.put("a", b"1")
+        cache.put("a", b"22")
+        cache.put("b", b"3")
+        cache.put("c", b"4")
+        assert cache.get("a") is None
+        assert (len(cache), cache.nbytes) == (2, 2)
+
+    def test_service_key_includes_voice_config(self):
+        a = TTSService(api_key="k", voice_name="en-US-Neural2-D")
+        b = TTSService(api_key="k", voice_name="en-US-Neural2-F")
+        assert a._cache_key("hi") == TTSService(api_key="k")._cache_key("hi")
+        assert a._cache_key("hi") != b._cache_key("hi")
+
+    def test_keeps_single_oversized_entry(self):
+        cache = _AudioCache(max_items=10, max_bytes=2)
+        cache.put("big", b"xxxxx")
+        assert cache.get("big") == b"xxxxx"
+
+
+class TestDecodeAudioContent:
+    @pytest.mark.parametrize(
+        "template",
+        [
+            b'{"audioContent":"%s"}',
+            b'{\n  "audioContent": "%s"\n}',
+            b'{"timepoints": [], "audioContent" : "%s", "audioConfig": {}}',
+        ],
+    )
+    def test_decodes_from_raw_bytes(self, template):
+        audio = bytes(range(256)) * 4
+        raw = template % base64.b64encode(audio)
+        assert _decode_audio_content(raw) == audio
+
+    def test_escaped_blob_falls_back_to_json(self):
+        raw = b'{"audioContent": "AAEC\\/w=="}'
+        assert _decode_audio_content(raw) == b"\x00\x01\x02\xff"
+
+    def test_missing_audio_raises(self):
+        with pytest.raises(RuntimeError, match="no audio content"):
+            _decode_audio_content(b'{"audioContent": ""}')
+
+
+class TestSingleton:
+    def test_concurrent_create_builds_one_instance(self):
+        import threading
+
+        from radbot.tools.tts import tts_service
+
+        barrier = threading.Barrier(8)
+        results = []
+
+        def _create():
+            barrier.wait()
+            results.append(TTSService.create_instance(api_key="k"))
+
+        with patch.object(tts_service, "_instance", None):
+            threads = [threading.Thread(target=_create) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        assert len({id(r) for r in results}) == 1
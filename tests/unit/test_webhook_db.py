@@ -0,0 +1,339 @@
+"""Unit tests for radbot.tools.webhooks.db (trigger buffering, path cache)."""
+
+import time
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+import pytest
+
+from radbot.tools.webhooks import db as webhook_db
+
+
+@pytest.fixture(autouse=True)
+def _clean_buffer():
+    with (
+        patch.object(webhook_db, "_pending_triggers", {}),
+        patch.object(webhook_db, "_flush_timer", MagicMock()),
+        patch.object(webhook_db, "_flush_failures", 0),
+        patch.object(webhook_db, "_atexit_registered", True),
+    ):
+        yield
+
+
+@contextmanager
+def _fake_db(cursor):
+    """Route ``get_db_connection`` and both cursor paths to *cursor*.
+
+    Covers ``get_db_cursor(conn)`` and ``conn.cursor(...)`` alike; yields
+    the fake connection so tests can assert on ``commit``.
+    """
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cursor
+
+    @contextmanager
+    def _conn():
+        yield conn
+
+    @contextmanager
+    def _cursor(conn, commit=False):
+        yield cursor
+
+    with (
+        patch.object(webhook_db, "get_db_connection", _conn),
+        patch.object(webhook_db, "get_db_cursor", _cursor),
+    ):
+        yield conn
+
+
+class TestRecordTrigger:
+    def test_aggregates_without_touching_db(self):
+        with patch.object(
+            webhook_db, "get_db_connection", side_effect=AssertionError("no DB")
+        ):
+            for _ in range(3):
+                webhook_db.record_trigger("a")
+            webhook_db.record_trigger("b")
+        counts = {k: c for k, (c, _) in webhook_db._pending_triggers.items()}
+        assert counts == {"a": 3, "b": 1}
+
+    def test_flush_writes_one_batched_update(self):
+        webhook_db.record_trigger("a")
+        webhook_db.record_trigger("a")
+        cursor = MagicMock(rowcount=1)
+        with (
+            _fake_db(cursor),
+            patch("psycopg2.extras.execute_values") as ev,
+        ):
+            assert webhook_db.flush_triggers() == 1
+        ev.assert_called_once()
+        sql, rows = ev.call_args.args[1:]
+        assert "FROM (VALUES %s)" in sql
+        assert [(wid, delta) for wid, delta, _ in rows] == [("a", 2)]
+        assert webhook_db._pending_triggers == {}
+        assert webhook_db.flush_triggers() == 0
+
+    def test_failed_flush_keeps_counts(self):
+        webhook_db.record_trigger("a")
+        with (
+            _fake_db(MagicMock()),
+            patch(
+                "psycopg2.extras.execute_values",
+                side_effect=psycopg2.OperationalError("down"),
+            ),
+        ):
+            with pytest.raises(psycopg2.OperationalError):
+                webhook_db.flush_triggers()
+        webhook_db.record_trigger("a")
+        assert webhook_db._pending_triggers["a"][0] == 2
+
+    def test_non_db_error_keeps_counts(self):
+        webhook_db.record_trigger("a")
+        with patch.object(
+            webhook_db, "get_db_connection", side_effect=ValueError("no creds")
+        ):
+            with pytest.raises(ValueError):
+                webhook_db.flush_triggers()
+        assert webhook_db._pending_triggers["a"][0] == 1
+
+    def test_failed_timer_flush_rearms_with_capped_backoff(self):
+        webhook_db.record_trigger("a")
+        delays = []
+        with (
+            patch.object(
+                webhook_db, "get_db_connection", side_effect=ValueError("down")
+            ),
+            patch.object(webhook_db.threading, "Timer") as timer,
+        ):
+            for _ in range(8):
+                webhook_db._flush_from_timer()
+                delays.append(timer.call_args.args[0])
+        interval = webhook_db.TRIGGER_FLUSH_INTERVAL_S
+        assert delays[:3] == [2 * interval, 4 * interval, 8 * interval]
+        assert delays[-1] == webhook_db.TRIGGER_FLUSH_MAX_BACKOFF_S
+        assert timer.call_args.args[1] is webhook_db._flush_from_timer
+        assert webhook_db._flush_timer is timer.return_value
+        assert webhook_db._pending_triggers["a"][0] == 1
+
+    def test_successful_flush_resets_backoff(self):
+        webhook_db.record_trigger("a")
+        with patch.object(
+            webhook_db, "get_db_connection", side_effect=ValueError("down")
+        ):
+            with patch.object(webhook_db.threading, "Timer"):
+                webhook_db._flush_from_timer()
+        assert webhook_db._flush_failures == 1
+        with _fake_db(MagicMock(rowcount=1)), patch("psycopg2.extras.execute_values"):
+            webhook_db._flush_from_timer()
+        assert webhook_db._flush_failures == 0
+        assert webhook_db._pending_triggers == {}
+
+
+class TestPathCache:
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self):
+        with patch.object(webhook_db, "_PATH_CACHE", {}):
+            yield
+
+    def _lookup(self, row):
+        """Fake DB whose suffix query returns *row* (or nothing)."""
+        return _fake_db(MagicMock(**{"fetchall.return_value": [row] if row else []}))
+
+    def test_hits_and_misses_are_cached(self):
+        with (
+            self._lookup({"path_suffix": "gh"}),
+            patch.object(webhook_db, "execute_prepared") as prepared,
+        ):
+            first = webhook_db.get_webhook_by_path("gh")
+            first["path_suffix"] = "mutated"
+            assert webhook_db.get_webhook_by_path("gh") == {"path_suffix": "gh"}
+        assert prepared.call_count == 1
+
+        with (
+            self._lookup(None),
+            patch.object(webhook_db, "execute_prepared") as prepared,
+        ):
+            assert webhook_db.get_webhook_by_path("nope") is None
+            assert webhook_db.get_webhook_by_path("nope") is None
+        assert prepared.call_count == 1
+
+    def test_expired_entries_refetched(self):
+        with (
+            self._lookup({"path_suffix": "gh"}),
+            patch.object(webhook_db, "execute_prepared") as prepared,
+            patch.object(webhook_db, "PATH_CACHE_TTL_S", 0),
+        ):
+            webhook_db.get_webhook_by_path("gh")
+            webhook_db.get_webhook_by_path("gh")
+        assert prepared.call_count == 2
+
+    def test_delete_invalidates(self):
+        webhook_db._PATH_CACHE["gh"] = (0.0, None)
+        cursor = MagicMock(rowcount=1)
+        with _fake_db(cursor):
+            assert webhook_db.delete_webhook("id") is True
+        assert webhook_db._PATH_CACHE == {}
+
+
+class TestLookupBySuffixes:
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self):
+        with patch.object(webhook_db, "_PATH_CACHE", {}):
+            yield
+
+    def test_one_prepared_query_keyed_by_suffix(self):
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [
+            {"path_suffix": "a", "name": "A"},
+            {"path_suffix": "b", "name": "B"},
+        ]
+        with (
+            _fake_db(cursor),
+            patch.object(webhook_db, "execute_prepared") as prepared,
+        ):
+            found = webhook_db.get_webhooks_by_suffixes(["a", "b", "a", "missing"])
+            again = webhook_db.get_webhooks_by_suffixes(["a", "missing"])
+        prepared.assert_called_once()
+        name, sql, params = prepared.call_args.args[1:]
+        assert "ANY($1::text[])" in sql
+        assert params[0] == ["a", "b", "missing"]
+        assert set(found) == {"a", "b"}
+        assert set(again) == {"a"}
+
+    def test_cached_suffixes_skip_db(self):
+        webhook_db._PATH_CACHE["a"] = (time.monotonic(), {"path_suffix": "a"})
+        with patch.object(
+            webhook_db, "get_db_connection", side_effect=AssertionError("no DB")
+        ):
+            assert webhook_db.get_webhooks_by_suffixes([]) == {}
+            assert webhook_db.get_webhooks_by_suffixes(["a"]) == {
+                "a": {"path_suffix": "a"}
+            }
+
+    def test_single_lookup_uses_batched_helper(self):
+        with patch.object(
+            webhook_db, "get_webhooks_by_suffixes", return_value={"a": {"name": "A"}}
+        ) as batched:
+            assert webhook_db.get_webhook_by_path("a") == {"name": "A"}
+            assert webhook_db.get_webhook_by_path("zz") is None
+        assert batched.call_count == 2
+
+
+class TestListCache:
+    def _db(self, rows):
+        return _fake_db(MagicMock(**{"fetchone.return_value": (rows,)}))
+
+    def test_served_from_cache_until_version_bump(self):
+        with (
+            patch.object(webhook_db, "_list_cache", {}),
+            self._db([{"name": "A"}]),
+            patch.object(webhook_db, "execute_prepared") as prepared,
+        ):
+            first = webhook_db.list_webhooks()
+            first[0]["name"] = "mutated"
+            assert webhook_db.list_webhooks() == [{"name": "A"}]
+            assert prepared.call_count == 1
+            webhook_db.bump_version()
+            webhook_db.list_webhooks()
+            assert prepared.call_count == 2
+
+    def test_enabled_only_cached_separately(self):
+        with (
+            patch.object(webhook_db, "_list_cache", {}),
+            self._db([]),
+            patch.object(webhook_db, "execute_prepared") as prepared,
+        ):
+            webhook_db.list_webhooks()
+            webhook_db.list_webhooks(enabled_only=True)
+        assert [c.args[1] for c in prepared.call_args_list] == [
+            "webhooks_list_all",
+            "webhooks_list_enabled",
+        ]
+
+    def test_delete_bumps_version_only_when_row_deleted(self):
+        before = webhook_db.get_version()
+        with patch.object(webhook_db, "execute_prepared") as prepared:
+            for rowcount in (0, 1):
+                with _fake_db(MagicMock(rowcount=rowcount)):
+                    webhook_db.delete_webhook("w")
+        assert webhook_db.get_version() == before + 1
+        assert prepared.call_args.args[1:] == (
+            "webhooks_delete",
+            "DELETE FROM webhook_definitions WHERE webhook_id = $1",
+            ("w",),
+        )
+
+
+class TestBulkCreate:
+    def test_one_insert_returns_input_order(self):
+        returned = [
+            {"webhook_id": "2", "path_suffix": "b"},
+            {"webhook_id": "1", "path_suffix": "a"},
+        ]
+        items = [
+            {"name": "A", "path_suffix": "a", "prompt_template": "{{x}}"},
+            {"name": "B", "path_suffix": "b", "prompt_template": "y", "secret": "s"},
+        ]
+        before = webhook_db.get_version()
+        with (
+            _fake_db(MagicMock()) as conn,
+            patch("psycopg2.extras.execute_values", return_value=returned) as ev,
+        ):
+            rows = webhook_db.bulk_create_webhooks(items)
+        ev.assert_called_once()
+        assert ev.call_args.args[2] == [
+            ("A", "a", "{{x}}", None, None),
+            ("B", "b", "y", "s", None),
+        ]
+        assert ev.call_args.kwargs["fetch"] is True
+        assert [r["webhook_id"] for r in rows] == ["1", "2"]
+        assert webhook_db.get_version() == before + 1
+        conn.commit.assert_called_once()
+
+    def test_empty_is_noop(self):
+        with patch.object(
+            webhook_db, "get_db_connection", side_effect=AssertionError("no DB")
+        ):
+            assert webhook_db.bulk_create_webhooks([]) == []
+
+
+class TestCreateWebhooksTool:
+    def test_returns_ids_and_urls(self):
+        from radbot.tools.webhooks import webhook_tools
+
+        with patch.object(
+            webhook_db,
+            "bulk_create_webhooks",
+            return_value=[{"webhook_id": "w1", "name": "A", "path_suffix": "a"}],
+        ) as bulk:
+            result = webhook_tools.create_webhooks(
+                [{"name": "A", "path_suffix": "a", "prompt_template": "t"}]
+            )
+        assert result == {
+            "status": "success",
+            "webhooks": [
+                {
+                    "webhook_id": "w1",
+                    "name": "A",
+                    "trigger_url": "/api/webhooks/trigger/a",
+                }
+            ],
+        }
+        assert bulk.call_args.args[0][0]["secret"] is None
+
+    def test_validation_rejects_before_db(self):
+        from radbot.tools.webhooks import webhook_tools
+
+        with patch.object(
+            webhook_db, "bulk_create_webhooks", side_effect=AssertionError("no DB")
+        ):
+            result = webhook_tools.create_webhooks(
+                [
+                    {"name": "A", "path_suffix": "a", "prompt_template": "t"},
+                    {"name": "B"},
+                ]
+            )
+            assert webhook_tools.create_webhooks([])["status"] == "error"
+        assert result["message"] == (
+            "Webhook 2 is missing path_suffix, prompt_template."
+        )
@@ -0,0 +1,110 @@
+"""Unit tests for radbot.tools.webhooks.template_renderer."""
+
+import sys
+
+import pytest
+
+from radbot.tools.webhooks.template_renderer import (
+    compile_template,
+    render_compiled,
+    render_template,
+)
+
+PAYLOAD = {
+    "repo": {"name": "radbot", "tags": ["a", "b"]},
+    "action": "push",
+}
+
+
+class TestCompileTemplate:
+    def test_splits_literals_and_paths(self):
+        assert compile_template("Repo {{ payload.repo.name }} {{action}}!") == (
+            "Repo ",
+            ("payload", "repo", "name"),
+            " ",
+            ("action",),
+            "!",
+        )
+
+    def test_path_parts_interned(self):
+        (parts,) = compile_template("{{payload.%s}}" % "".join(["re", "po"]))
+        assert all(p is sys.intern(p) for p in parts)
+
+    def test_cached_per_template(self):
+        assert compile_template("x {{a}}") is compile_template("x {{a}}")
+
+
+class TestRenderTemplate:
+    @pytest.mark.parametrize(
+        "template, expected",
+        [
+            ("Repo {{payload.repo.name}} pushed", "Repo radbot pushed"),
+            ("{{action}} to {{repo.name}}", "push to radbot"),
+            ("tag {{payload.repo.tags.1}}", "tag b"),
+            ("missing [{{payload.nope.deeper}}]", "missing []"),
+            ("bad index [{{repo.tags.9}}]", "bad index []"),
+            ("non-int index [{{repo.tags.x}}]", "non-int index []"),
+            ("into scalar [{{action.length}}]", "into scalar []"),
+            ("into str [{{action.0}}]", "into str []"),
+            ("no placeholders", "no placeholders"),
+        ],
+    )
+    def test_renders(self, template, expected):
+        assert render_template(template, PAYLOAD) == expected
+        assert render_compiled(compile_template(template), PAYLOAD) == expected
+
+    def test_none_mid_path(self):
+        assert render_template("[{{a.b}}]", {"a": None}) == "[]"
+
+    def test_whole_payload(self):
+        assert render_template("{{payload}}", {"a": 1}) == "{'a': 1}"
+
+    def test_payload_key_in_payload_wins(self):
+        payload = {"payload": {"x": "inner"}, "x": "outer"}
+        assert render_template("{{payload.x}}", payload) == "inner"
+
+
+class TestCreateWebhookCompiles:
+    def test_template_compiled_at_creation(self):
+        from unittest.mock import patch
+
+        from radbot.tools.webhooks import db as webhook_db
+
+        template = "Created {{payload.only.here}}"
+        compile_template.cache_clear()
+        with patch.object(
+            webhook_db, "get_db_connection", side_effect=RuntimeError("no DB")
+        ):
+            with pytest.raises(RuntimeError):
+                webhook_db.create_webhook("n", "p", template)
+        assert compile_template.cache_info().currsize == 1
+        compile_template(template)
+        assert compile_template.cache_info().hits == 1
+
+
+class TestListWebhooksTool:
+    def test_masks_secret_and_adds_trigger_url(self):
+        from unittest.mock import patch
+
+        from radbot.tools.webhooks import webhook_tools
+
+        rows = [
+            {"name": "A", "path_suffix": "a", "secret": "s3cret"},
+            {"name": "B", "path_suffix": "b", "secret": None},
+        ]
+        with patch.object(webhook_tools.webhook_db, "list_webhooks", return_value=rows):
+            result = webhook_tools.list_webhooks()
+        assert result["webhooks"] == [
+            {
+                "name": "A",
+                "path_suffix": "a",
+                "secret": "***",
+                "trigger_url": "/api/webhooks/trigger/a",
+            },
+            {
+                "name": "B",
+                "path_suffix": "b",
+                "secret": None,
+                "trigger_url": "/api/webhooks/trigger/b",
+            },
+        ]